@@ -1,4 +1,5 @@
 import os
+import threading
 
 from database import db
 from dotenv import load_dotenv
@@ -22,7 +23,19 @@ app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Disable modification tra
 
 # Initialize SQLAlchemy and CORS
 db.init_app(app)
-CORS(app)  # Enable CORS for all routes
+# Enable CORS for all routes, letting clients read caching, paging, async
+# receipt and idempotent replay headers
+CORS(
+    app,
+    expose_headers=[
+        "ETag",
+        "Link",
+        "X-Next-Cursor",
+        "Location",
+        "Preference-Applied",
+        "Idempotent-Replayed",
+    ],
+)
 
 # Import models after db initialization to avoid circular imports
 import models
@@ -37,6 +50,37 @@ from tournament_routes import tournament_bp
 app.register_blueprint(tournament_bp, url_prefix="/api")
 
 
+# Background work reads and writes the database, so it starts with the
+# first request instead of on import: "flask db upgrade" imports this
+# module before the migrations it applies have added the columns it uses
+from services.job_queue import job_queue
+from services.match_service import match_service
+from services.vote_buffer import vote_buffer
+from services.vote_queue import vote_queue
+
+background_lock = threading.Lock()
+background_started = False
+
+
+@app.before_request
+def start_background_work():
+    global background_started
+    if background_started:
+        return
+    with background_lock:
+        if background_started:
+            return
+        # Re-queue async match results a previous process accepted but
+        # never applied
+        vote_queue.resume(app)
+        # Re-run tournament creations a previous process accepted but never
+        # finished
+        job_queue.resume(app)
+        # Flush buffered crowd votes even when no further votes arrive
+        vote_buffer.start_background_flush(app, match_service.flush_votes)
+        background_started = True
+
+
 # Basic route to test the setup
 @app.route("/")
 def home():
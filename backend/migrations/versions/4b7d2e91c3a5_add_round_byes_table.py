@@ -0,0 +1,88 @@
+"""Add round_byes table
+
+Revision ID: 4b7d2e91c3a5
+Revises: 9fdef08dc217
+Create Date: 2026-10-17 09:12:44.318502
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7d2e91c3a5'
+down_revision = '9fdef08dc217'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    round_byes = op.create_table('round_byes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('round_number', sa.Integer(), nullable=False),
+    sa.Column('prompt_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['prompt_id'], ['prompts.id'], ),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_round_byes_tournament_round', 'round_byes', ['tournament_id', 'round_number'], unique=False)
+
+    # Backfill byes for tournaments that already have matches
+    op.bulk_insert(round_byes, _compute_existing_byes(op.get_bind()))
+
+
+def downgrade():
+    op.drop_index('ix_round_byes_tournament_round', table_name='round_byes')
+    op.drop_table('round_byes')
+
+
+def _compute_existing_byes(connection):
+    """Replay every existing bracket round by round to recover its byes"""
+    tournaments = sa.table('tournaments', sa.column('id'), sa.column('input_question_id'))
+    prompts = sa.table('prompts', sa.column('id'), sa.column('input_question_id'))
+    matches = sa.table('matches', sa.column('tournament_id'), sa.column('round_number'),
+                       sa.column('prompt_1_id'), sa.column('prompt_2_id'), sa.column('winner_id'))
+
+    prompts_by_question = {}
+    for prompt_id, question_id in connection.execute(
+        sa.select(prompts.c.id, prompts.c.input_question_id)
+    ):
+        prompts_by_question.setdefault(question_id, set()).add(prompt_id)
+
+    matches_by_tournament = {}
+    for row in connection.execute(sa.select(matches)):
+        rounds = matches_by_tournament.setdefault(row.tournament_id, {})
+        rounds.setdefault(row.round_number, []).append(row)
+
+    now = datetime.now(timezone.utc)
+    rows = []
+    for tournament_id, question_id in connection.execute(
+        sa.select(tournaments.c.id, tournaments.c.input_question_id)
+    ):
+        rounds = matches_by_tournament.get(tournament_id, {})
+        active = set(prompts_by_question.get(question_id, ()))
+        for round_number in sorted(rounds):
+            participating = set()
+            winners = set()
+            for match in rounds[round_number]:
+                participating.update((match.prompt_1_id, match.prompt_2_id))
+                if match.winner_id:
+                    winners.add(match.winner_id)
+
+            byes = active - participating
+            rows.extend(
+                {
+                    'tournament_id': tournament_id,
+                    'round_number': round_number,
+                    'prompt_id': prompt_id,
+                    'created_at': now,
+                }
+                for prompt_id in sorted(byes)
+            )
+            active = winners | byes
+
+    return rows
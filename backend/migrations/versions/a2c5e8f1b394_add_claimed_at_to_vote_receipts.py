@@ -0,0 +1,26 @@
+"""Add claimed_at to vote_receipts
+
+Revision ID: a2c5e8f1b394
+Revises: f1a6d3b8c427
+Create Date: 2026-10-18 09:12:40.551832
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2c5e8f1b394'
+down_revision = 'f1a6d3b8c427'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('vote_receipts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('vote_receipts', schema=None) as batch_op:
+        batch_op.drop_column('claimed_at')
@@ -0,0 +1,56 @@
+"""Add tournament_rounds table
+
+Revision ID: a4c7e1f95d38
+Revises: f3b8d2a6c715
+Create Date: 2026-10-17 15:08:12.774930
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c7e1f95d38'
+down_revision = 'f3b8d2a6c715'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tournament_rounds = op.create_table('tournament_rounds',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('round_number', sa.Integer(), nullable=False),
+    sa.Column('total_matches', sa.Integer(), nullable=False),
+    sa.Column('pending_matches', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tournament_id', 'round_number', name='uq_tournament_rounds_round')
+    )
+
+    # Backfill one row per existing round from its matches
+    matches = sa.table('matches', sa.column('tournament_id'), sa.column('round_number'),
+                       sa.column('status'))
+    now = datetime.now(timezone.utc)
+    op.bulk_insert(tournament_rounds, [
+        {
+            'tournament_id': row.tournament_id,
+            'round_number': row.round_number,
+            'total_matches': row.total_matches,
+            'pending_matches': row.pending_matches,
+            'created_at': now,
+        }
+        for row in op.get_bind().execute(
+            sa.select(matches.c.tournament_id, matches.c.round_number,
+                      sa.func.count().label('total_matches'),
+                      sa.func.count().filter(matches.c.status == 'pending').label('pending_matches'))
+            .group_by(matches.c.tournament_id, matches.c.round_number)
+        )
+    ])
+
+
+def downgrade():
+    op.drop_table('tournament_rounds')
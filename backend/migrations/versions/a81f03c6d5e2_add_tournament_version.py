@@ -0,0 +1,26 @@
+"""Add tournament version counter
+
+Revision ID: a81f03c6d5e2
+Revises: 4b7d2e91c3a5
+Create Date: 2026-10-17 10:03:27.904415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a81f03c6d5e2'
+down_revision = '4b7d2e91c3a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,28 @@
+"""Add claimed_at and worker_id to creation_jobs
+
+Revision ID: b7d4f2a9c615
+Revises: a2c5e8f1b394
+Create Date: 2026-10-18 10:03:17.284519
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4f2a9c615'
+down_revision = 'a2c5e8f1b394'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('creation_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('claimed_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('worker_id', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('creation_jobs', schema=None) as batch_op:
+        batch_op.drop_column('worker_id')
+        batch_op.drop_column('claimed_at')
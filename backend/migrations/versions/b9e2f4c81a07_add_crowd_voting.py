@@ -0,0 +1,38 @@
+"""Add crowd voting settings and match vote tallies
+
+Revision ID: b9e2f4c81a07
+Revises: a4c7e1f95d38
+Create Date: 2026-10-17 16:11:47.920163
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e2f4c81a07'
+down_revision = 'a4c7e1f95d38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('voting_mode', sa.String(length=20), server_default='single', nullable=False))
+        batch_op.add_column(sa.Column('vote_quorum', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('vote_margin', sa.Integer(), nullable=True))
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('prompt_1_votes', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('prompt_2_votes', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.drop_column('prompt_2_votes')
+        batch_op.drop_column('prompt_1_votes')
+
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.drop_column('vote_margin')
+        batch_op.drop_column('vote_quorum')
+        batch_op.drop_column('voting_mode')
@@ -0,0 +1,40 @@
+"""Add vote_receipts table
+
+Revision ID: c3d9a7b5e214
+Revises: b9e2f4c81a07
+Create Date: 2026-10-17 17:04:29.118406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d9a7b5e214'
+down_revision = 'b9e2f4c81a07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('vote_receipts',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('match_id', sa.Integer(), nullable=False),
+    sa.Column('winner_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['match_id'], ['matches.id'], ),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+    sa.ForeignKeyConstraint(['winner_id'], ['prompts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_vote_receipts_status', 'vote_receipts', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_vote_receipts_status', table_name='vote_receipts')
+    op.drop_table('vote_receipts')
@@ -0,0 +1,35 @@
+"""Add tournament_changes table
+
+Revision ID: c5e9a4b27f10
+Revises: a81f03c6d5e2
+Create Date: 2026-10-17 11:26:51.472093
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e9a4b27f10'
+down_revision = 'a81f03c6d5e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tournament_changes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('change_type', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tournament_changes_tournament_version', 'tournament_changes', ['tournament_id', 'version'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tournament_changes_tournament_version', table_name='tournament_changes')
+    op.drop_table('tournament_changes')
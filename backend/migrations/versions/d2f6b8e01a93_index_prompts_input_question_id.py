@@ -0,0 +1,26 @@
+"""Index prompts.input_question_id
+
+Revision ID: d2f6b8e01a93
+Revises: c5e9a4b27f10
+Create Date: 2026-10-17 12:14:08.663120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2f6b8e01a93'
+down_revision = 'c5e9a4b27f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('prompts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_prompts_input_question_id'), ['input_question_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('prompts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_prompts_input_question_id'))
@@ -0,0 +1,26 @@
+"""Add claimed_at to idempotency_keys
+
+Revision ID: d5f1b7c3e842
+Revises: c8e3a5f7d210
+Create Date: 2026-10-18 14:08:33.402716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5f1b7c3e842'
+down_revision = 'c8e3a5f7d210'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('claimed_at', sa.Float(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('idempotency_keys', schema=None) as batch_op:
+        batch_op.drop_column('claimed_at')
@@ -0,0 +1,48 @@
+"""Add bracket position and parent pointers to matches
+
+Revision ID: d8a1f6c3e920
+Revises: c3d9a7b5e214
+Create Date: 2026-10-17 19:02:13.518340
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8a1f6c3e920'
+down_revision = 'c3d9a7b5e214'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('bracket_position', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('next_match_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('next_slot', sa.Integer(), nullable=True))
+        batch_op.alter_column('prompt_1_id',
+               existing_type=sa.INTEGER(),
+               nullable=True)
+        batch_op.alter_column('prompt_2_id',
+               existing_type=sa.INTEGER(),
+               nullable=True)
+        batch_op.create_foreign_key('fk_matches_next_match_id_matches', 'matches', ['next_match_id'], ['id'])
+
+
+def downgrade():
+    # Later rounds of a laid-out bracket have no participants yet and cannot
+    # be kept once both prompt columns are required again
+    op.execute('DELETE FROM matches WHERE prompt_1_id IS NULL OR prompt_2_id IS NULL')
+
+    with op.batch_alter_table('matches', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_matches_next_match_id_matches', type_='foreignkey')
+        batch_op.alter_column('prompt_2_id',
+               existing_type=sa.INTEGER(),
+               nullable=False)
+        batch_op.alter_column('prompt_1_id',
+               existing_type=sa.INTEGER(),
+               nullable=False)
+        batch_op.drop_column('next_slot')
+        batch_op.drop_column('next_match_id')
+        batch_op.drop_column('bracket_position')
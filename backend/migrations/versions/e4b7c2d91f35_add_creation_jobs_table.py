@@ -0,0 +1,37 @@
+"""Add creation_jobs table
+
+Revision ID: e4b7c2d91f35
+Revises: d8a1f6c3e920
+Create Date: 2026-10-17 19:42:11.630518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c2d91f35'
+down_revision = 'd8a1f6c3e920'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('creation_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=True),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_creation_jobs_status', 'creation_jobs', ['status'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_creation_jobs_status', table_name='creation_jobs')
+    op.drop_table('creation_jobs')
@@ -0,0 +1,72 @@
+"""Add tournament progress counters
+
+Revision ID: e7a3c9d14b62
+Revises: d2f6b8e01a93
+Create Date: 2026-10-17 13:02:51.207364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a3c9d14b62'
+down_revision = 'd2f6b8e01a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_matches', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('completed_matches', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('current_round', sa.Integer(), server_default='1', nullable=False))
+        batch_op.add_column(sa.Column('winner_prompt_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key('fk_tournaments_winner_prompt_id_prompts', 'prompts', ['winner_prompt_id'], ['id'])
+
+    # Backfill the counters from the matches table
+    tournaments = sa.table('tournaments', sa.column('id'), sa.column('status'),
+                           sa.column('total_matches'), sa.column('completed_matches'),
+                           sa.column('current_round'), sa.column('winner_prompt_id'))
+    matches = sa.table('matches', sa.column('tournament_id'), sa.column('round_number'),
+                       sa.column('winner_id'), sa.column('status'))
+
+    def for_tournament(query):
+        return query.where(matches.c.tournament_id == tournaments.c.id).scalar_subquery()
+
+    op.execute(
+        tournaments.update().values(
+            total_matches=for_tournament(sa.select(sa.func.count())),
+            completed_matches=for_tournament(
+                sa.select(sa.func.count()).where(matches.c.status == 'completed')
+            ),
+            current_round=sa.func.coalesce(
+                for_tournament(
+                    sa.select(sa.func.min(matches.c.round_number)).where(matches.c.status == 'pending')
+                ),
+                for_tournament(sa.select(sa.func.max(matches.c.round_number))),
+                1,
+            ),
+        )
+    )
+    op.execute(
+        tournaments.update()
+        .where(tournaments.c.status == 'completed')
+        .values(
+            winner_prompt_id=for_tournament(
+                sa.select(matches.c.winner_id)
+                .where(matches.c.status == 'completed')
+                .order_by(matches.c.round_number.desc())
+                .limit(1)
+            )
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('tournaments', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_tournaments_winner_prompt_id_prompts', type_='foreignkey')
+        batch_op.drop_column('winner_prompt_id')
+        batch_op.drop_column('current_round')
+        batch_op.drop_column('completed_matches')
+        batch_op.drop_column('total_matches')
@@ -0,0 +1,47 @@
+"""Add normalized_text to input_questions
+
+Revision ID: f1a6d3b8c427
+Revises: e4b7c2d91f35
+Create Date: 2026-10-17 21:08:37.204915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a6d3b8c427'
+down_revision = 'e4b7c2d91f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('input_questions', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('normalized_text', sa.String(length=255), nullable=True))
+
+    # Backfill with the same normalization as models.normalize_question_text
+    input_questions = sa.table('input_questions', sa.column('id'), sa.column('question_text'),
+                               sa.column('normalized_text'))
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(input_questions.c.id, input_questions.c.question_text)).all()
+    if rows:
+        connection.execute(
+            input_questions.update()
+            .where(input_questions.c.id == sa.bindparam('question_id'))
+            .values(normalized_text=sa.bindparam('normalized')),
+            [
+                {'question_id': row.id, 'normalized': ' '.join(row.question_text.lower().split())}
+                for row in rows
+            ],
+        )
+
+    with op.batch_alter_table('input_questions', schema=None) as batch_op:
+        batch_op.alter_column('normalized_text', existing_type=sa.String(length=255), nullable=False)
+        batch_op.create_index(batch_op.f('ix_input_questions_normalized_text'), ['normalized_text'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('input_questions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_input_questions_normalized_text'))
+        batch_op.drop_column('normalized_text')
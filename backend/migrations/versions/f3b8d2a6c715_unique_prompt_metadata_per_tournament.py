@@ -0,0 +1,93 @@
+"""Unique prompt_metadata per prompt and tournament
+
+Revision ID: f3b8d2a6c715
+Revises: e7a3c9d14b62
+Create Date: 2026-10-17 14:21:36.508817
+
+"""
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d2a6c715'
+down_revision = 'e7a3c9d14b62'
+branch_labels = None
+depends_on = None
+
+
+prompt_metadata = sa.table('prompt_metadata', sa.column('id'), sa.column('prompt_id'),
+                           sa.column('tournament_id'), sa.column('win_count'),
+                           sa.column('loss_count'), sa.column('created_at'))
+
+
+def upgrade():
+    connection = op.get_bind()
+    _merge_duplicate_rows(connection)
+    op.bulk_insert(prompt_metadata, _compute_missing_rows(connection))
+
+    with op.batch_alter_table('prompt_metadata', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_prompt_metadata_prompt_tournament', ['prompt_id', 'tournament_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('prompt_metadata', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_prompt_metadata_prompt_tournament', type_='unique')
+
+
+def _merge_duplicate_rows(connection):
+    """Fold duplicate rows into the oldest one, summing their counters"""
+    duplicates = connection.execute(
+        sa.select(prompt_metadata.c.prompt_id, prompt_metadata.c.tournament_id,
+                  sa.func.min(prompt_metadata.c.id).label('keep_id'),
+                  sa.func.sum(sa.func.coalesce(prompt_metadata.c.win_count, 0)).label('wins'),
+                  sa.func.sum(sa.func.coalesce(prompt_metadata.c.loss_count, 0)).label('losses'))
+        .group_by(prompt_metadata.c.prompt_id, prompt_metadata.c.tournament_id)
+        .having(sa.func.count() > 1)
+    ).all()
+
+    for row in duplicates:
+        connection.execute(
+            prompt_metadata.update()
+            .where(prompt_metadata.c.id == row.keep_id)
+            .values(win_count=row.wins, loss_count=row.losses)
+        )
+        connection.execute(
+            prompt_metadata.delete().where(
+                prompt_metadata.c.prompt_id == row.prompt_id,
+                prompt_metadata.c.tournament_id == row.tournament_id,
+                prompt_metadata.c.id != row.keep_id,
+            )
+        )
+
+
+def _compute_missing_rows(connection):
+    """Zeroed rows for prompts of started tournaments that have none yet"""
+    tournaments = sa.table('tournaments', sa.column('id'), sa.column('input_question_id'))
+    prompts = sa.table('prompts', sa.column('id'), sa.column('input_question_id'))
+    matches = sa.table('matches', sa.column('tournament_id'))
+
+    existing = sa.select(prompt_metadata.c.id).where(
+        prompt_metadata.c.prompt_id == prompts.c.id,
+        prompt_metadata.c.tournament_id == tournaments.c.id,
+    )
+    started = sa.select(matches.c.tournament_id).where(matches.c.tournament_id == tournaments.c.id)
+
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            'prompt_id': prompt_id,
+            'tournament_id': tournament_id,
+            'win_count': 0,
+            'loss_count': 0,
+            'created_at': now,
+        }
+        for tournament_id, prompt_id in connection.execute(
+            sa.select(tournaments.c.id, prompts.c.id)
+            .join(prompts, prompts.c.input_question_id == tournaments.c.input_question_id)
+            .where(started.exists(), ~existing.exists())
+            .order_by(tournaments.c.id, prompts.c.id)
+        )
+    ]
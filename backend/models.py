@@ -3,12 +3,27 @@ from datetime import datetime, timezone
 from database import db
 
 
+def normalize_question_text(question_text):
+    """Lowercase a question and collapse its whitespace"""
+    return " ".join(question_text.lower().split())
+
+
 # InputQuestion model
 class InputQuestion(db.Model):
     __tablename__ = "input_questions"
 
     id = db.Column(db.Integer, primary_key=True)
     question_text = db.Column(db.String(255), nullable=False)
+    # Questions with the same normalized text share a pool of prompts
+    # (see PromptService.get_pooled_prompts)
+    normalized_text = db.Column(
+        db.String(255),
+        nullable=False,
+        index=True,
+        default=lambda context: normalize_question_text(
+            context.get_current_parameters()["question_text"]
+        ),
+    )
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
 
     prompts = db.relationship("Prompt", backref="input_question", lazy=True)
@@ -21,7 +36,7 @@ class Prompt(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     input_question_id = db.Column(
-        db.Integer, db.ForeignKey("input_questions.id"), nullable=False
+        db.Integer, db.ForeignKey("input_questions.id"), nullable=False, index=True
     )
     prompt_text = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
@@ -38,9 +53,32 @@ class Tournament(db.Model):
         db.Integer, db.ForeignKey("input_questions.id"), nullable=False
     )
     status = db.Column(db.String(50), default="active")
+    # Incremented on every write that changes the bracket; keys cached snapshots
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    # Progress counters, kept in step with the matches table on every write
+    total_matches = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    completed_matches = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    current_round = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    winner_prompt_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=True)
+    # "single": one result decides a match; "crowd": tallied votes close it
+    voting_mode = db.Column(
+        db.String(20), nullable=False, default="single", server_default="single"
+    )
+    vote_quorum = db.Column(db.Integer, nullable=True)
+    vote_margin = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
 
+    winner_prompt = db.relationship("Prompt", foreign_keys=[winner_prompt_id])
     rounds = db.relationship("Match", backref="tournament", lazy=True)
+    round_records = db.relationship("TournamentRound", backref="tournament", lazy=True)
+    byes = db.relationship("RoundBye", backref="tournament", lazy=True)
+    changes = db.relationship("TournamentChange", backref="tournament", lazy=True)
+
+    def bump_version(self):
+        """Mark the tournament as changed so cached snapshots are invalidated"""
+        self.version = (self.version or 0) + 1
 
 
 # Match model
@@ -51,22 +89,166 @@ class Match(db.Model):
     tournament_id = db.Column(
         db.Integer, db.ForeignKey("tournaments.id"), nullable=False
     )
-    prompt_1_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=False)
-    prompt_2_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=False)
+    # Empty until the feeding match is decided (status "waiting")
+    prompt_1_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=True)
+    prompt_2_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=True)
     round_number = db.Column(db.Integer, nullable=False)
     winner_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=True)
+    # "waiting" (participants not known yet), "pending" or "completed"
     status = db.Column(db.String(50), default="pending")
+    # Place in the bracket: slot within the round, and the match (and which
+    # of its two prompt slots) the winner moves on to; empty for the final
+    # and for brackets started before the full bracket was laid out
+    bracket_position = db.Column(db.Integer, nullable=True)
+    next_match_id = db.Column(db.Integer, db.ForeignKey("matches.id"), nullable=True)
+    next_slot = db.Column(db.Integer, nullable=True)
+    # Crowd voting tallies, flushed from the in-memory vote buffer
+    prompt_1_votes = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    prompt_2_votes = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
     prompt_1 = db.relationship("Prompt", foreign_keys=[prompt_1_id])
     prompt_2 = db.relationship("Prompt", foreign_keys=[prompt_2_id])
     winner = db.relationship("Prompt", foreign_keys=[winner_id])
+    next_match = db.relationship("Match", remote_side=[id], backref="previous_matches")
+
+
+# TournamentRound model (one row per round, tracks how many matches are left)
+class TournamentRound(db.Model):
+    __tablename__ = "tournament_rounds"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "tournament_id", "round_number", name="uq_tournament_rounds_round"
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), nullable=False
+    )
+    round_number = db.Column(db.Integer, nullable=False)
+    total_matches = db.Column(db.Integer, nullable=False)
+    # Decremented by each stored result; the round is complete at zero
+    pending_matches = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+# RoundBye model (prompts that skip a round, recorded when the round is created)
+class RoundBye(db.Model):
+    __tablename__ = "round_byes"
+    __table_args__ = (
+        db.Index("ix_round_byes_tournament_round", "tournament_id", "round_number"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), nullable=False
+    )
+    round_number = db.Column(db.Integer, nullable=False)
+    prompt_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    prompt = db.relationship("Prompt")
+
+
+# TournamentChange model (one row per version bump, for incremental catch-up)
+class TournamentChange(db.Model):
+    __tablename__ = "tournament_changes"
+    __table_args__ = (
+        db.Index(
+            "ix_tournament_changes_tournament_version", "tournament_id", "version"
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), nullable=False
+    )
+    version = db.Column(db.Integer, nullable=False)
+    change_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+# VoteReceipt model (a match result queued for a background worker)
+class VoteReceipt(db.Model):
+    __tablename__ = "vote_receipts"
+    __table_args__ = (db.Index("ix_vote_receipts_status", "status"),)
+
+    id = db.Column(db.String(32), primary_key=True)
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), nullable=False
+    )
+    match_id = db.Column(db.Integer, db.ForeignKey("matches.id"), nullable=False)
+    winner_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=False)
+    # "queued", "processing" once a worker claims it, then "applied" or
+    # "rejected"
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    error = db.Column(db.String(255), nullable=True)
+    result = db.Column(db.JSON, nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    processed_at = db.Column(db.DateTime, nullable=True)
+
+    match = db.relationship("Match")
+
+
+# CreationJob model (a tournament creation run by a background worker)
+class CreationJob(db.Model):
+    __tablename__ = "creation_jobs"
+    __table_args__ = (db.Index("ix_creation_jobs_status", "status"),)
+
+    id = db.Column(db.String(32), primary_key=True)
+    # Request body handed to TournamentService.create_tournament
+    payload = db.Column(db.JSON, nullable=False)
+    # "queued", "running", then "completed" or "failed"
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    # Lease on a running job: when and by which worker process it was claimed
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    worker_id = db.Column(db.String(64), nullable=True)
+    tournament_id = db.Column(
+        db.Integer, db.ForeignKey("tournaments.id"), nullable=True
+    )
+    error = db.Column(db.String(255), nullable=True)
+    result = db.Column(db.JSON, nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    processed_at = db.Column(db.DateTime, nullable=True)
+
+
+# IdempotencyKey model (a request sent with an Idempotency-Key header)
+class IdempotencyKey(db.Model):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (db.Index("ix_idempotency_keys_expires_at", "expires_at"),)
+
+    idempotency_key = db.Column(db.String(255), primary_key=True)
+    method = db.Column(db.String(10), primary_key=True)
+    path = db.Column(db.String(255), primary_key=True)
+    # Digest of the request body, to reject the key reused for another body
+    fingerprint = db.Column(db.LargeBinary(16), nullable=False)
+    # The response to replay; status_code is unset while the request runs
+    status_code = db.Column(db.Integer, nullable=True)
+    headers = db.Column(db.JSON, nullable=True)
+    body = db.Column(db.LargeBinary, nullable=True)
+    # Unix time the running request claimed the key; a claim older than the
+    # lease belongs to a worker that died and may be taken over
+    claimed_at = db.Column(db.Float, nullable=True)
+    # Unix time after which the key may be used again
+    expires_at = db.Column(db.Float, nullable=False)
 
 
 # PromptMetaData model
 class PromptMetaData(db.Model):
     __tablename__ = "prompt_metadata"
+    __table_args__ = (
+        db.UniqueConstraint(
+            "prompt_id", "tournament_id", name="uq_prompt_metadata_prompt_tournament"
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     prompt_id = db.Column(db.Integer, db.ForeignKey("prompts.id"), nullable=False)
@@ -0,0 +1,107 @@
+from database import db
+from flask import abort
+from models import Tournament, TournamentChange
+
+
+class ChangeLogService:
+    """Service for the per-tournament change log used for incremental catch-up"""
+
+    def record(self, tournament, change_type, data):
+        """
+        Add a change for the tournament's current version to the session
+
+        Call after Tournament.bump_version() and before committing, so the
+        change is written in the same transaction as the state it describes.
+
+        Args:
+            tournament (Tournament): Tournament whose version was just bumped
+            change_type (str): "bracket_created", "round_created",
+                "match_completed" or "tournament_completed"
+            data (dict): JSON-serializable change payload
+        """
+        db.session.add(
+            TournamentChange(
+                tournament_id=tournament.id,
+                version=tournament.version,
+                change_type=change_type,
+                payload=data,
+            )
+        )
+
+    def get_changes_since(self, tournament_id, since):
+        """
+        Get everything that changed in a tournament after a given version
+
+        Args:
+            tournament_id (int): ID of the tournament
+            since (int): Version the client already has
+
+        Returns:
+            dict: Completed matches, created rounds and assigned byes since
+                that version. "full_resync" is true when the log cannot cover
+                the gap and the client should reload the full status.
+        """
+        tournament = db.session.execute(
+            db.select(Tournament.version, Tournament.status).filter_by(id=tournament_id)
+        ).one_or_none()
+        if tournament is None:
+            abort(404)
+
+        result = {
+            "tournament_id": tournament_id,
+            "since": since,
+            "version": tournament.version,
+            "status": tournament.status,
+            "full_resync": False,
+            "matches": [],
+            "rounds": {},
+            "byes": {},
+            "winner": None,
+        }
+
+        if since >= tournament.version:
+            return result
+
+        changes = db.session.execute(
+            db.select(TournamentChange.change_type, TournamentChange.payload)
+            .filter(
+                TournamentChange.tournament_id == tournament_id,
+                TournamentChange.version > since,
+            )
+            .order_by(TournamentChange.version)
+        ).all()
+
+        # Every version bump logs exactly one change, so a short log means
+        # the client is older than the log (e.g. it predates the log table)
+        if len(changes) != tournament.version - since:
+            result["full_resync"] = True
+            return result
+
+        for change_type, payload in changes:
+            if change_type == "match_completed":
+                result["matches"].append(
+                    {
+                        "match_id": payload["match_id"],
+                        "round_number": payload["round_number"],
+                        "status": "completed",
+                        "winner_id": payload["winner_id"],
+                        "winner": payload["winner"],
+                        # Older log entries predate bracket slots
+                        "next_match_id": payload.get("next_match_id"),
+                        "next_slot": payload.get("next_slot"),
+                    }
+                )
+            elif change_type == "bracket_created":
+                result["rounds"].update(payload["rounds"])
+                result["byes"].update(payload["byes"])
+            elif change_type == "round_created":
+                result["rounds"][payload["round_number"]] = payload["matches"]
+                result["byes"][payload["round_number"]] = payload["byes"]
+            elif change_type == "tournament_completed":
+                result["winner"] = payload["winner"]
+
+        return result
+
+
+# Create a singleton instance for use across the application
+change_log_service = ChangeLogService()
@@ -0,0 +1,118 @@
+import json
+import queue
+import threading
+
+# Constants
+HEARTBEAT_SECONDS = 15
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class EventService:
+    """
+    In-process publish/subscribe hub for live tournament updates
+
+    Events reach subscribers connected to the same process. Each stream
+    also re-checks the tournament version on every heartbeat, so clients
+    learn about changes made by other workers within one heartbeat.
+    Events are only forwarded in version order: an event that skips a
+    version (one dropped from a full queue, or a write made by another
+    worker) is replaced by "tournament_updated" so the client resyncs
+    instead of applying it on top of a stale copy.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, tournament_id):
+        """Register a new subscriber queue for a tournament"""
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(tournament_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, tournament_id, subscriber):
+        """Remove a subscriber queue"""
+        with self._lock:
+            subscribers = self._subscribers.get(tournament_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[tournament_id]
+
+    def publish(self, tournament_id, event_type, data):
+        """
+        Send an event to every subscriber of a tournament
+
+        Slow subscribers whose queue is full miss the event; their stream
+        notices the version gap on the next event or heartbeat.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            event_type (str): Event name, e.g. "match_completed"
+            data (dict): JSON-serializable payload, including "version"
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(tournament_id, ()))
+
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait((event_type, data))
+            except queue.Full:
+                pass
+
+    def stream(self, tournament_id, get_version, heartbeat_seconds=HEARTBEAT_SECONDS):
+        """
+        Generate Server-Sent Events for a tournament
+
+        Args:
+            tournament_id (int): ID of the tournament
+            get_version (callable): Returns the tournament's current version
+            heartbeat_seconds (float): Idle time before a version check
+
+        Yields:
+            str: SSE-formatted messages
+        """
+        subscriber = self.subscribe(tournament_id)
+        try:
+            last_version = get_version()
+            yield self.format_event("connected", {"version": last_version})
+
+            while True:
+                try:
+                    event_type, data = subscriber.get(timeout=heartbeat_seconds)
+                except queue.Empty:
+                    version = get_version()
+                    if version != last_version:
+                        last_version = version
+                        yield self.format_event(
+                            "tournament_updated", {"version": version}
+                        )
+                    else:
+                        yield ": keepalive\n\n"
+                    continue
+
+                version = data.get("version")
+                if version is None:
+                    yield self.format_event(event_type, data)
+                elif version == last_version + 1:
+                    last_version = version
+                    yield self.format_event(event_type, data)
+                elif version > last_version:
+                    last_version = version
+                    yield self.format_event("tournament_updated", {"version": version})
+                # Older events are already covered by an earlier resync
+        finally:
+            self.unsubscribe(tournament_id, subscriber)
+
+    def format_event(self, event_type, data):
+        """Format a single SSE message"""
+        message = f"event: {event_type}\n"
+        if "version" in data:
+            message += f"id: {data['version']}\n"
+        return message + f"data: {json.dumps(data)}\n\n"
+
+
+# Create a singleton instance for use across the application
+event_service = EventService()
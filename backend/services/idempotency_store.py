@@ -0,0 +1,276 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from database import db
+from models import IdempotencyKey
+from sqlalchemy.exc import IntegrityError
+
+# Constants
+DEFAULT_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", 24 * 60 * 60))
+DEFAULT_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", 50000))
+# A key claimed longer ago than this, still without a response, belongs to
+# a worker that died mid-request
+DEFAULT_LEASE_SECONDS = float(os.getenv("IDEMPOTENCY_LEASE_SECONDS", 300))
+MAX_KEY_LENGTH = 255
+
+# Outcomes of IdempotencyStore.begin()
+STARTED = "started"
+REPLAY = "replay"
+IN_PROGRESS = "in_progress"
+MISMATCH = "mismatch"
+
+
+class IdempotencyStore:
+    """
+    TTL-evicted store of responses to requests sent with an Idempotency-Key
+
+    Keys are claimed and their responses stored in the idempotency_keys
+    table, so a retry is recognized by every worker process, not just the
+    one that handled the first request. Each row keeps a short digest of
+    the request body and the finished response (status, a few headers and
+    the body bytes) until it expires. A key still waiting for its response
+    after lease_seconds was left by a worker that died mid-request, and the
+    next retry takes it over instead of waiting for the key to expire.
+
+    Finished responses are also kept in an in-memory LRU of up to
+    max_entries, so a retry that reaches the same worker is replayed
+    without touching the database. A finished response never changes, so
+    the copy cannot go stale before it expires.
+
+    The table is written through connections of its own, outside the
+    request's session, so recording a key never commits route writes.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds=DEFAULT_TTL_SECONDS,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        lease_seconds=DEFAULT_LEASE_SECONDS,
+        clock=time.time,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lease_seconds = lease_seconds
+        # Returns the current Unix time; tests pass a fake one
+        self._clock = clock
+        self._responses = OrderedDict()
+        self._claims = {}
+        self._lock = threading.Lock()
+        self._replays = 0
+        self._evictions = 0
+
+    @staticmethod
+    def fingerprint(body):
+        """Return a compact digest identifying a request body"""
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def begin(self, key, fingerprint):
+        """
+        Claim a key for a new request, or find the response it already got
+
+        Args:
+            key (tuple): Scoped key (method, path, Idempotency-Key header)
+            fingerprint (bytes): Digest of the request body
+
+        Returns:
+            tuple: (outcome, response). outcome is STARTED when the caller
+            must handle the request and then call finish() or abandon(),
+            REPLAY with the stored response, IN_PROGRESS while the first
+            request is still running, or MISMATCH when the key was used for
+            a different body. response is None unless outcome is REPLAY.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is not None:
+                expires_at, stored_fingerprint, response = entry
+                if expires_at > now:
+                    self._responses.move_to_end(key)
+                    if stored_fingerprint != fingerprint:
+                        return MISMATCH, None
+                    self._replays += 1
+                    return REPLAY, response
+                del self._responses[key]
+
+        method, path, idempotency_key = key
+        expires_at = now + self.ttl_seconds
+        try:
+            with db.engine.begin() as connection:
+                evicted = connection.execute(
+                    db.delete(IdempotencyKey).filter(IdempotencyKey.expires_at <= now)
+                ).rowcount
+                connection.execute(
+                    db.insert(IdempotencyKey).values(
+                        idempotency_key=idempotency_key,
+                        method=method,
+                        path=path,
+                        fingerprint=fingerprint,
+                        claimed_at=now,
+                        expires_at=expires_at,
+                    )
+                )
+        except IntegrityError:
+            # Another request, possibly on another worker, holds the key
+            pass
+        else:
+            with self._lock:
+                self._claims[key] = (now, expires_at, fingerprint)
+                self._evictions += evicted
+            return STARTED, None
+
+        with db.engine.connect() as connection:
+            row = connection.execute(
+                db.select(
+                    IdempotencyKey.fingerprint,
+                    IdempotencyKey.status_code,
+                    IdempotencyKey.headers,
+                    IdempotencyKey.body,
+                    IdempotencyKey.claimed_at,
+                    IdempotencyKey.expires_at,
+                ).filter_by(idempotency_key=idempotency_key, method=method, path=path)
+            ).one_or_none()
+
+        # A row that vanished meanwhile was abandoned; the client can retry
+        if row is None:
+            return IN_PROGRESS, None
+        if row.fingerprint != fingerprint:
+            return MISMATCH, None
+        if row.status_code is None:
+            if self._take_over(key, fingerprint, row.claimed_at, now, expires_at):
+                return STARTED, None
+            return IN_PROGRESS, None
+
+        response = (row.status_code, row.headers, row.body)
+        with self._lock:
+            self._remember(key, row.expires_at, row.fingerprint, response)
+            self._replays += 1
+        return REPLAY, response
+
+    def finish(self, key, response):
+        """
+        Store the response for a key claimed with begin()
+
+        Args:
+            key (tuple): Scoped key
+            response (tuple): (status, headers, body) to replay
+        """
+        with self._lock:
+            claim = self._claims.pop(key, None)
+        if claim is None:
+            return
+
+        claimed_at, expires_at, fingerprint = claim
+        status, headers, body = response
+        with db.engine.begin() as connection:
+            stored = connection.execute(
+                db.update(IdempotencyKey)
+                .filter(*self._claim_filter(key, claimed_at))
+                .values(status_code=status, headers=headers, body=body)
+            ).rowcount
+
+        # Nothing is stored if a retry took the key over meanwhile
+        if stored:
+            with self._lock:
+                self._remember(key, expires_at, fingerprint, response)
+
+    def abandon(self, key):
+        """Release a claimed key without a response so a retry runs again"""
+        with self._lock:
+            claim = self._claims.pop(key, None)
+        if claim is None:
+            return
+
+        with db.engine.begin() as connection:
+            connection.execute(
+                db.delete(IdempotencyKey).filter(*self._claim_filter(key, claim[0]))
+            )
+
+    def clear(self):
+        """
+        Drop the responses and claims held in memory and reset the counters
+
+        Rows in the table are left to expire.
+        """
+        with self._lock:
+            self._responses.clear()
+            self._claims.clear()
+            self._replays = 0
+            self._evictions = 0
+
+    def stats(self):
+        """Return entry, replay and eviction counters"""
+        entries = db.session.scalar(
+            db.select(db.func.count())
+            .select_from(IdempotencyKey)
+            .filter(IdempotencyKey.expires_at > self._clock())
+        )
+        with self._lock:
+            return {
+                "entries": entries,
+                "memory_entries": len(self._responses),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "replays": self._replays,
+                "evictions": self._evictions,
+            }
+
+    def _take_over(self, key, fingerprint, claimed_at, now, expires_at):
+        """
+        Claim a key whose request never finished, if its lease has expired
+
+        Args:
+            key (tuple): Scoped key
+            fingerprint (bytes): Digest of the request body
+            claimed_at (float): When the current claim was taken
+            now (float): Current time
+            expires_at (float): Expiry of the new claim
+
+        Returns:
+            bool: True if this caller now holds the key
+        """
+        if claimed_at is not None and claimed_at > now - self.lease_seconds:
+            return False
+
+        # Only one of several concurrent retries moves the claim forward
+        with db.engine.begin() as connection:
+            taken = connection.execute(
+                db.update(IdempotencyKey)
+                .filter(*self._claim_filter(key, claimed_at))
+                .values(claimed_at=now, expires_at=expires_at)
+            ).rowcount
+        if not taken:
+            return False
+
+        with self._lock:
+            self._claims[key] = (now, expires_at, fingerprint)
+        return True
+
+    @staticmethod
+    def _claim_filter(key, claimed_at):
+        """Return the conditions matching a key while a claim still holds it"""
+        method, path, idempotency_key = key
+        return (
+            IdempotencyKey.idempotency_key == idempotency_key,
+            IdempotencyKey.method == method,
+            IdempotencyKey.path == path,
+            IdempotencyKey.status_code.is_(None),
+            (
+                IdempotencyKey.claimed_at.is_(None)
+                if claimed_at is None
+                else IdempotencyKey.claimed_at == claimed_at
+            ),
+        )
+
+    def _remember(self, key, expires_at, fingerprint, response):
+        """Put a finished response in the memory LRU (caller holds the lock)"""
+        self._responses[key] = (expires_at, fingerprint, response)
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_entries:
+            self._responses.popitem(last=False)
+
+
+# Create a singleton instance for use across the application
+idempotency_store = IdempotencyStore()
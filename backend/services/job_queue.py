@@ -0,0 +1,127 @@
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+# Constants
+DEFAULT_WORKERS = int(os.getenv("CREATION_JOB_WORKERS", 2))
+# A job claimed longer ago than this belongs to a worker that died
+DEFAULT_LEASE_SECONDS = float(os.getenv("CREATION_JOB_LEASE_SECONDS", 600))
+
+
+class JobQueue:
+    """
+    Background executor for tournament creation jobs
+
+    Creating a tournament can wait tens of seconds on AI prompt generation,
+    so async requests are persisted as CreationJob rows and run on this
+    executor instead of a request thread. Jobs are persisted, so resume()
+    can re-run the ones a stopped process never finished.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self._executor = None
+        self._outstanding = 0
+        self._condition = threading.Condition()
+
+    @property
+    def worker_id(self):
+        """Identify this worker process in the leases it takes on jobs"""
+        # Read on every claim, as worker processes may be forked after import
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def submit(self, app, job_id):
+        """
+        Run a job on the executor
+
+        Args:
+            app (Flask): Application whose context the job runs in
+            job_id (str): ID of the queued CreationJob
+        """
+        with self._condition:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="creation-job"
+                )
+            self._outstanding += 1
+        self._executor.submit(self._run, app, job_id)
+
+    def resume(self, app):
+        """
+        Re-run jobs left queued or running by a previous process
+
+        Every worker process calls this at startup, so jobs another live
+        worker is running must not be handed out again: only "running"
+        jobs whose lease is older than lease_seconds go back to "queued".
+        A job queued in two processes still runs once, because workers
+        claim jobs atomically.
+
+        Args:
+            app (Flask): Application to resume jobs for
+        """
+        from database import db
+        from models import CreationJob
+
+        with app.app_context():
+            if not db.inspect(db.engine).has_table(CreationJob.__tablename__):
+                return
+            # A job whose lease expired was cut off, and its writes rolled
+            # back with it, so it can be claimed again from the start
+            stale_before = datetime.now(timezone.utc) - timedelta(
+                seconds=self.lease_seconds
+            )
+            db.session.execute(
+                db.update(CreationJob)
+                .filter(
+                    CreationJob.status == "running",
+                    CreationJob.claimed_at < stale_before,
+                )
+                .values(status="queued", claimed_at=None, worker_id=None)
+            )
+            db.session.commit()
+            job_ids = db.session.scalars(
+                db.select(CreationJob.id)
+                .filter_by(status="queued")
+                .order_by(CreationJob.created_at, CreationJob.id)
+            ).all()
+
+        for job_id in job_ids:
+            self.submit(app, job_id)
+
+    def wait_idle(self, timeout=None):
+        """
+        Block until every submitted job has finished
+
+        Args:
+            timeout (float, optional): Seconds to wait at most
+
+        Returns:
+            bool: True if no job is outstanding
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._outstanding, timeout)
+
+    def stats(self):
+        """Return outstanding job and worker counts"""
+        with self._condition:
+            return {"outstanding_jobs": self._outstanding, "workers": self.workers}
+
+    def _run(self, app, job_id):
+        from services.tournament_service import tournament_service
+
+        try:
+            with app.app_context():
+                tournament_service.run_creation_job(job_id)
+        except Exception as e:
+            print(f"Creation job {job_id} failed: {e}")
+        finally:
+            with self._condition:
+                self._outstanding -= 1
+                self._condition.notify_all()
+
+
+# Create a singleton instance for use across the application
+job_queue = JobQueue()
@@ -1,7 +1,28 @@
 import random
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
 
 from database import db
-from models import Match, Prompt, PromptMetaData, Tournament
+from flask import abort, current_app
+from models import (
+    Match,
+    Prompt,
+    PromptMetaData,
+    RoundBye,
+    Tournament,
+    TournamentRound,
+    VoteReceipt,
+)
+from services.change_log_service import change_log_service
+from services.event_service import event_service
+from services.vote_buffer import vote_buffer
+from services.vote_queue import vote_queue
+from sqlalchemy import bindparam, case
+
+# Constants
+MAX_RESULTS_PER_BATCH = 10000
+CROWD_RESULTS_ERROR = "Matches of crowd voting tournaments are decided by votes"
 
 
 class MatchService:
@@ -11,6 +32,9 @@ class MatchService:
         """
         Store the result of a match and update metadata
 
+        Matches of crowd voting tournaments are only closed by their votes,
+        so a direct result for one is rejected.
+
         Args:
             match_id (int): ID of the match
             winner_id (int): ID of the winning prompt
@@ -18,59 +42,98 @@ class MatchService:
         Returns:
             dict: Match result data including next round information
         """
-        # Fetch the match and winner prompt
-        match = db.get_or_404(Match, match_id)
+        return self._close_match(match_id, winner_id, crowd_decided=False)
+
+    def _close_match(self, match_id, winner_id, crowd_decided):
+        """
+        Complete a match, advance its winner and create the next round
+
+        Args:
+            match_id (int): ID of the match
+            winner_id (int): ID of the winning prompt
+            crowd_decided (bool): True when flush_votes closes the match on
+                its vote tally, the only way a crowd match may close
+
+        Returns:
+            dict: Match result data including next round information
+        """
+        # Fetch the match with its tournament's voting mode, and the winner
+        row = db.session.execute(
+            db.select(Match, Tournament.voting_mode)
+            .join(Tournament, Match.tournament_id == Tournament.id)
+            .filter(Match.id == match_id)
+        ).one_or_none()
+        if row is None:
+            abort(404)
+        match, voting_mode = row
+        if voting_mode == "crowd" and not crowd_decided:
+            raise ValueError(CROWD_RESULTS_ERROR)
         winner_prompt = db.get_or_404(Prompt, winner_id)
 
         # Validate that winner is one of the match participants
+        if match.status == "waiting":
+            raise ValueError("Match is still waiting for its participants")
         if winner_id not in [match.prompt_1_id, match.prompt_2_id]:
             raise ValueError("Winner must be one of the match participants")
 
-        # Check if match is already completed
-        if match.status == "completed":
+        # Claim the match with a conditional update, so only one of several
+        # concurrent votes for it can complete it
+        claimed = db.session.execute(
+            db.update(Match)
+            .where(Match.id == match.id, Match.status == "pending")
+            .values(status="completed", winner_id=winner_prompt.id)
+        ).rowcount
+        if not claimed:
             raise ValueError("Match already completed")
 
-        # Update match status
-        match.winner_id = winner_prompt.id
-        match.status = "completed"
-
-        # Update PromptMetaData for winner
-        prompt_metadata = PromptMetaData.query.filter_by(
-            prompt_id=winner_prompt.id, tournament_id=match.tournament_id
-        ).first()
-        if not prompt_metadata:
-            prompt_metadata = PromptMetaData(
-                prompt_id=winner_prompt.id,
-                tournament_id=match.tournament_id,
-                win_count=1,
-            )
-            db.session.add(prompt_metadata)
-        else:
-            prompt_metadata.win_count += 1
-
-        # Update PromptMetaData for loser
-        loser_prompt = (
-            match.prompt_1 if winner_prompt.id != match.prompt_1.id else match.prompt_2
-        )
-        loser_metadata = PromptMetaData.query.filter_by(
-            prompt_id=loser_prompt.id, tournament_id=match.tournament_id
-        ).first()
-        if not loser_metadata:
-            loser_metadata = PromptMetaData(
-                prompt_id=loser_prompt.id,
-                tournament_id=match.tournament_id,
-                loss_count=1,
-            )
-            db.session.add(loser_metadata)
-        else:
-            loser_metadata.loss_count += 1
+        # Lock the tournament row for the rest of the vote so counters and
+        # round advancement are serialized per tournament
+        tournament = db.session.get(
+            Tournament,
+            match.tournament_id,
+            with_for_update=True,
+            populate_existing=True,
+        )
 
-        db.session.commit()
+        # Update PromptMetaData for winner and loser
+        loser_id = (
+            match.prompt_2_id
+            if winner_prompt.id == match.prompt_1_id
+            else match.prompt_1_id
+        )
+        self._increment_metadata(
+            match.tournament_id, "win_count", {winner_prompt.id: 1}
+        )
+        self._increment_metadata(match.tournament_id, "loss_count", {loser_id: 1})
+        self._advance_winners([(match, winner_prompt.id)])
+
+        tournament.completed_matches += 1
+        tournament.bump_version()
+        event_data = {
+            "version": tournament.version,
+            "match_id": match.id,
+            "round_number": match.round_number,
+            "winner_id": winner_prompt.id,
+            "winner": winner_prompt.prompt_text,
+            "next_match_id": match.next_match_id,
+            "next_slot": match.next_slot,
+        }
+        change_log_service.record(tournament, "match_completed", event_data)
+        events = [("match_completed", event_data)]
 
         # Check if round is complete and create next round if needed
-        next_round_info = self.check_and_create_next_round(
+        pending_matches = self._decrement_pending_matches(
             match.tournament_id, match.round_number
         )
+        next_round_info = self.check_and_create_next_round(
+            match.tournament_id, match.round_number, pending_matches, events
+        )
+
+        # The result, counters, next round and completion land in one commit
+        tournament_id = tournament.id
+        db.session.commit()
+        for event_type, data in events:
+            event_service.publish(tournament_id, event_type, data)
 
         return {
             "match": match,
@@ -78,27 +141,550 @@ class MatchService:
             "next_round_info": next_round_info,
         }
 
-    def check_and_create_next_round(self, tournament_id, current_round):
+    def enqueue_match_result(self, match_id, winner_id):
+        """
+        Queue a match result for a background worker and return a receipt
+
+        Only the participants are checked here; whether the match is still
+        pending is decided when the worker applies the result.
+
+        Args:
+            match_id (int): ID of the match
+            winner_id (int): ID of the winning prompt
+
+        Returns:
+            dict: Receipt data with status "queued"
+        """
+        match = db.get_or_404(Match, match_id)
+        if match.tournament.voting_mode == "crowd":
+            raise ValueError(CROWD_RESULTS_ERROR)
+        if match.status == "waiting":
+            raise ValueError("Match is still waiting for its participants")
+        if winner_id not in [match.prompt_1_id, match.prompt_2_id]:
+            raise ValueError("Winner must be one of the match participants")
+
+        receipt = VoteReceipt(
+            id=uuid.uuid4().hex,
+            tournament_id=match.tournament_id,
+            match_id=match.id,
+            winner_id=winner_id,
+            status="queued",
+        )
+        db.session.add(receipt)
+        db.session.commit()
+
+        vote_queue.enqueue(
+            current_app._get_current_object(), receipt.tournament_id, receipt.id
+        )
+        return self._serialize_receipt(receipt)
+
+    def get_vote_receipt(self, receipt_id):
+        """
+        Get the outcome of a queued match result
+
+        Args:
+            receipt_id (str): ID of the receipt
+
+        Returns:
+            dict: Receipt data; "result" is set once it has been applied
+        """
+        return self._serialize_receipt(db.get_or_404(VoteReceipt, receipt_id))
+
+    def apply_queued_results(self, tournament_id, receipt_ids):
+        """
+        Apply a batch of queued results for one tournament
+
+        Receipts are first claimed by moving them from "queued" to
+        "processing" in one conditional UPDATE, so a receipt queued in two
+        processes (e.g. by resume() in each worker) is applied only once.
+        Claimed results are checked in queue order; the valid ones are
+        stored with store_match_results in one transaction, the rest are
+        rejected. If a synchronous vote completes one of the matches in the
+        meantime, the batch falls back to storing results one by one.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            receipt_ids (list): Receipt IDs in the order they were queued
+        """
+        claimed_ids = db.session.scalars(
+            db.update(VoteReceipt)
+            .filter(VoteReceipt.id.in_(receipt_ids), VoteReceipt.status == "queued")
+            .values(status="processing", claimed_at=datetime.now(timezone.utc))
+            .returning(VoteReceipt.id)
+        ).all()
+        db.session.commit()
+        if not claimed_ids:
+            return
+
+        order = {receipt_id: index for index, receipt_id in enumerate(receipt_ids)}
+        receipts = sorted(
+            db.session.scalars(
+                db.select(VoteReceipt).filter(VoteReceipt.id.in_(claimed_ids))
+            ),
+            key=lambda receipt: order[receipt.id],
+        )
+        matches = {
+            match.id: match
+            for match in db.session.scalars(
+                db.select(Match).filter(
+                    Match.id.in_({receipt.match_id for receipt in receipts})
+                )
+            )
+        }
+
+        accepted = []
+        claimed = set()
+        for receipt in receipts:
+            match = matches[receipt.match_id]
+            if match.status != "pending" or match.id in claimed:
+                self._finish_receipt(receipt, error="Match already completed")
+            else:
+                claimed.add(match.id)
+                accepted.append(receipt)
+        db.session.commit()
+        if not accepted:
+            return
+
+        results = [
+            {"match_id": receipt.match_id, "winner_id": receipt.winner_id}
+            for receipt in accepted
+        ]
+        try:
+            summary = self.store_match_results(tournament_id, results)
+        except ValueError:
+            db.session.rollback()
+            for receipt in accepted:
+                self._apply_queued_result(receipt)
+            return
+
+        for receipt in accepted:
+            self._finish_receipt(receipt, result=summary)
+        db.session.commit()
+
+    def _apply_queued_result(self, receipt):
+        """Store one queued result on its own and record the outcome"""
+        try:
+            next_round_info = self.store_match_result(
+                receipt.match_id, receipt.winner_id
+            )["next_round_info"]
+        except ValueError as e:
+            db.session.rollback()
+            self._finish_receipt(receipt, error=str(e))
+        else:
+            self._finish_receipt(
+                receipt,
+                result={
+                    "results_stored": 1,
+                    "rounds_completed": (
+                        [receipt.match.round_number]
+                        if next_round_info["round_completed"]
+                        else []
+                    ),
+                    "next_round": next_round_info["next_round_number"],
+                    "tournament_completed": next_round_info["tournament_completed"],
+                },
+            )
+        db.session.commit()
+
+    def _finish_receipt(self, receipt, result=None, error=None):
+        """
+        Mark a claimed receipt applied (with its result) or rejected (with an
+        error). Only receipts still "processing" are changed, so an outcome
+        already recorded is never overwritten.
+        """
+        db.session.execute(
+            db.update(VoteReceipt)
+            .filter_by(id=receipt.id, status="processing")
+            .values(
+                status="rejected" if error else "applied",
+                error=error,
+                result=result,
+                processed_at=datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _serialize_receipt(self, receipt):
+        """Serialize a vote receipt"""
+        return {
+            "receipt_id": receipt.id,
+            "status": receipt.status,
+            "tournament_id": receipt.tournament_id,
+            "match_id": receipt.match_id,
+            "winner_id": receipt.winner_id,
+            "error": receipt.error,
+            "result": receipt.result,
+        }
+
+    def store_match_results(self, tournament_id, results):
+        """
+        Store many match results for one tournament in a single transaction
+
+        The whole batch is validated before anything is written, so either
+        every result is stored or none is. Each result still gets its own
+        version and change-log entry, but each affected round is checked
+        for advancement only once.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            results (list): [{"match_id": int, "winner_id": int}, ...]
+
+        Returns:
+            dict: Stored result count, new version and advancement summary
+        """
+        results = self._validate_results_payload(results)
+
+        # Lock the tournament row for the whole batch
+        tournament = db.session.get(
+            Tournament, tournament_id, with_for_update=True, populate_existing=True
+        )
+        if tournament is None:
+            abort(404)
+        if tournament.voting_mode == "crowd":
+            raise ValueError(CROWD_RESULTS_ERROR)
+
+        match_ids = [result["match_id"] for result in results]
+        matches = {
+            match.id: match
+            for match in db.session.scalars(
+                db.select(Match).filter(
+                    Match.tournament_id == tournament_id, Match.id.in_(match_ids)
+                )
+            )
+        }
+        for result in results:
+            match = matches.get(result["match_id"])
+            if match is None:
+                raise ValueError(
+                    f"Match {result['match_id']} does not belong to this tournament"
+                )
+            if match.status == "waiting":
+                raise ValueError(
+                    f"Match {match.id} is still waiting for its participants"
+                )
+            if result["winner_id"] not in (match.prompt_1_id, match.prompt_2_id):
+                raise ValueError(
+                    f"Winner of match {match.id} must be one of the match participants"
+                )
+            if match.status != "pending":
+                raise ValueError(f"Match {match.id} already completed")
+
+        # Claim every match at once; a short count means a concurrent vote won
+        match_table = Match.__table__
+        claimed = db.session.execute(
+            match_table.update()
+            .where(
+                match_table.c.id == bindparam("b_match_id"),
+                match_table.c.status == "pending",
+            )
+            .values(status="completed", winner_id=bindparam("b_winner_id")),
+            [
+                {"b_match_id": result["match_id"], "b_winner_id": result["winner_id"]}
+                for result in results
+            ],
+        ).rowcount
+        if claimed != len(results):
+            db.session.rollback()
+            raise ValueError("One or more matches were already completed")
+
+        wins = Counter()
+        losses = Counter()
+        completed_by_round = Counter()
+        for result in results:
+            match = matches[result["match_id"]]
+            winner_id = result["winner_id"]
+            wins[winner_id] += 1
+            losses[
+                (
+                    match.prompt_2_id
+                    if winner_id == match.prompt_1_id
+                    else match.prompt_1_id
+                )
+            ] += 1
+            completed_by_round[match.round_number] += 1
+        self._increment_metadata(tournament_id, "win_count", wins)
+        self._increment_metadata(tournament_id, "loss_count", losses)
+        self._advance_winners(
+            [(matches[result["match_id"]], result["winner_id"]) for result in results]
+        )
+
+        winner_texts = dict(
+            db.session.execute(
+                db.select(Prompt.id, Prompt.prompt_text).filter(Prompt.id.in_(wins))
+            ).all()
+        )
+
+        events = []
+        tournament.completed_matches += len(results)
+        for result in results:
+            match = matches[result["match_id"]]
+            tournament.bump_version()
+            event_data = {
+                "version": tournament.version,
+                "match_id": match.id,
+                "round_number": match.round_number,
+                "winner_id": result["winner_id"],
+                "winner": winner_texts[result["winner_id"]],
+                "next_match_id": match.next_match_id,
+                "next_slot": match.next_slot,
+            }
+            change_log_service.record(tournament, "match_completed", event_data)
+            events.append(("match_completed", event_data))
+
+        # Advance each affected round once, in round order
+        rounds_completed = []
+        next_round_number = None
+        tournament_completed = False
+        for round_number in sorted(completed_by_round):
+            pending_matches = self._decrement_pending_matches(
+                tournament_id, round_number, completed_by_round[round_number]
+            )
+            next_round_info = self.check_and_create_next_round(
+                tournament_id, round_number, pending_matches, events
+            )
+            if next_round_info["round_completed"]:
+                rounds_completed.append(round_number)
+            if next_round_info["next_round_number"]:
+                next_round_number = next_round_info["next_round_number"]
+            tournament_completed |= next_round_info["tournament_completed"]
+
+        version = tournament.version
+        db.session.commit()
+        for event_type, data in events:
+            event_service.publish(tournament_id, event_type, data)
+
+        return {
+            "tournament_id": tournament_id,
+            "results_stored": len(results),
+            "version": version,
+            "rounds_completed": rounds_completed,
+            "next_round": next_round_number,
+            "tournament_completed": tournament_completed,
+        }
+
+    def _validate_results_payload(self, results):
+        """
+        Check the shape of a batch of results
+
+        Args:
+            results: Parsed request body
+
+        Returns:
+            list: The results, each with integer match_id and winner_id
+        """
+        if not isinstance(results, list) or not results:
+            raise ValueError("Results must be a non-empty array")
+        if len(results) > MAX_RESULTS_PER_BATCH:
+            raise ValueError(
+                f"At most {MAX_RESULTS_PER_BATCH} results can be stored per request"
+            )
+
+        seen = set()
+        for result in results:
+            if not isinstance(result, dict) or not all(
+                isinstance(result.get(key), int) for key in ("match_id", "winner_id")
+            ):
+                raise ValueError("Each result must have integer match_id and winner_id")
+            if result["match_id"] in seen:
+                raise ValueError(f"Match {result['match_id']} appears more than once")
+            seen.add(result["match_id"])
+
+        return results
+
+    def cast_vote(self, match_id, prompt_id):
+        """
+        Buffer one crowd vote for a prompt in a match
+
+        The vote is only counted in memory; once the buffer is due, this
+        call flushes it and closes any match that reached its quorum or
+        margin.
+
+        Args:
+            match_id (int): ID of the match
+            prompt_id (int): ID of the prompt voted for
+
+        Returns:
+            dict: Acceptance data, including the matches closed by a flush
+        """
+        match = db.session.execute(
+            db.select(
+                Match.prompt_1_id,
+                Match.prompt_2_id,
+                Match.status,
+                Tournament.voting_mode,
+            )
+            .join(Tournament, Match.tournament_id == Tournament.id)
+            .filter(Match.id == match_id)
+        ).one_or_none()
+        if match is None:
+            abort(404)
+
+        if match.voting_mode != "crowd":
+            raise ValueError("Tournament does not use crowd voting")
+        if match.status == "waiting":
+            raise ValueError("Match is still waiting for its participants")
+        if match.status != "pending":
+            raise ValueError("Match already completed")
+        if prompt_id not in (match.prompt_1_id, match.prompt_2_id):
+            raise ValueError("Vote must be for one of the match participants")
+
+        slot = 0 if prompt_id == match.prompt_1_id else 1
+        closed_matches = []
+        if vote_buffer.add(match_id, slot):
+            closed_matches = self.flush_votes()
+
+        return {
+            "match_id": match_id,
+            "prompt_id": prompt_id,
+            "closed_matches": closed_matches,
+        }
+
+    def flush_votes(self):
+        """
+        Write the buffered vote tallies and close decided matches
+
+        Tallies are added with one executemany; votes for matches that
+        closed meanwhile are dropped. If the write fails, the tallies go
+        back into the buffer. Each decided match is then closed
+        through the same path as a direct result.
+
+        Returns:
+            list: IDs of the matches this flush closed
+        """
+        tallies = vote_buffer.drain()
+        if not tallies:
+            return []
+
+        match_table = Match.__table__
+        add_tallies = (
+            match_table.update()
+            .where(
+                match_table.c.id == bindparam("b_match_id"),
+                match_table.c.status == "pending",
+            )
+            .values(
+                prompt_1_votes=match_table.c.prompt_1_votes + bindparam("b_votes_1"),
+                prompt_2_votes=match_table.c.prompt_2_votes + bindparam("b_votes_2"),
+            )
+        )
+        try:
+            db.session.execute(
+                add_tallies,
+                [
+                    {
+                        "b_match_id": match_id,
+                        "b_votes_1": votes[0],
+                        "b_votes_2": votes[1],
+                    }
+                    for match_id, votes in tallies.items()
+                ],
+            )
+            db.session.commit()
+        except Exception:
+            # Keep the votes for the next flush rather than losing them
+            db.session.rollback()
+            vote_buffer.restore(tallies)
+            raise
+
+        decided = db.session.execute(
+            db.select(
+                Match.id,
+                Match.prompt_1_id,
+                Match.prompt_2_id,
+                Match.prompt_1_votes,
+                Match.prompt_2_votes,
+                Tournament.vote_quorum,
+                Tournament.vote_margin,
+            )
+            .join(Tournament, Match.tournament_id == Tournament.id)
+            .filter(Match.id.in_(tallies), Match.status == "pending")
+            .order_by(Match.id)
+        ).all()
+
+        closed_matches = []
+        for row in decided:
+            winner_id = self._crowd_winner(row)
+            if winner_id is None:
+                continue
+            try:
+                self._close_match(row.id, winner_id, crowd_decided=True)
+            except ValueError:
+                # Another worker's flush closed the match first
+                db.session.rollback()
+                continue
+            closed_matches.append(row.id)
+
+        return closed_matches
+
+    def get_vote_tally(self, match_id):
+        """
+        Get a match's crowd vote tally, including votes not yet flushed
+
+        Args:
+            match_id (int): ID of the match
+
+        Returns:
+            dict: Vote counts for both prompts and the match status
+        """
+        match = db.get_or_404(Match, match_id)
+        buffered = vote_buffer.pending(match_id)
+        return {
+            "match_id": match.id,
+            "status": match.status,
+            "prompt_1_id": match.prompt_1_id,
+            "prompt_2_id": match.prompt_2_id,
+            "prompt_1_votes": match.prompt_1_votes + buffered[0],
+            "prompt_2_votes": match.prompt_2_votes + buffered[1],
+            "buffered_votes": sum(buffered),
+        }
+
+    def _crowd_winner(self, row):
+        """
+        Decide a crowd match from its flushed tally
+
+        A match closes when the total reaches the quorum or the leader is
+        ahead by the margin. A tie never closes a match.
+
+        Args:
+            row: Match tally joined with its tournament's closing rules
+
+        Returns:
+            int: ID of the winning prompt, or None if still open
+        """
+        lead = row.prompt_1_votes - row.prompt_2_votes
+        if lead == 0:
+            return None
+
+        total = row.prompt_1_votes + row.prompt_2_votes
+        quorum_reached = row.vote_quorum is not None and total >= row.vote_quorum
+        margin_reached = row.vote_margin is not None and abs(lead) >= row.vote_margin
+        if not (quorum_reached or margin_reached):
+            return None
+
+        return row.prompt_1_id if lead > 0 else row.prompt_2_id
+
+    def check_and_create_next_round(
+        self, tournament_id, current_round, pending_matches, events
+    ):
         """
         Check if round is complete and create next round if needed
 
+        Brackets laid out in full at the start already hold every round, so
+        completing a round there only moves the tournament on to the next
+        one. Older brackets pair the round's winners into a new round here.
+        Changes are only flushed; the caller commits them together with the
+        match result and then publishes the collected events.
+
         Args:
             tournament_id (int): ID of the tournament
             current_round (int): Current round number
+            pending_matches (int): Matches still pending in the current round
+            events (list): (event_type, data) pairs to publish after commit
 
         Returns:
             dict: Information about round completion and next round creation
         """
-        # Get all matches in current round
-        current_round_matches = Match.query.filter_by(
-            tournament_id=tournament_id, round_number=current_round
-        ).all()
-
-        # Check if all matches in current round are completed
-        completed_matches = [
-            m for m in current_round_matches if m.status == "completed"
-        ]
-        round_completed = len(completed_matches) == len(current_round_matches)
+        round_completed = pending_matches == 0
 
         result = {
             "round_completed": round_completed,
@@ -112,109 +698,453 @@ class MatchService:
         if not round_completed:
             return result
 
-        # Get winners from current round
-        winners = [match.winner for match in completed_matches]
-
-        # Get all prompts that participated in this round
-        participating_prompts = set()
-        for match in current_round_matches:
-            participating_prompts.add(match.prompt_1_id)
-            participating_prompts.add(match.prompt_2_id)
-
-        # Determine active prompts for this round (prompts that could potentially participate)
-        active_prompts = self._get_active_prompts_for_round(
-            tournament_id, current_round
+        next_round_number = current_round + 1
+        next_round_exists = db.session.scalar(
+            db.select(TournamentRound.id).filter_by(
+                tournament_id=tournament_id, round_number=next_round_number
+            )
         )
-        bye_prompts = active_prompts - participating_prompts
+        if next_round_exists:
+            if self._claim_advancement(
+                tournament_id,
+                Tournament.current_round == current_round,
+                current_round=next_round_number,
+            ):
+                result["next_round_number"] = next_round_number
+            return result
+
+        # The round is only loaded once, when its last result arrives
+        winners = db.session.execute(
+            db.select(Prompt.id, Prompt.prompt_text)
+            .join(Match, Match.winner_id == Prompt.id)
+            .filter(
+                Match.tournament_id == tournament_id,
+                Match.round_number == current_round,
+            )
+            .order_by(Match.id)
+        ).all()
 
-        # Convert bye prompt IDs to prompt text for the response
-        bye_prompt_texts = []
-        for prompt_id in bye_prompts:
-            prompt = db.session.get(Prompt, prompt_id)
-            if prompt:
-                bye_prompt_texts.append(prompt.prompt_text)
+        # Prompts that had a bye this round advance alongside the winners
+        bye_prompts = db.session.execute(
+            db.select(Prompt.id, Prompt.prompt_text)
+            .join(RoundBye, RoundBye.prompt_id == Prompt.id)
+            .filter(
+                RoundBye.tournament_id == tournament_id,
+                RoundBye.round_number == current_round,
+            )
+        ).all()
 
-        result["bye_prompts"] = bye_prompt_texts
+        result["bye_prompts"] = [prompt.prompt_text for prompt in bye_prompts]
 
         # Total remaining contestants = winners from this round + bye prompts
         total_remaining = len(winners) + len(bye_prompts)
 
         # If only one contestant remains, tournament is complete
         if total_remaining == 1:
+            champion = (winners + bye_prompts)[0]
+            if not self._claim_advancement(
+                tournament_id,
+                Tournament.status != "completed",
+                status="completed",
+                winner_prompt_id=champion.id,
+            ):
+                return result
+
+            tournament = db.session.get(Tournament, tournament_id)
+            tournament.bump_version()
+            event_data = {
+                "version": tournament.version,
+                "winner_id": champion.id,
+                "winner": champion.prompt_text,
+            }
+            change_log_service.record(tournament, "tournament_completed", event_data)
+            events.append(("tournament_completed", event_data))
+
             result["tournament_completed"] = True
             return result
 
-        # Create next round matches
-        next_round_number = current_round + 1
-        matches_created = []
+        # Create next round matches, unless another vote already did
+        if not self._claim_advancement(
+            tournament_id,
+            Tournament.current_round == current_round,
+            current_round=next_round_number,
+        ):
+            return result
 
         # Combine winners from this round with bye prompts to get all advancing contestants
-        advancing_prompts = winners[:]  # Copy winners list
-
-        # Add bye prompts (those that didn't participate in this round)
-        for prompt_id in bye_prompts:
-            prompt = db.session.get(Prompt, prompt_id)
-            advancing_prompts.append(prompt)
+        advancing_prompts = winners + bye_prompts
 
         # Shuffle advancing prompts to ensure fair bye distribution across rounds
         random.shuffle(advancing_prompts)
 
-        # Create matches for pairs of advancing prompts
-        for i in range(0, len(advancing_prompts), 2):
-            if i + 1 < len(advancing_prompts):  # Ensure we have a pair
-                next_match = Match(
-                    tournament_id=tournament_id,
-                    prompt_1_id=advancing_prompts[i].id,
-                    prompt_2_id=advancing_prompts[i + 1].id,
-                    round_number=next_round_number,
+        next_matches, next_round_byes = self.create_round(
+            tournament_id, next_round_number, advancing_prompts
+        )
+
+        tournament = db.session.get(Tournament, tournament_id)
+        tournament.total_matches += len(next_matches)
+        tournament.bump_version()
+        event_data = {
+            "version": tournament.version,
+            "round_number": next_round_number,
+            "matches": next_matches,
+            "byes": next_round_byes,
+        }
+        change_log_service.record(tournament, "round_created", event_data)
+        events.append(("round_created", event_data))
+
+        result["next_round_created"] = True
+        result["next_round_number"] = next_round_number
+        result["matches_created"] = [
+            {"prompt_1": match["prompt_1"], "prompt_2": match["prompt_2"]}
+            for match in next_matches
+        ]
+
+        return result
+
+    def create_bracket(self, tournament_id, contestants):
+        """
+        Lay out every match of a single-elimination bracket
+
+        The bracket has room for the next power of two of contestants.
+        Contestants are seeded in list order and the missing seeds are
+        byes, placed in standard seeding order so each one faces a real
+        contestant and they spread evenly over the bracket. A contestant
+        with a bye goes straight into its round 2 slot; matches whose
+        participants are not known yet are "waiting". Every match points at
+        the match and slot its winner moves on to, so storing a result only
+        fills that slot.
+
+        Rounds are written final first, one bulk INSERT ... RETURNING each,
+        so every round can point at its parents' ids. Changes are only
+        flushed; the caller commits them.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            contestants (list): Rows with id and prompt_text, in seed order
+
+        Returns:
+            tuple: (round number -> serialized matches, round 1 bye texts)
+        """
+        size = 1 << (len(contestants) - 1).bit_length()
+        num_rounds = size.bit_length() - 1
+        seeds = [
+            contestants[seed - 1] if seed <= len(contestants) else None
+            for seed in self._seed_order(size)
+        ]
+
+        # (round, position) -> [prompt 1, prompt 2] for the known participants
+        slots = {}
+        round_1_positions = []
+        bye_prompts = []
+        for position in range(size // 2):
+            top, bottom = seeds[2 * position], seeds[2 * position + 1]
+            if top is not None and bottom is not None:
+                slots[(1, position)] = [top, bottom]
+                round_1_positions.append(position)
+            else:
+                bye_prompt = top if bottom is None else bottom
+                slots.setdefault((2, position // 2), [None, None])[
+                    position % 2
+                ] = bye_prompt
+                bye_prompts.append(bye_prompt)
+
+        match_ids = {}
+        rounds = {}
+        for round_number in range(num_rounds, 0, -1):
+            is_final = round_number == num_rounds
+            if round_number == 1:
+                positions = round_1_positions
+            else:
+                positions = range(size >> round_number)
+
+            rows = []
+            for position in positions:
+                prompt_1, prompt_2 = slots.get((round_number, position), (None, None))
+                rows.append(
+                    {
+                        "tournament_id": tournament_id,
+                        "round_number": round_number,
+                        "bracket_position": position,
+                        "prompt_1_id": prompt_1 and prompt_1.id,
+                        "prompt_2_id": prompt_2 and prompt_2.id,
+                        "status": "pending" if prompt_1 and prompt_2 else "waiting",
+                        "next_match_id": (
+                            None
+                            if is_final
+                            else match_ids[(round_number + 1, position // 2)]
+                        ),
+                        "next_slot": None if is_final else position % 2 + 1,
+                    }
                 )
-                db.session.add(next_match)
-                matches_created.append(
+
+            # Positions are unique within a round, so they map RETURNING
+            # rows back to their matches
+            for position, match_id in db.session.execute(
+                db.insert(Match).returning(Match.bracket_position, Match.id), rows
+            ):
+                match_ids[(round_number, position)] = match_id
+
+            rounds[round_number] = []
+            for row in rows:
+                prompt_1, prompt_2 = slots.get(
+                    (round_number, row["bracket_position"]), (None, None)
+                )
+                rounds[round_number].append(
                     {
-                        "prompt_1": advancing_prompts[i].prompt_text,
-                        "prompt_2": advancing_prompts[i + 1].prompt_text,
+                        "match_id": match_ids[(round_number, row["bracket_position"])],
+                        "prompt_1": prompt_1 and prompt_1.prompt_text,
+                        "prompt_2": prompt_2 and prompt_2.prompt_text,
+                        "prompt_1_id": row["prompt_1_id"],
+                        "prompt_2_id": row["prompt_2_id"],
+                        "status": row["status"],
+                        "winner": None,
+                        "next_match_id": row["next_match_id"],
                     }
                 )
+            db.session.add(
+                TournamentRound(
+                    tournament_id=tournament_id,
+                    round_number=round_number,
+                    total_matches=len(rows),
+                    pending_matches=len(rows),
+                )
+            )
 
-        # Commit the new matches
-        if matches_created:
-            db.session.commit()
-            result["next_round_created"] = True
-            result["next_round_number"] = next_round_number
-            result["matches_created"] = matches_created
+        if bye_prompts:
+            db.session.execute(
+                db.insert(RoundBye),
+                [
+                    {
+                        "tournament_id": tournament_id,
+                        "round_number": 1,
+                        "prompt_id": prompt.id,
+                    }
+                    for prompt in bye_prompts
+                ],
+            )
+        db.session.flush()
 
-        return result
+        return dict(sorted(rounds.items())), [
+            prompt.prompt_text for prompt in bye_prompts
+        ]
 
-    def _get_active_prompts_for_round(self, tournament_id, round_num):
-        """Get the set of prompts that are active (not eliminated) for a given round"""
-        if round_num == 1:
-            # Round 1: all tournament prompts are active
-            tournament = db.session.get(Tournament, tournament_id)
-            return set(p.id for p in tournament.input_question.prompts)
-        else:
-            # Later rounds: winners from previous round + byes from previous round
-            prev_matches = Match.query.filter_by(
-                tournament_id=tournament_id, round_number=round_num - 1
+    def _seed_order(self, size):
+        """
+        Return seeds 1..size in standard bracket order
+
+        Seed s meets seed size + 1 - s in round 1, and the top seeds can
+        only meet in the latest rounds, e.g. [1, 8, 4, 5, 2, 7, 3, 6].
+        """
+        order = [1]
+        while len(order) < size:
+            total = len(order) * 2
+            order = [s for seed in order for s in (seed, total + 1 - seed)]
+        return order
+
+    def _advance_winners(self, winners):
+        """
+        Move winners into the bracket slots their matches feed
+
+        A match becomes "pending" once both of its slots are filled. Slot
+        1 and slot 2 updates are each one executemany, so when both
+        feeders of a match are in the same batch the second update sees
+        the first.
+
+        Args:
+            winners (list): (match, winner id) pairs
+        """
+        match_table = Match.__table__
+        for slot, other_slot in ((1, 2), (2, 1)):
+            params = [
+                {"b_match_id": match.next_match_id, "b_winner_id": winner_id}
+                for match, winner_id in winners
+                if match.next_match_id is not None and match.next_slot == slot
+            ]
+            if not params:
+                continue
+            db.session.execute(
+                match_table.update()
+                .where(match_table.c.id == bindparam("b_match_id"))
+                .values(
+                    {
+                        f"prompt_{slot}_id": bindparam("b_winner_id"),
+                        "status": case(
+                            (
+                                match_table.c[f"prompt_{other_slot}_id"].is_not(None),
+                                "pending",
+                            ),
+                            else_=match_table.c.status,
+                        ),
+                    }
+                ),
+                params,
+            )
+
+    def create_round(self, tournament_id, round_number, contestants):
+        """
+        Pair contestants into the matches of a new round
+
+        Matches are written with a multi-row INSERT ... RETURNING (batched
+        by SQLAlchemy's insertmanyvalues) rather than one ORM object each,
+        so large brackets skip the unit of work. An unpaired last contestant
+        gets a bye. Changes are only flushed; the caller commits them.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            round_number (int): Number of the new round
+            contestants (list): Rows with id and prompt_text, in pairing order
+
+        Returns:
+            tuple: (serialized matches, bye prompt texts)
+        """
+        pairs = list(zip(contestants[0::2], contestants[1::2]))
+        # RETURNING rows come back unordered, so key them by prompt_1_id,
+        # which is unique within a round; asking SQLAlchemy to sort them
+        # would fall back to one INSERT per row on SQLite
+        match_ids = dict(
+            db.session.execute(
+                db.insert(Match).returning(Match.prompt_1_id, Match.id),
+                [
+                    {
+                        "tournament_id": tournament_id,
+                        "prompt_1_id": prompt_1.id,
+                        "prompt_2_id": prompt_2.id,
+                        "round_number": round_number,
+                    }
+                    for prompt_1, prompt_2 in pairs
+                ],
             ).all()
+        )
+
+        byes = []
+        if len(contestants) % 2 == 1:
+            db.session.add(
+                RoundBye(
+                    tournament_id=tournament_id,
+                    round_number=round_number,
+                    prompt_id=contestants[-1].id,
+                )
+            )
+            byes.append(contestants[-1].prompt_text)
 
-            # Get winners from previous round
-            active = set()
-            prev_participating = set()
+        db.session.add(
+            TournamentRound(
+                tournament_id=tournament_id,
+                round_number=round_number,
+                total_matches=len(pairs),
+                pending_matches=len(pairs),
+            )
+        )
+        db.session.flush()
 
-            for match in prev_matches:
-                prev_participating.add(match.prompt_1_id)
-                prev_participating.add(match.prompt_2_id)
-                if match.winner:
-                    active.add(match.winner.id)
+        matches = [
+            {
+                "match_id": match_ids[prompt_1.id],
+                "prompt_1": prompt_1.prompt_text,
+                "prompt_2": prompt_2.prompt_text,
+                "prompt_1_id": prompt_1.id,
+                "prompt_2_id": prompt_2.id,
+                "status": "pending",
+                "winner": None,
+                "next_match_id": None,
+            }
+            for prompt_1, prompt_2 in pairs
+        ]
+        return matches, byes
+
+    def _decrement_pending_matches(self, tournament_id, round_number, completed=1):
+        """
+        Atomically count down the pending matches of a round
 
-            # Get active prompts from the previous round and find byes
-            prev_active = self._get_active_prompts_for_round(
-                tournament_id, round_num - 1
+        Args:
+            tournament_id (int): ID of the tournament
+            round_number (int): Round of the completed matches
+            completed (int): Number of matches just completed in the round
+
+        Returns:
+            int: Matches still pending in the round after this result
+        """
+        return db.session.execute(
+            db.update(TournamentRound)
+            .where(
+                TournamentRound.tournament_id == tournament_id,
+                TournamentRound.round_number == round_number,
             )
-            prev_byes = prev_active - prev_participating
-            active.update(prev_byes)
+            .values(pending_matches=TournamentRound.pending_matches - completed)
+            .returning(TournamentRound.pending_matches)
+        ).scalar_one()
 
-            return active
+    def _increment_metadata(self, tournament_id, counter, amounts):
+        """
+        Atomically increment PromptMetaData counters
+
+        Rows are created when the bracket starts, so this is one blind
+        UPDATE per prompt, sent as a single executemany; the insert only
+        covers brackets started before that.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            counter (str): "win_count" or "loss_count"
+            amounts (dict): Prompt id -> amount to add
+        """
+        table = PromptMetaData.__table__
+        updated = db.session.execute(
+            table.update()
+            .where(
+                table.c.prompt_id == bindparam("b_prompt_id"),
+                table.c.tournament_id == tournament_id,
+            )
+            .values({counter: table.c[counter] + bindparam("b_amount")}),
+            [
+                {"b_prompt_id": prompt_id, "b_amount": amount}
+                for prompt_id, amount in amounts.items()
+            ],
+        ).rowcount
+        if updated == len(amounts):
+            return
+
+        existing = set(
+            db.session.scalars(
+                db.select(PromptMetaData.prompt_id).filter(
+                    PromptMetaData.tournament_id == tournament_id,
+                    PromptMetaData.prompt_id.in_(amounts),
+                )
+            )
+        )
+        for prompt_id, amount in amounts.items():
+            if prompt_id not in existing:
+                db.session.add(
+                    PromptMetaData(
+                        prompt_id=prompt_id,
+                        tournament_id=tournament_id,
+                        **{counter: amount},
+                    )
+                )
+
+    def _claim_advancement(self, tournament_id, condition, **values):
+        """
+        Advance a tournament with a conditional update
+
+        Acts as a per-tournament guard: when two votes both see a round as
+        complete, only the one whose update matches creates the next round
+        or completes the tournament.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            condition: SQL condition the tournament row must still satisfy
+            **values: Columns to set when the condition holds
+
+        Returns:
+            bool: True if this call advanced the tournament
+        """
+        return bool(
+            db.session.execute(
+                db.update(Tournament)
+                .where(Tournament.id == tournament_id, condition)
+                .values(**values)
+            ).rowcount
+        )
 
 
 # Create a singleton instance for use across the application
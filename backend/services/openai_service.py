@@ -1,6 +1,33 @@
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from openai import OpenAI
+from services.response_cache import response_cache
+
+# Constants
+# Requests for more prompts than this are split into chunks that are
+# generated concurrently
+PROMPTS_PER_REQUEST = int(os.getenv("OPENAI_PROMPTS_PER_REQUEST", 20))
+MAX_CONCURRENT_REQUESTS = int(os.getenv("OPENAI_MAX_CONCURRENT_REQUESTS", 8))
+# Completion tokens allowed per requested prompt, and the most prompts one
+# request may ask for so its completion stays well inside the model's limit
+TOKENS_PER_PROMPT = 25
+MAX_PROMPTS_PER_REQUEST = int(os.getenv("OPENAI_MAX_PROMPTS_PER_REQUEST", 80))
+# Chunked requests ask for this share more, as chunks still overlap a little
+CHUNK_OVERSHOOT = float(os.getenv("OPENAI_CHUNK_OVERSHOOT", 0.1))
+# Each chunk writes its prompts in a different style, so that concurrent
+# chunks do not come back with the same phrasings
+CHUNK_STYLES = [
+    "in a casual, conversational tone",
+    "in a formal, professional tone",
+    "as short, direct requests",
+    "with added context about why the answer is needed",
+    "as instructions addressed to an expert",
+    "as if asked by a complete beginner",
+    "asking for the answer in a specific format",
+    "from an unusual or creative angle",
+]
 
 
 class OpenAIService:
@@ -15,19 +42,30 @@ class OpenAIService:
         return self.api_key is not None and self.client is not None
 
     def test_prompt(
-        self, prompt_text, model="gpt-3.5-turbo", max_tokens=150, temperature=0.7
+        self,
+        prompt_text,
+        model="gpt-3.5-turbo",
+        max_tokens=150,
+        temperature=0.7,
+        use_cache=True,
     ):
         """
         Test a prompt with OpenAI and return the response
 
+        Responses are cached by prompt and settings, so re-testing the same
+        prompt is answered from the cache unless use_cache is False; a
+        bypassed call still refreshes the cached response.
+
         Args:
             prompt_text (str): The prompt to test
             model (str): The OpenAI model to use
             max_tokens (int): Maximum tokens in response
             temperature (float): Temperature for response generation
+            use_cache (bool): Whether a cached response may be returned
 
         Returns:
-            dict: Response data including AI response and usage statistics
+            dict: Response data including AI response, usage statistics and
+            whether it came from the cache
 
         Raises:
             Exception: If OpenAI API call fails or service is not available
@@ -55,6 +93,12 @@ class OpenAIService:
         if model not in ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"]:
             raise ValueError("model must be one of: gpt-3.5-turbo, gpt-4, gpt-4-turbo")
 
+        cache_key = response_cache.make_key(prompt_text, model, max_tokens, temperature)
+        if use_cache:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
         try:
             # Send prompt to OpenAI
             response = self.client.chat.completions.create(
@@ -72,7 +116,7 @@ class OpenAIService:
             # Extract the response
             ai_response = response.choices[0].message.content.strip()
 
-            return {
+            result = {
                 "prompt": prompt_text,
                 "response": ai_response,
                 "model": model,
@@ -89,12 +133,23 @@ class OpenAIService:
             print(f"Error testing prompt with OpenAI: {e}")
             raise Exception(f"Failed to test prompt: {str(e)}")
 
+        response_cache.put(cache_key, result, temperature)
+        return {**result, "cached": False}
+
     def generate_prompts(
         self, input_question, num_prompts_needed, existing_prompts=None
     ):
         """
         Generate additional prompts using ChatGPT API
 
+        Requests for more than PROMPTS_PER_REQUEST prompts are split into
+        chunks sent concurrently. Chunks are sized so that there are at most
+        MAX_CONCURRENT_REQUESTS of them, all sent in one wave, unless that
+        would ask a single request for more than MAX_PROMPTS_PER_REQUEST.
+        Each chunk is asked for a different style of phrasing, a few more
+        prompts than needed are requested in total, and prompts repeated
+        across chunks are dropped.
+
         Args:
             input_question (str): The base question to generate variations for
             num_prompts_needed (int): Number of prompts to generate
@@ -112,9 +167,70 @@ class OpenAIService:
                 "OpenAI API key not configured. Cannot generate AI prompts."
             )
 
+        num_to_request = num_prompts_needed
+        if num_prompts_needed > PROMPTS_PER_REQUEST:
+            num_to_request = math.ceil(num_prompts_needed * (1 + CHUNK_OVERSHOOT))
+        chunk_size = min(
+            max(
+                PROMPTS_PER_REQUEST,
+                math.ceil(num_to_request / MAX_CONCURRENT_REQUESTS),
+            ),
+            MAX_PROMPTS_PER_REQUEST,
+        )
+        chunk_sizes = [
+            min(chunk_size, num_to_request - start)
+            for start in range(0, num_to_request, chunk_size)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_REQUESTS, len(chunk_sizes))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._request_prompts,
+                    input_question,
+                    size,
+                    existing_prompts,
+                    self._chunk_instruction(index, len(chunk_sizes)),
+                )
+                for index, size in enumerate(chunk_sizes)
+            ]
+
+        # Chunks are generated independently, so drop prompts another chunk
+        # (or the caller) already has before trimming to the count needed
+        seen = {prompt.lower().strip() for prompt in existing_prompts or []}
+        prompts = []
+        errors = []
+        for future in futures:
+            try:
+                chunk = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            for prompt in chunk:
+                normalized = prompt.lower().strip()
+                if normalized not in seen:
+                    seen.add(normalized)
+                    prompts.append(prompt)
+
+        # Partial results are still useful; the caller tops up any shortfall
+        if len(errors) == len(futures):
+            raise errors[0]
+        return prompts[:num_prompts_needed]
+
+    def _chunk_instruction(self, index, num_chunks):
+        """Return the style instruction for one chunk, or None if unchunked"""
+        if num_chunks == 1:
+            return None
+        style = CHUNK_STYLES[index % len(CHUNK_STYLES)]
+        return f"This is batch {index + 1} of {num_chunks}. Write every prompt in this batch {style}, so it does not overlap with the other batches."
+
+    def _request_prompts(
+        self, input_question, num_prompts_needed, existing_prompts, instruction=None
+    ):
+        """Ask for num_prompts_needed prompts with a single API request"""
         try:
             prompt_content = self._build_ai_prompt_content(
-                input_question, num_prompts_needed, existing_prompts
+                input_question, num_prompts_needed, existing_prompts, instruction
             )
 
             response = self.client.chat.completions.create(
@@ -129,7 +245,8 @@ class OpenAIService:
                         "content": prompt_content,
                     },
                 ],
-                max_tokens=500,
+                max_tokens=max(num_prompts_needed, PROMPTS_PER_REQUEST)
+                * TOKENS_PER_PROMPT,
                 temperature=0.8,
             )
 
@@ -141,19 +258,22 @@ class OpenAIService:
                 if prompt.strip()
             ]
 
-            # Return only the number of prompts we need
-            return prompts[:num_prompts_needed]
+            # Keep any extras; generate_prompts() trims after deduplicating
+            return prompts
 
         except Exception as e:
             print(f"Error generating prompts with AI: {e}")
             raise e
 
     def _build_ai_prompt_content(
-        self, input_question, num_prompts_needed, existing_prompts
+        self, input_question, num_prompts_needed, existing_prompts, instruction=None
     ):
         """Build the content for the AI prompt, including existing prompts to avoid"""
         base_content = f"Generate {num_prompts_needed} different ways to ask this question: '{input_question}'. Each prompt should be unique and ask for the same information but with different phrasing, tone, or approach."
 
+        if instruction:
+            base_content += f" {instruction}"
+
         if existing_prompts:
             existing_list = "\n".join(f"- {prompt}" for prompt in existing_prompts)
             base_content += f"\n\nAVOID creating prompts similar to these existing ones:\n{existing_list}"
@@ -1,6 +1,12 @@
+from database import db
 from flask import abort
+from models import InputQuestion, Prompt, Tournament, normalize_question_text
 from services.openai_service import openai_service
 
+# Constants
+DEFAULT_PROMPTS_PAGE_SIZE = 100
+MAX_PROMPTS_PAGE_SIZE = 500
+
 
 class PromptService:
     """Service for handling prompt-related operations"""
@@ -16,6 +22,43 @@ class PromptService:
                 seen.add(normalized)
         return unique_prompts
 
+    def get_pooled_prompts(
+        self, input_question, num_prompts_needed, existing_prompts=None
+    ):
+        """
+        Reuse prompts already stored for the same normalized question
+
+        Every tournament for a question writes its own copy of the prompts,
+        so all input questions with the same normalized text form one pool
+        of variations to draw from before generating new ones.
+
+        Args:
+            input_question (str): The question being asked
+            num_prompts_needed (int): Number of prompts wanted
+            existing_prompts (list): Prompts the caller already has
+
+        Returns:
+            list: Up to num_prompts_needed pooled prompts, oldest first
+        """
+        existing_prompts = existing_prompts or []
+        pooled = db.session.scalars(
+            db.select(Prompt.prompt_text)
+            .join(InputQuestion)
+            .filter(
+                InputQuestion.normalized_text == normalize_question_text(input_question)
+            )
+            .group_by(Prompt.prompt_text)
+            .order_by(db.func.min(Prompt.id))
+            .limit(num_prompts_needed + len(existing_prompts))
+        ).all()
+
+        existing_normalized = {prompt.lower().strip() for prompt in existing_prompts}
+        return [
+            prompt
+            for prompt in self.remove_duplicate_prompts(pooled)
+            if prompt.lower().strip() not in existing_normalized
+        ][:num_prompts_needed]
+
     def generate_fallback_prompts(
         self, input_question, num_prompts_needed, existing_prompts=None
     ):
@@ -64,6 +107,45 @@ class PromptService:
                 input_question, num_prompts_needed, existing_prompts
             )
 
+    def get_prompts_page(
+        self,
+        after_id=None,
+        limit=DEFAULT_PROMPTS_PAGE_SIZE,
+        input_question_id=None,
+        tournament_id=None,
+    ):
+        """
+        Get one page of prompts ordered by id, using keyset pagination
+
+        Args:
+            after_id (int, optional): Return prompts with an id above this cursor
+            limit (int): Page size, capped at MAX_PROMPTS_PAGE_SIZE
+            input_question_id (int, optional): Only prompts for this question
+            tournament_id (int, optional): Only prompts in this tournament
+
+        Returns:
+            tuple: (list of (id, prompt_text) rows, next cursor or None)
+        """
+        limit = max(1, min(limit, MAX_PROMPTS_PAGE_SIZE))
+
+        query = db.select(Prompt.id, Prompt.prompt_text).order_by(Prompt.id)
+        if after_id is not None:
+            query = query.filter(Prompt.id > after_id)
+        if input_question_id is not None:
+            query = query.filter(Prompt.input_question_id == input_question_id)
+        if tournament_id is not None:
+            question_id = (
+                db.select(Tournament.input_question_id)
+                .filter_by(id=tournament_id)
+                .scalar_subquery()
+            )
+            query = query.filter(Prompt.input_question_id == question_id)
+
+        # Fetch one extra row to learn whether another page follows
+        rows = db.session.execute(query.limit(limit + 1)).all()
+        next_cursor = rows[limit - 1].id if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
     def test_prompt_with_openai(self, data):
         """Test a prompt with OpenAI and return formatted response"""
         # Validate required fields
@@ -75,10 +157,12 @@ class PromptService:
         model = data.get("model", "gpt-3.5-turbo")
         max_tokens = data.get("max_tokens", 150)
         temperature = data.get("temperature", 0.7)
+        # "bypass_cache": true always calls the API (and refreshes the cache)
+        use_cache = not data.get("bypass_cache", False)
 
         try:
             return openai_service.test_prompt(
-                prompt_text, model, max_tokens, temperature
+                prompt_text, model, max_tokens, temperature, use_cache
             )
         except ValueError as e:
             abort(400, description=str(e))
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Constants
+DEFAULT_PATH = os.getenv(
+    "TEST_PROMPT_CACHE_PATH",
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "instance",
+        "test_prompt_cache.db",
+    ),
+)
+DEFAULT_TTL_SECONDS = float(os.getenv("TEST_PROMPT_CACHE_TTL_SECONDS", 24 * 60 * 60))
+DEFAULT_MAX_ENTRIES = int(os.getenv("TEST_PROMPT_CACHE_MAX_ENTRIES", 10000))
+DEFAULT_MEMORY_ENTRIES = int(os.getenv("TEST_PROMPT_CACHE_MEMORY_ENTRIES", 500))
+
+
+class ResponseCache:
+    """
+    Two-tier cache of OpenAI test-prompt responses
+
+    An in-memory LRU sits in front of a SQLite file, so repeated tests of
+    the same prompt and settings are answered without an API call, also
+    after a restart. Entries expire after ttl_seconds, except responses
+    generated at temperature 0, which are deterministic and kept until
+    they are evicted. The file keeps at most max_entries rows and drops
+    the least recently used ones beyond that.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_PATH,
+        ttl_seconds=DEFAULT_TTL_SECONDS,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        memory_entries=DEFAULT_MEMORY_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._connection = None
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(prompt_text, model, max_tokens, temperature):
+        """Return the cache key for a set of test-prompt parameters"""
+        # 0 and 0.0 are the same temperature
+        parameters = json.dumps([prompt_text, model, max_tokens, float(temperature)])
+        return hashlib.blake2b(parameters.encode(), digest_size=16).hexdigest()
+
+    def get(self, key):
+        """
+        Return the cached response for key, or None on a miss
+
+        Args:
+            key (str): Key from make_key()
+
+        Returns:
+            dict: Cached response, or None if not cached or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    return response
+                del self._memory[key]
+
+            row = self._execute(
+                "SELECT response, expires_at FROM responses "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            )
+            row = row.fetchone() if row is not None else None
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            response = json.loads(row[0])
+            self._remember(key, row[1], response)
+            self._disk_hits += 1
+            return response
+
+    def put(self, key, response, temperature):
+        """
+        Store a response in memory and on disk
+
+        Args:
+            key (str): Key from make_key()
+            response (dict): JSON-serializable response
+            temperature (float): Temperature the response was generated at;
+                responses at 0 do not expire
+        """
+        now = time.time()
+        expires_at = None if temperature == 0 else now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, expires_at, response)
+            self._execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at, used_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response), expires_at, now),
+            )
+            evicted = self._execute(
+                "DELETE FROM responses WHERE expires_at <= ? OR key IN ("
+                "SELECT key FROM responses ORDER BY used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (now, self.max_entries),
+            )
+            if evicted is not None:
+                self._evictions += evicted.rowcount
+
+    def clear(self):
+        """Drop all entries, in memory and on disk, and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            self._execute("DELETE FROM responses")
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def close(self):
+        """Close the SQLite connection; it is reopened on next use"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self):
+        """Return hit/miss/eviction counters, hit rate and entry counts"""
+        with self._lock:
+            rows = self._execute("SELECT COUNT(*) FROM responses")
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            return {
+                "memory_entries": len(self._memory),
+                "disk_entries": rows.fetchone()[0] if rows is not None else 0,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+            }
+
+    def _remember(self, key, expires_at, response):
+        """Put an entry in the memory LRU (caller holds the lock)"""
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _execute(self, statement, parameters=()):
+        """
+        Run a statement against the SQLite file (caller holds the lock)
+
+        The cache must never break a test-prompt call, so disk errors are
+        logged and the call goes on as if the file held nothing.
+
+        Returns:
+            sqlite3.Cursor: Cursor, or None if the file could not be used
+        """
+        try:
+            if self._connection is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._connection = sqlite3.connect(
+                    self.path, check_same_thread=False, isolation_level=None
+                )
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                    "expires_at REAL, used_at REAL NOT NULL)"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_responses_used_at "
+                    "ON responses (used_at)"
+                )
+            return self._connection.execute(statement, parameters)
+        except sqlite3.Error as e:
+            print(f"Test prompt cache unavailable: {e}")
+            return None
+
+
+# Create a singleton instance for use across the application
+response_cache = ResponseCache()
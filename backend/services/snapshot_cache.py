@@ -0,0 +1,113 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Constants
+DEFAULT_MAX_BYTES = int(os.getenv("SNAPSHOT_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+
+class SnapshotCache:
+    """
+    Bounded LRU cache of serialized tournament payloads
+
+    Keys include the tournament version, so a write that bumps the version
+    makes older entries unreachable; they age out through LRU eviction.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key):
+        """
+        Return the cached payload for key, or None on a miss
+
+        Args:
+            key (tuple): Cache key, e.g. ("status", tournament_id, version)
+
+        Returns:
+            bytes: Serialized payload, or None if not cached
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return payload
+
+    def put(self, key, payload):
+        """
+        Store a serialized payload, evicting least recently used entries
+
+        Payloads larger than the whole cache are not stored.
+
+        Args:
+            key (tuple): Cache key
+            payload (bytes): Serialized payload
+        """
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= len(previous)
+
+            self._entries[key] = payload
+            self._size_bytes += size
+
+            while self._size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted)
+                self._evictions += 1
+
+    def get_or_build(self, key, builder):
+        """
+        Return the cached payload for key, building and storing it on a miss
+
+        Args:
+            key (tuple): Cache key
+            builder (callable): Returns the serialized payload as bytes
+
+        Returns:
+            bytes: Serialized payload
+        """
+        payload = self.get(key)
+        if payload is None:
+            payload = builder()
+            self.put(key, payload)
+        return payload
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+# Create a singleton instance for use across the application
+snapshot_cache = SnapshotCache()
@@ -1,12 +1,46 @@
 import random
+import uuid
+from datetime import datetime, timezone
 
 from database import db
-from flask import abort
-from models import InputQuestion, Match, Prompt, Tournament
+from flask import abort, current_app
+from models import (
+    CreationJob,
+    InputQuestion,
+    Match,
+    Prompt,
+    PromptMetaData,
+    RoundBye,
+    Tournament,
+)
+from services.change_log_service import change_log_service
+from services.event_service import event_service
+from services.job_queue import job_queue
+from services.match_service import match_service
 from services.prompt_service import prompt_service
+from sqlalchemy.orm import aliased, joinedload
+from werkzeug.exceptions import HTTPException
 
 # Constants
 DEFAULT_TOTAL_PROMPTS = 8
+VOTING_MODES = ("single", "crowd")
+# Votes needed to close a crowd match when neither quorum nor margin is given
+DEFAULT_VOTE_QUORUM = 10
+# Optional fields of the status payload, in response order
+STATUS_FIELDS = (
+    "input_question",
+    "status",
+    "current_round",
+    "total_prompts",
+    "prompts",
+    "progress",
+    "rounds",
+    "byes",
+    "winner",
+    "voting",
+)
+# Fields returned whatever the client asks for
+ALWAYS_INCLUDED_STATUS_FIELDS = ("tournament_id", "version")
 
 
 class TournamentService:
@@ -22,46 +56,152 @@ class TournamentService:
         Returns:
             dict: Created tournament data
         """
-        # Check if input_question exists and is not empty
-        input_question_text = data.get("input_question")
-        if not input_question_text or not input_question_text.strip():
-            abort(400, description="Input question is required and cannot be empty")
+        result = self._create_tournament(data)
+        db.session.commit()
+        return result
 
-        # Create the InputQuestion
-        input_question = InputQuestion(question_text=input_question_text)
-        db.session.add(input_question)
+    def enqueue_tournament_creation(self, data):
+        """
+        Queue a tournament creation for a background worker and return the job
+
+        The request is validated here so bad input is still rejected up
+        front; prompt generation and the database writes run in the job.
+
+        Args:
+            data (dict): Tournament creation data
+
+        Returns:
+            dict: Job data with status "queued"
+        """
+        self._parse_creation_request(data)
+
+        job = CreationJob(id=uuid.uuid4().hex, payload=data, status="queued")
+        db.session.add(job)
         db.session.commit()
 
-        # Get custom prompts or start with empty list
-        prompts = data.get("custom_prompts", [])
+        job_queue.submit(current_app._get_current_object(), job.id)
+        return self._serialize_job(job)
 
-        # Remove duplicates from custom prompts first
-        prompts = prompt_service.remove_duplicate_prompts(prompts)
+    def get_creation_job(self, job_id):
+        """
+        Get the state of a tournament creation job
 
-        # Get total_prompts parameter, default to DEFAULT_TOTAL_PROMPTS
-        total_prompts = data.get("total_prompts", DEFAULT_TOTAL_PROMPTS)
+        Args:
+            job_id (str): ID of the job
 
-        # Validate total_prompts
-        if not isinstance(total_prompts, int):
-            abort(400, description="total_prompts must be an integer")
-        if total_prompts <= 0:
-            abort(400, description="total_prompts must be a positive number")
-        if total_prompts < 2:
-            abort(400, description="total_prompts must be at least 2 for a tournament")
+        Returns:
+            dict: Job data; "result" is set once the tournament is created
+        """
+        return self._serialize_job(db.get_or_404(CreationJob, job_id))
 
-        # Check if we have enough prompts when AI generation is not available
-        from services.openai_service import openai_service
+    def run_creation_job(self, job_id):
+        """
+        Create the tournament for a queued job and record the outcome
 
-        if len(prompts) < total_prompts and not openai_service.is_available():
-            abort(
-                400,
-                description=f"Not enough prompts provided. You provided {len(prompts)} prompts but need {total_prompts}. Either provide more prompts or set up an OpenAI API key for automatic prompt generation.",
+        The tournament and the job's completion are committed together, so
+        a job interrupted by a restart either created nothing or is already
+        marked completed. The completion only commits while this worker
+        still holds the job's lease, so a job reclaimed after its lease
+        expired creates one tournament, not two.
+
+        Args:
+            job_id (str): ID of the job
+        """
+        # Claim the job so a job submitted twice only runs once
+        claimed_at = datetime.now(timezone.utc)
+        worker_id = job_queue.worker_id
+        claimed = db.session.execute(
+            db.update(CreationJob)
+            .filter_by(id=job_id, status="queued")
+            .values(status="running", claimed_at=claimed_at, worker_id=worker_id)
+        ).rowcount
+        db.session.commit()
+        if not claimed:
+            return
+
+        job = db.session.get(CreationJob, job_id)
+        result = error = None
+        try:
+            result = self._create_tournament(job.payload)
+        except Exception as e:
+            db.session.rollback()
+            if isinstance(e, HTTPException):
+                error = e.description or str(e)
+            elif isinstance(e, ValueError):
+                error = str(e)
+            else:
+                print(f"Creation job {job_id} failed: {e}")
+                error = "Internal server error"
+            error = error[:255]
+
+        if not self._finish_job(job_id, worker_id, claimed_at, result, error):
+            # The lease expired and another worker took the job over
+            db.session.rollback()
+            return
+        db.session.commit()
+
+    def _finish_job(self, job_id, worker_id, claimed_at, result=None, error=None):
+        """
+        Mark a job completed (with its result) or failed (with an error)
+
+        Args:
+            job_id (str): ID of the job
+            worker_id (str): Worker that claimed the job
+            claimed_at (datetime): When the worker claimed it
+
+        Returns:
+            bool: False if the claim is no longer held, so nothing changed
+        """
+        finished = db.session.execute(
+            db.update(CreationJob)
+            .filter_by(
+                id=job_id,
+                status="running",
+                worker_id=worker_id,
+                claimed_at=claimed_at,
+            )
+            .values(
+                status="failed" if error else "completed",
+                error=error,
+                result=result,
+                tournament_id=result["tournament_id"] if result else None,
+                processed_at=datetime.now(timezone.utc),
             )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        return bool(finished)
+
+    def _serialize_job(self, job):
+        """Serialize a tournament creation job"""
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "tournament_id": job.tournament_id,
+            "error": job.error,
+            "result": job.result,
+        }
+
+    def _create_tournament(self, data):
+        """
+        Generate prompts and write a tournament without committing
+
+        The question, its prompts and the tournament are written in the
+        caller's transaction, so a failed creation leaves nothing behind.
+
+        Args:
+            data (dict): Tournament creation data
+
+        Returns:
+            dict: Created tournament data
+        """
+        input_question_text, prompts, total_prompts, voting_settings = (
+            self._parse_creation_request(data)
+        )
+        voting_mode, vote_quorum, vote_margin = voting_settings
 
         # Generate additional prompts if needed, ensuring uniqueness
         max_attempts = 3  # Limit attempts to avoid infinite loops
         attempt = 0
-
         while len(prompts) < total_prompts and attempt < max_attempts:
             additional_prompts_needed = total_prompts - len(prompts)
             previous_count = len(prompts)
@@ -95,96 +235,227 @@ class TournamentService:
         # Ensure we have exactly the requested number of prompts
         prompts = prompts[:total_prompts]
 
-        # Add the prompts to the database
-        for prompt_text in prompts:
-            prompt = Prompt(
-                input_question_id=input_question.id, prompt_text=prompt_text
-            )
-            db.session.add(prompt)
+        input_question = InputQuestion(question_text=input_question_text)
+        db.session.add(input_question)
+        db.session.flush()
 
-        db.session.commit()
+        db.session.execute(
+            db.insert(Prompt),
+            [
+                {"input_question_id": input_question.id, "prompt_text": prompt_text}
+                for prompt_text in prompts
+            ],
+        )
 
-        # Create the tournament
-        tournament = Tournament(input_question_id=input_question.id)
+        tournament = Tournament(
+            input_question_id=input_question.id,
+            voting_mode=voting_mode,
+            vote_quorum=vote_quorum,
+            vote_margin=vote_margin,
+        )
         db.session.add(tournament)
-        db.session.commit()
+        db.session.flush()
 
         return {
             "tournament_id": tournament.id,
-            "input_question": input_question.question_text,
-            "prompts": [prompt.prompt_text for prompt in input_question.prompts],
+            "input_question": input_question_text,
+            "prompts": prompts,
         }
 
-    def get_tournament_status(self, tournament_id):
+    def _parse_creation_request(self, data):
         """
-        Get comprehensive tournament status
+        Validate tournament creation data
+
+        Custom prompts are topped up with variations stored for the same
+        question, so a request the pool covers needs no AI generation.
+
+        Args:
+            data (dict): Tournament creation data
+
+        Returns:
+            tuple: (input question, deduplicated custom and pooled prompts,
+            total_prompts, (voting_mode, vote_quorum, vote_margin))
+        """
+        # Check if input_question exists and is not empty
+        input_question_text = data.get("input_question")
+        if not input_question_text or not input_question_text.strip():
+            abort(400, description="Input question is required and cannot be empty")
+
+        voting_settings = self._parse_voting_settings(data)
+
+        # Get custom prompts or start with empty list
+        prompts = data.get("custom_prompts", [])
+
+        # Remove duplicates from custom prompts first
+        prompts = prompt_service.remove_duplicate_prompts(prompts)
+
+        # Get total_prompts parameter, default to DEFAULT_TOTAL_PROMPTS
+        total_prompts = data.get("total_prompts", DEFAULT_TOTAL_PROMPTS)
+
+        # Validate total_prompts
+        if not isinstance(total_prompts, int):
+            abort(400, description="total_prompts must be an integer")
+        if total_prompts <= 0:
+            abort(400, description="total_prompts must be a positive number")
+        if total_prompts < 2:
+            abort(400, description="total_prompts must be at least 2 for a tournament")
+
+        # Reuse variations stored for the same question before asking AI
+        provided_count = len(prompts)
+        if provided_count < total_prompts:
+            prompts = prompts + prompt_service.get_pooled_prompts(
+                input_question_text,
+                total_prompts - provided_count,
+                existing_prompts=prompts,
+            )
+
+        # Check if we have enough prompts when AI generation is not available
+        from services.openai_service import openai_service
+
+        if len(prompts) < total_prompts and not openai_service.is_available():
+            abort(
+                400,
+                description=f"Not enough prompts provided. You provided {provided_count} prompts but need {total_prompts}. Either provide more prompts or set up an OpenAI API key for automatic prompt generation.",
+            )
+
+        return input_question_text, prompts, total_prompts, voting_settings
+
+    def _parse_voting_settings(self, data):
+        """
+        Validate the voting mode and its closing rules
+
+        In crowd mode a match closes once its vote total reaches
+        vote_quorum or the leader is ahead by vote_margin, whichever
+        comes first.
+
+        Args:
+            data (dict): Tournament creation data
+
+        Returns:
+            tuple: (voting_mode, vote_quorum, vote_margin)
+        """
+        voting_mode = data.get("voting_mode", "single")
+        if voting_mode not in VOTING_MODES:
+            abort(400, description="voting_mode must be 'single' or 'crowd'")
+
+        vote_quorum = data.get("vote_quorum")
+        vote_margin = data.get("vote_margin")
+        for name, value in (("vote_quorum", vote_quorum), ("vote_margin", vote_margin)):
+            if value is not None and (not isinstance(value, int) or value <= 0):
+                abort(400, description=f"{name} must be a positive integer")
+
+        if voting_mode == "single":
+            return voting_mode, None, None
+        if vote_quorum is None and vote_margin is None:
+            vote_quorum = DEFAULT_VOTE_QUORUM
+        return voting_mode, vote_quorum, vote_margin
+
+    def get_tournament_version(self, tournament_id):
+        """
+        Get the current version of a tournament without loading the bracket
 
         Args:
             tournament_id (int): ID of the tournament
 
         Returns:
-            dict: Tournament status data
+            int: Tournament version, bumped on every bracket change
         """
-        tournament = db.get_or_404(Tournament, tournament_id)
+        return db.one_or_404(db.select(Tournament.version).filter_by(id=tournament_id))
 
-        # Get all matches organized by round
-        matches_by_round = {}
-        for match in tournament.rounds:
-            round_num = match.round_number
-            if round_num not in matches_by_round:
-                matches_by_round[round_num] = []
-
-            match_data = {
-                "match_id": match.id,
-                "prompt_1": match.prompt_1.prompt_text,
-                "prompt_2": match.prompt_2.prompt_text,
-                "prompt_1_id": match.prompt_1_id,
-                "prompt_2_id": match.prompt_2_id,
-                "status": match.status,
-                "winner": match.winner.prompt_text if match.winner else None,
-            }
-            matches_by_round[round_num].append(match_data)
+    def parse_status_fields(self, value):
+        """
+        Parse the comma-separated ``fields`` parameter of the status endpoint
+
+        Args:
+            value (str): e.g. "status,current_round,rounds"; empty for all
+
+        Returns:
+            tuple: Requested fields in STATUS_FIELDS order, or None for all
+        """
+        if not value:
+            return None
+
+        fields = {field.strip() for field in value.split(",") if field.strip()}
+        unknown = fields - set(STATUS_FIELDS) - set(ALWAYS_INCLUDED_STATUS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown status fields: {', '.join(sorted(unknown))}")
+
+        return tuple(field for field in STATUS_FIELDS if field in fields)
+
+    def parse_round_window(self, value):
+        """
+        Parse the ``rounds`` parameter of the status endpoint
+
+        Args:
+            value (str): "all", "current", a round number ("3") or an
+                inclusive range ("3..5"); empty for all
 
-        # Calculate byes for each round
-        byes_by_round = self._calculate_byes_by_round(tournament_id, matches_by_round)
+        Returns:
+            None for all rounds, "current", or a (first, last) tuple
+        """
+        if not value or value == "all":
+            return None
+        if value == "current":
+            return "current"
+
+        first, separator, last = value.partition("..")
+        try:
+            first = int(first)
+            last = int(last) if separator else first
+        except ValueError:
+            raise ValueError(
+                "rounds must be 'all', 'current', a round number or a range like 3..5"
+            )
+        if first < 1 or last < first:
+            raise ValueError("rounds range must be ascending and start at 1 or later")
 
-        # Calculate tournament progress
-        total_matches = len(tournament.rounds)
-        completed_matches = len(
-            [m for m in tournament.rounds if m.status == "completed"]
+        return first, last
+
+    def get_tournament_status(self, tournament_id, fields=None, rounds=None):
+        """
+        Get comprehensive tournament status
+
+        Only the requested fields and rounds are queried, so a client that
+        needs the current round alone does not pay for the whole bracket.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            fields (tuple, optional): Fields to include (see STATUS_FIELDS);
+                all fields when None
+            rounds (str or tuple, optional): "current" (every round with
+                a pending match) or an inclusive (first, last) round range
+                for "rounds" and "byes"; all rounds when None
+
+        Returns:
+            dict: Tournament status data
+        """
+        fields = STATUS_FIELDS if fields is None else fields
+
+        tournament = db.one_or_404(
+            db.select(Tournament)
+            .options(
+                joinedload(Tournament.input_question),
+                joinedload(Tournament.winner_prompt),
+            )
+            .filter_by(id=tournament_id)
         )
 
-        # Get current round (highest round number with pending matches, or highest completed round)
-        current_round = 1
-        if tournament.rounds:
-            pending_rounds = [
-                m.round_number for m in tournament.rounds if m.status == "pending"
-            ]
-            if pending_rounds:
-                current_round = min(pending_rounds)
-            else:
-                current_round = max(m.round_number for m in tournament.rounds)
-
-        # Get tournament winner if completed
-        winner = None
-        if tournament.status == "completed" and tournament.rounds:
-            final_matches = [m for m in tournament.rounds if m.status == "completed"]
-            if final_matches:
-                # Find the match with the highest round number
-                final_match = max(final_matches, key=lambda m: m.round_number)
-                winner = final_match.winner.prompt_text if final_match.winner else None
-
-        # Prepare the response data
         tournament_data = {
             "tournament_id": tournament.id,
-            "input_question": tournament.input_question.question_text,
-            "status": tournament.status,
-            "current_round": current_round,
-            "total_prompts": len(tournament.input_question.prompts),
-            "prompts": [
-                prompt.prompt_text for prompt in tournament.input_question.prompts
-            ],
-            "progress": {
+            "version": tournament.version,
+        }
+        if "input_question" in fields:
+            tournament_data["input_question"] = tournament.input_question.question_text
+        if "status" in fields:
+            tournament_data["status"] = tournament.status
+
+        # Progress is read from the counters kept on the tournament row
+        if "current_round" in fields:
+            tournament_data["current_round"] = tournament.current_round
+        if "progress" in fields:
+            total_matches = tournament.total_matches
+            completed_matches = tournament.completed_matches
+            tournament_data["progress"] = {
                 "total_matches": total_matches,
                 "completed_matches": completed_matches,
                 "completion_percentage": round(
@@ -195,17 +466,73 @@ class TournamentService:
                     ),
                     1,
                 ),
-            },
-            "rounds": matches_by_round,
-            "byes": byes_by_round,
-            "winner": winner,
-        }
+            }
+
+        if "total_prompts" in fields or "prompts" in fields:
+            prompt_texts = db.session.scalars(
+                db.select(Prompt.prompt_text)
+                .filter_by(input_question_id=tournament.input_question_id)
+                .order_by(Prompt.id)
+            ).all()
+            if "total_prompts" in fields:
+                tournament_data["total_prompts"] = len(prompt_texts)
+            if "prompts" in fields:
+                tournament_data["prompts"] = prompt_texts
+
+        if rounds == "current":
+            window = self._get_playable_rounds(tournament)
+        else:
+            window = rounds
+
+        # Get the matches in the window organized by round
+        if "rounds" in fields or "byes" in fields:
+            matches_by_round = self._get_matches_by_round(tournament.id, window)
+            if "rounds" in fields:
+                tournament_data["rounds"] = matches_by_round
+            if "byes" in fields:
+                tournament_data["byes"] = self._get_byes_by_round(
+                    tournament.id, matches_by_round, window
+                )
+
+        if "voting" in fields:
+            tournament_data["voting"] = {
+                "mode": tournament.voting_mode,
+                "quorum": tournament.vote_quorum,
+                "margin": tournament.vote_margin,
+            }
+        if "winner" in fields:
+            winner_prompt = tournament.winner_prompt
+            tournament_data["winner"] = winner_prompt and winner_prompt.prompt_text
 
         return tournament_data
 
+    def _get_playable_rounds(self, tournament):
+        """
+        Get the round window holding every pending match
+
+        The whole bracket is laid out up front, so a match in a later round
+        is pending as soon as both of its feeding matches are decided, while
+        current_round still points at the earliest unfinished round.
+
+        Args:
+            tournament (Tournament): The tournament
+
+        Returns:
+            tuple: Inclusive (first, last) round range; the current round
+            alone when no match is pending
+        """
+        first, last = db.session.execute(
+            db.select(
+                db.func.min(Match.round_number), db.func.max(Match.round_number)
+            ).filter_by(tournament_id=tournament.id, status="pending")
+        ).one()
+        if first is None:
+            return tournament.current_round, tournament.current_round
+        return first, last
+
     def start_tournament_bracket(self, tournament_id):
         """
-        Start tournament bracket by creating first round matches
+        Start tournament bracket by laying out the matches of every round
 
         Args:
             tournament_id (int): ID of the tournament
@@ -215,47 +542,67 @@ class TournamentService:
         """
         tournament = db.get_or_404(Tournament, tournament_id)
 
-        # Check if tournament already has matches
-        if tournament.rounds:
+        # Check if tournament already has matches, without loading them
+        if db.session.scalar(
+            db.select(Match.id).filter_by(tournament_id=tournament.id).limit(1)
+        ):
             raise ValueError("Tournament bracket already started")
 
-        # Get all prompts for this tournament
-        prompts = tournament.input_question.prompts
+        # Only ids and texts are needed to pair the prompts
+        prompts = db.session.execute(
+            db.select(Prompt.id, Prompt.prompt_text).filter_by(
+                input_question_id=tournament.input_question_id
+            )
+        ).all()
 
         if len(prompts) < 2:
             raise ValueError("Need at least 2 prompts to start tournament")
 
-        # Shuffle prompts for random pairing
+        # Shuffle prompts for random seeding
         prompt_list = list(prompts)
         random.shuffle(prompt_list)
 
-        # Create first round matches
-        matches_created = []
-        for i in range(0, len(prompt_list), 2):
-            if i + 1 < len(prompt_list):  # Ensure we have a pair
-                match = Match(
-                    tournament_id=tournament.id,
-                    prompt_1_id=prompt_list[i].id,
-                    prompt_2_id=prompt_list[i + 1].id,
-                    round_number=1,
-                )
-                db.session.add(match)
-                matches_created.append(
-                    {
-                        "prompt_1": prompt_list[i].prompt_text,
-                        "prompt_2": prompt_list[i + 1].prompt_text,
-                    }
-                )
+        # Lay out the whole bracket; byes all fall in round 1
+        bracket, round_1_byes = match_service.create_bracket(tournament.id, prompt_list)
+        round_1_matches = bracket[1]
+
+        # Create every prompt's win/loss counters up front, so votes only
+        # have to increment them
+        db.session.execute(
+            db.insert(PromptMetaData),
+            [
+                {
+                    "prompt_id": prompt.id,
+                    "tournament_id": tournament.id,
+                    "win_count": 0,
+                    "loss_count": 0,
+                }
+                for prompt in prompts
+            ],
+        )
 
-        # Update tournament status
+        # Update tournament status and progress
         tournament.status = "in_progress"
+        tournament.total_matches += sum(len(matches) for matches in bracket.values())
+        tournament.current_round = 1
+        tournament.bump_version()
+        event_data = {
+            "version": tournament.version,
+            "rounds": bracket,
+            "byes": {1: round_1_byes},
+        }
+        change_log_service.record(tournament, "bracket_created", event_data)
         db.session.commit()
+        event_service.publish(tournament.id, "bracket_created", event_data)
 
         return {
             "message": "Tournament bracket started",
             "tournament_id": tournament.id,
-            "round_1_matches": matches_created,
-            "total_matches": len(matches_created),
+            "round_1_matches": [
+                {"prompt_1": match["prompt_1"], "prompt_2": match["prompt_2"]}
+                for match in round_1_matches
+            ],
+            "total_matches": len(round_1_matches),
         }
 
     def get_tournament_matches(self, tournament_id, round_number=None):
@@ -275,20 +622,23 @@ class TournamentService:
         if round_number:
             matches_query = matches_query.filter_by(round_number=round_number)
 
-        matches = matches_query.order_by(Match.round_number, Match.id).all()
+        matches = matches_query.order_by(
+            Match.round_number, Match.bracket_position, Match.id
+        ).all()
+
+        # Resolve prompt texts with one query instead of lazy loads per match
+        prompt_texts = dict(
+            db.session.execute(
+                db.select(Prompt.id, Prompt.prompt_text).filter_by(
+                    input_question_id=tournament.input_question_id
+                )
+            ).all()
+        )
 
         matches_data = []
         for match in matches:
-            match_data = {
-                "match_id": match.id,
-                "round_number": match.round_number,
-                "prompt_1": match.prompt_1.prompt_text,
-                "prompt_2": match.prompt_2.prompt_text,
-                "prompt_1_id": match.prompt_1_id,
-                "prompt_2_id": match.prompt_2_id,
-                "status": match.status,
-                "winner": match.winner.prompt_text if match.winner else None,
-            }
+            match_data = self._serialize_match(match, prompt_texts)
+            match_data["round_number"] = match.round_number
             matches_data.append(match_data)
 
         return {
@@ -297,63 +647,100 @@ class TournamentService:
             "total_matches": len(matches_data),
         }
 
-    def _calculate_byes_by_round(self, tournament_id, matches_by_round):
-        """Calculate byes for each round"""
+    def _get_matches_by_round(self, tournament_id, window):
+        """
+        Load and serialize the matches in a round window
 
-        def get_active_prompts_for_round(round_num):
-            """Get the set of prompts that are active (not eliminated) for a given round"""
-            if round_num == 1:
-                # Round 1: all tournament prompts are active
-                tournament = db.session.get(Tournament, tournament_id)
-                return set(p.id for p in tournament.input_question.prompts)
-            else:
-                # Later rounds: winners from previous round + byes from previous round
-                prev_matches = Match.query.filter_by(
-                    tournament_id=tournament_id, round_number=round_num - 1
-                ).all()
-
-                # Get winners from previous round
-                active = set()
-                prev_participating = set()
-
-                for match in prev_matches:
-                    prev_participating.add(match.prompt_1_id)
-                    prev_participating.add(match.prompt_2_id)
-                    if match.winner:
-                        active.add(match.winner.id)
-
-                # Get active prompts from the previous round and find byes
-                prev_active = get_active_prompts_for_round(round_num - 1)
-                prev_byes = prev_active - prev_participating
-                active.update(prev_byes)
-
-                return active
-
-        byes_by_round = {}
-        for round_num in matches_by_round.keys():
-            # Get all prompts that participated in this round
-            participating_prompts = set()
-            for match_data in matches_by_round[round_num]:
-                # Find the actual match object to get prompt IDs
-                tournament = db.session.get(Tournament, tournament_id)
-                match = next(
-                    m for m in tournament.rounds if m.id == match_data["match_id"]
-                )
-                participating_prompts.add(match.prompt_1_id)
-                participating_prompts.add(match.prompt_2_id)
+        Prompt texts are joined in the same query, so only the prompts that
+        appear in the window are read.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            window (tuple): Inclusive (first, last) round range, or None
+
+        Returns:
+            dict: Round number -> serialized matches, in bracket order
+        """
+        prompt_1 = aliased(Prompt)
+        prompt_2 = aliased(Prompt)
+        winner = aliased(Prompt)
+        query = (
+            db.select(
+                Match,
+                prompt_1.prompt_text,
+                prompt_2.prompt_text,
+                winner.prompt_text,
+            )
+            .outerjoin(prompt_1, Match.prompt_1_id == prompt_1.id)
+            .outerjoin(prompt_2, Match.prompt_2_id == prompt_2.id)
+            .outerjoin(winner, Match.winner_id == winner.id)
+            .filter(Match.tournament_id == tournament_id)
+            .order_by(Match.round_number, Match.bracket_position, Match.id)
+        )
+        query = self._filter_round_window(query, Match.round_number, window)
+
+        matches_by_round = {}
+        for match, prompt_1_text, prompt_2_text, winner_text in db.session.execute(
+            query
+        ):
+            prompt_texts = {
+                match.prompt_1_id: prompt_1_text,
+                match.prompt_2_id: prompt_2_text,
+                match.winner_id: winner_text,
+            }
+            matches_by_round.setdefault(match.round_number, []).append(
+                self._serialize_match(match, prompt_texts)
+            )
 
-            # Get active prompts for this round
-            active_prompts = get_active_prompts_for_round(round_num)
-            bye_prompt_ids = active_prompts - participating_prompts
+        return matches_by_round
 
-            # Convert bye prompt IDs to prompt text
-            bye_prompts = []
-            for prompt_id in bye_prompt_ids:
-                prompt = db.session.get(Prompt, prompt_id)
-                if prompt:
-                    bye_prompts.append(prompt.prompt_text)
+    def _filter_round_window(self, query, round_column, window):
+        """Restrict a query to an inclusive (first, last) round range"""
+        if window is None:
+            return query
+        first, last = window
+        return query.filter(round_column.between(first, last))
 
-            byes_by_round[round_num] = bye_prompts
+    def _serialize_match(self, match, prompt_texts):
+        """Serialize a match using a prompt id -> text lookup"""
+        return {
+            "match_id": match.id,
+            "prompt_1": prompt_texts.get(match.prompt_1_id),
+            "prompt_2": prompt_texts.get(match.prompt_2_id),
+            "prompt_1_id": match.prompt_1_id,
+            "prompt_2_id": match.prompt_2_id,
+            "status": match.status,
+            "winner": prompt_texts.get(match.winner_id),
+            "next_match_id": match.next_match_id,
+        }
+
+    def _get_byes_by_round(self, tournament_id, matches_by_round, window=None):
+        """
+        Get the byes recorded for each round
+
+        Byes are written when the bracket (or, for older brackets, a round)
+        is created, so this is a single indexed lookup rather than a
+        recomputation of the bracket.
+
+        Args:
+            tournament_id (int): ID of the tournament
+            matches_by_round (dict): Round number -> serialized matches
+            window (tuple, optional): Inclusive (first, last) round range
+
+        Returns:
+            dict: Round number -> list of bye prompt texts
+        """
+        byes_by_round = {round_num: [] for round_num in matches_by_round}
+
+        query = (
+            db.select(RoundBye.round_number, Prompt.prompt_text)
+            .join(Prompt, RoundBye.prompt_id == Prompt.id)
+            .filter(RoundBye.tournament_id == tournament_id)
+            .order_by(RoundBye.round_number, RoundBye.id)
+        )
+        query = self._filter_round_window(query, RoundBye.round_number, window)
+        for round_num, prompt_text in db.session.execute(query):
+            byes_by_round.setdefault(round_num, []).append(prompt_text)
 
         return byes_by_round
 
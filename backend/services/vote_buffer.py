@@ -0,0 +1,155 @@
+import os
+import threading
+import time
+
+# Constants
+DEFAULT_MAX_VOTES = int(os.getenv("VOTE_BUFFER_MAX_VOTES", 200))
+DEFAULT_MAX_AGE_SECONDS = float(os.getenv("VOTE_BUFFER_MAX_AGE_SECONDS", 2.0))
+
+
+class VoteBuffer:
+    """
+    Write-buffered accumulator of crowd votes
+
+    Votes are summed per match in memory and written to the database in
+    batches, so a busy match costs one UPDATE per flush instead of one
+    write per vote. Votes still in the buffer are lost if the process
+    dies; the flush thresholds bound how many.
+    """
+
+    def __init__(
+        self, max_votes=DEFAULT_MAX_VOTES, max_age_seconds=DEFAULT_MAX_AGE_SECONDS
+    ):
+        self.max_votes = max_votes
+        self.max_age_seconds = max_age_seconds
+        self._tallies = {}
+        self._buffered_votes = 0
+        self._oldest_vote_at = None
+        self._lock = threading.Lock()
+        self._flushes = 0
+        self._flushed_votes = 0
+
+    def add(self, match_id, slot):
+        """
+        Buffer one vote
+
+        Args:
+            match_id (int): ID of the match
+            slot (int): 0 for a vote for prompt_1, 1 for prompt_2
+
+        Returns:
+            bool: True if the buffer is due to be flushed
+        """
+        with self._lock:
+            self._tallies.setdefault(match_id, [0, 0])[slot] += 1
+            self._buffered_votes += 1
+            if self._oldest_vote_at is None:
+                self._oldest_vote_at = time.monotonic()
+            return self._is_due()
+
+    def is_due(self):
+        """Return True if the buffer holds too many or too old votes"""
+        with self._lock:
+            return self._is_due()
+
+    def _is_due(self):
+        if not self._buffered_votes:
+            return False
+        return (
+            self._buffered_votes >= self.max_votes
+            or time.monotonic() - self._oldest_vote_at >= self.max_age_seconds
+        )
+
+    def drain(self):
+        """
+        Take every buffered tally, leaving the buffer empty
+
+        Returns:
+            dict: Match id -> [prompt_1 votes, prompt_2 votes]
+        """
+        with self._lock:
+            tallies = self._tallies
+            if tallies:
+                self._flushes += 1
+                self._flushed_votes += self._buffered_votes
+            self._tallies = {}
+            self._buffered_votes = 0
+            self._oldest_vote_at = None
+            return tallies
+
+    def restore(self, tallies):
+        """
+        Put drained tallies back after a flush failed to write them
+
+        Args:
+            tallies (dict): Match id -> [prompt_1 votes, prompt_2 votes], as
+                returned by drain()
+        """
+        votes = sum(sum(tally) for tally in tallies.values())
+        with self._lock:
+            for match_id, (votes_1, votes_2) in tallies.items():
+                tally = self._tallies.setdefault(match_id, [0, 0])
+                tally[0] += votes_1
+                tally[1] += votes_2
+            self._buffered_votes += votes
+            if self._oldest_vote_at is None:
+                self._oldest_vote_at = time.monotonic()
+            self._flushes -= 1
+            self._flushed_votes -= votes
+
+    def start_background_flush(self, app, flush):
+        """
+        Flush due votes from a daemon thread
+
+        Votes are otherwise only flushed by the request that makes the
+        buffer due, so the last votes on a quiet match would wait for the
+        next one.
+
+        Args:
+            app (Flask): Application whose context the flush runs in
+            flush (callable): Writes the buffered tallies, e.g.
+                match_service.flush_votes
+        """
+
+        def run():
+            while True:
+                time.sleep(self.max_age_seconds)
+                if not self.is_due():
+                    continue
+                with app.app_context():
+                    try:
+                        flush()
+                    except Exception as e:
+                        print(f"Vote buffer flush failed: {e}")
+
+        threading.Thread(target=run, name="vote-buffer-flush", daemon=True).start()
+
+    def pending(self, match_id):
+        """Return the buffered [prompt_1, prompt_2] votes for a match"""
+        with self._lock:
+            return list(self._tallies.get(match_id, (0, 0)))
+
+    def clear(self):
+        """Drop buffered votes and reset the counters"""
+        with self._lock:
+            self._tallies = {}
+            self._buffered_votes = 0
+            self._oldest_vote_at = None
+            self._flushes = 0
+            self._flushed_votes = 0
+
+    def stats(self):
+        """Return buffered and flushed vote counters"""
+        with self._lock:
+            return {
+                "buffered_votes": self._buffered_votes,
+                "buffered_matches": len(self._tallies),
+                "max_votes": self.max_votes,
+                "max_age_seconds": self.max_age_seconds,
+                "flushes": self._flushes,
+                "flushed_votes": self._flushed_votes,
+            }
+
+
+# Create a singleton instance for use across the application
+vote_buffer = VoteBuffer()
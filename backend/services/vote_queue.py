@@ -0,0 +1,151 @@
+import os
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+# Constants
+DEFAULT_WORKERS = int(os.getenv("VOTE_QUEUE_WORKERS", 2))
+# A receipt claimed longer ago than this belongs to a worker that died
+DEFAULT_LEASE_SECONDS = float(os.getenv("VOTE_RECEIPT_LEASE_SECONDS", 300))
+
+
+class VoteQueue:
+    """
+    In-process queue of match results applied by background workers
+
+    Results are queued per tournament. A tournament is handled by one
+    worker at a time, which takes everything queued for it as one batch,
+    so results are applied in order and round advancement runs once per
+    batch. Queued receipts are persisted, so resume() can re-queue the
+    ones a stopped process never applied.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self._pending = {}
+        self._ready = deque()
+        self._active = set()
+        self._threads = []
+        self._condition = threading.Condition()
+
+    def enqueue(self, app, tournament_id, receipt_id):
+        """
+        Queue a receipt for a tournament and wake a worker
+
+        Args:
+            app (Flask): Application whose context the worker runs in
+            tournament_id (int): ID of the tournament
+            receipt_id (str): ID of the queued VoteReceipt
+        """
+        key = (app, tournament_id)
+        with self._condition:
+            self._start_workers()
+            self._pending.setdefault(key, []).append(receipt_id)
+            if key not in self._active and key not in self._ready:
+                self._ready.append(key)
+            self._condition.notify_all()
+
+    def resume(self, app):
+        """
+        Re-queue receipts left queued by a previous process
+
+        Every worker process calls this at startup, so receipts another
+        live worker is handling must not be handed out again: only
+        "processing" receipts whose claim is older than lease_seconds go
+        back to "queued". A receipt queued in two processes is still
+        applied once, because workers claim receipts atomically.
+
+        Args:
+            app (Flask): Application to resume receipts for
+        """
+        from database import db
+        from models import VoteReceipt
+
+        with app.app_context():
+            if not db.inspect(db.engine).has_table(VoteReceipt.__tablename__):
+                return
+            stale_before = datetime.now(timezone.utc) - timedelta(
+                seconds=self.lease_seconds
+            )
+            db.session.execute(
+                db.update(VoteReceipt)
+                .filter(
+                    VoteReceipt.status == "processing",
+                    VoteReceipt.claimed_at < stale_before,
+                )
+                .values(status="queued", claimed_at=None)
+            )
+            db.session.commit()
+            receipts = db.session.execute(
+                db.select(VoteReceipt.tournament_id, VoteReceipt.id)
+                .filter_by(status="queued")
+                .order_by(VoteReceipt.created_at, VoteReceipt.id)
+            ).all()
+
+        for tournament_id, receipt_id in receipts:
+            self.enqueue(app, tournament_id, receipt_id)
+
+    def wait_idle(self, timeout=None):
+        """
+        Block until every queued receipt has been processed
+
+        Args:
+            timeout (float, optional): Seconds to wait at most
+
+        Returns:
+            bool: True if the queue is idle
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._active, timeout
+            )
+
+    def stats(self):
+        """Return queued receipt and worker counts"""
+        with self._condition:
+            return {
+                "queued_receipts": sum(len(ids) for ids in self._pending.values()),
+                "queued_tournaments": len(self._pending),
+                "active_tournaments": len(self._active),
+                "workers": len(self._threads),
+            }
+
+    def _start_workers(self):
+        """Start the worker threads on first use (caller holds the lock)"""
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._run,
+                name=f"vote-queue-{len(self._threads) + 1}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _run(self):
+        from services.match_service import match_service
+
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready)
+                key = self._ready.popleft()
+                self._active.add(key)
+                receipt_ids = self._pending.pop(key)
+
+            app, tournament_id = key
+            try:
+                with app.app_context():
+                    match_service.apply_queued_results(tournament_id, receipt_ids)
+            except Exception as e:
+                print(f"Vote queue failed for tournament {tournament_id}: {e}")
+            finally:
+                with self._condition:
+                    self._active.discard(key)
+                    # Results queued while this batch ran go in the next one
+                    if key in self._pending:
+                        self._ready.append(key)
+                    self._condition.notify_all()
+
+
+# Create a singleton instance for use across the application
+vote_queue = VoteQueue()
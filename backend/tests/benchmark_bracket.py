@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Bracket start benchmark
+
+Times POST /api/tournament/<id>/start-bracket for brackets of 2^10 to
+2^16 prompts against a file-backed SQLite database and reports:
+1. Seconds to start the bracket
+2. SQL statements issued (round 1 matches are one bulk INSERT per batch)
+
+Prompts are seeded directly with a bulk insert so only the bracket start
+is measured. Runs in-process with the Flask test client:
+
+    python tests/benchmark_bracket.py --min-exponent 10 --max-exponent 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Allow running as a script from the backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_votes import create_app
+from database import db
+from models import InputQuestion, Prompt, Tournament
+from sqlalchemy import event
+
+
+def seed_tournament(num_prompts):
+    """Create a tournament with num_prompts prompts, bypassing the API"""
+    input_question = InputQuestion(
+        question_text=f"Benchmark question with {num_prompts} prompts"
+    )
+    db.session.add(input_question)
+    db.session.flush()
+    db.session.execute(
+        db.insert(Prompt),
+        [
+            {
+                "input_question_id": input_question.id,
+                "prompt_text": f"Benchmark prompt {i}",
+            }
+            for i in range(num_prompts)
+        ],
+    )
+    tournament = Tournament(input_question_id=input_question.id)
+    db.session.add(tournament)
+    db.session.commit()
+    return tournament.id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--min-exponent", type=int, default=10)
+    parser.add_argument("--max-exponent", type=int, default=16)
+    args = parser.parse_args()
+
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(db_fd)
+    app = create_app(db_path)
+
+    with app.app_context():
+        statements = []
+        event.listen(
+            db.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *rest: statements.append(statement),
+        )
+        client = app.test_client()
+
+        print("🏁 Starting brackets")
+        for exponent in range(args.min_exponent, args.max_exponent + 1):
+            num_prompts = 2**exponent
+            tournament_id = seed_tournament(num_prompts)
+            db.session.remove()
+
+            statements.clear()
+            started = time.perf_counter()
+            response = client.post(f"/api/tournament/{tournament_id}/start-bracket")
+            elapsed = time.perf_counter() - started
+            assert response.status_code == 201, response.get_json()["error"]
+
+            print(
+                f"   2^{exponent} ({num_prompts} prompts): {elapsed:.2f}s, "
+                f"{response.get_json()['total_matches']} matches, "
+                f"{len(statements)} statements"
+            )
+
+    os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    main()
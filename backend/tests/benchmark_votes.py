@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Vote submission benchmark
+
+Plays whole tournaments through POST /api/match/<id>/result against a
+file-backed SQLite database and reports:
+1. Commits per vote (each one is an fsync and a fresh write lock)
+2. Votes per second
+
+Runs in-process with the Flask test client, so no server is needed:
+
+    python tests/benchmark_votes.py --prompts 256 --runs 3
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Allow running as a script from the backend directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import db
+from flask import Flask
+from sqlalchemy import event
+
+
+def create_app(db_path):
+    """Create an app bound to a fresh SQLite file"""
+    app = Flask(__name__)
+    app.config.update(
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
+            "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        }
+    )
+    db.init_app(app)
+
+    from tournament_routes import tournament_bp
+
+    app.register_blueprint(tournament_bp, url_prefix="/api")
+
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def play_tournament(client, num_prompts, commits):
+    """
+    Create, start and play a tournament to completion
+
+    Only the vote requests are timed and counted; setup and status reads
+    are excluded.
+
+    Returns:
+        tuple: (votes, seconds spent voting, commits issued by votes)
+    """
+    response = client.post(
+        "/api/tournament",
+        json={
+            "input_question": f"Benchmark question with {num_prompts} prompts",
+            "custom_prompts": [f"Benchmark prompt {i}" for i in range(num_prompts)],
+            "total_prompts": num_prompts,
+        },
+    )
+    tournament_id = response.get_json()["tournament_id"]
+    client.post(f"/api/tournament/{tournament_id}/start-bracket")
+
+    votes = 0
+    vote_seconds = 0.0
+    vote_commits = 0
+    while True:
+        status = client.get(
+            f"/api/tournament/{tournament_id}/status?rounds=current&fields=status,rounds"
+        ).get_json()
+        if status["status"] == "completed":
+            return votes, vote_seconds, vote_commits
+
+        for matches in status["rounds"].values():
+            for match in matches:
+                if match["status"] != "pending":
+                    continue
+                commits_before = len(commits)
+                started = time.perf_counter()
+                response = client.post(
+                    f"/api/match/{match['match_id']}/result",
+                    json={"winner_id": match["prompt_1_id"]},
+                )
+                vote_seconds += time.perf_counter() - started
+                vote_commits += len(commits) - commits_before
+                assert response.status_code == 200, response.get_json()
+                votes += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--prompts", type=int, default=256)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    db_fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(db_fd)
+    app = create_app(db_path)
+
+    with app.app_context():
+        commits = []
+        event.listen(db.engine, "commit", lambda conn: commits.append(1))
+        client = app.test_client()
+
+        print(f"🗳️  Playing {args.runs} tournament(s) of {args.prompts} prompts")
+        for run in range(1, args.runs + 1):
+            votes, elapsed, vote_commits = play_tournament(
+                client, args.prompts, commits
+            )
+            print(
+                f"   Run {run}: {votes} votes in {elapsed:.2f}s, "
+                f"{votes / elapsed:.0f} votes/s, "
+                f"{vote_commits / votes:.2f} commits/vote"
+            )
+
+    os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    main()
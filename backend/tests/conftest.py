@@ -11,6 +11,7 @@ from dotenv import load_dotenv
 from flask import Flask
 from flask_cors import CORS
 from models import InputQuestion, Match, Prompt, Tournament
+from sqlalchemy import event
 
 # Load environment variables
 load_dotenv()
@@ -54,6 +55,23 @@ def test_app():
 
     app.register_blueprint(tournament_bp, url_prefix="/api")
 
+    # Cached snapshots, buffered votes and stored responses are keyed by ids
+    # that restart in every test db
+    from services.idempotency_store import idempotency_store
+    from services.response_cache import response_cache
+    from services.snapshot_cache import snapshot_cache
+    from services.vote_buffer import vote_buffer
+
+    snapshot_cache.clear()
+    vote_buffer.clear()
+    idempotency_store.clear()
+
+    # Cached test-prompt responses go to a throwaway file, not instance/
+    cache_fd, cache_path = tempfile.mkstemp(suffix=".db")
+    response_cache.close()
+    response_cache.path = cache_path
+    response_cache.clear()
+
     with app.app_context():
         db.create_all()
         yield app
@@ -68,6 +86,9 @@ def test_app():
     # Clean up the temporary database file
     os.close(db_fd)
     os.unlink(db_path)
+    response_cache.close()
+    os.close(cache_fd)
+    os.unlink(cache_path)
 
 
 @pytest.fixture(scope="function")
@@ -107,6 +128,23 @@ def test_app_no_openai():
 
     app.register_blueprint(tournament_bp, url_prefix="/api")
 
+    # Cached snapshots, buffered votes and stored responses are keyed by ids
+    # that restart in every test db
+    from services.idempotency_store import idempotency_store
+    from services.response_cache import response_cache
+    from services.snapshot_cache import snapshot_cache
+    from services.vote_buffer import vote_buffer
+
+    snapshot_cache.clear()
+    vote_buffer.clear()
+    idempotency_store.clear()
+
+    # Cached test-prompt responses go to a throwaway file, not instance/
+    cache_fd, cache_path = tempfile.mkstemp(suffix=".db")
+    response_cache.close()
+    response_cache.path = cache_path
+    response_cache.clear()
+
     with app.app_context():
         db.create_all()
         yield app
@@ -118,6 +156,9 @@ def test_app_no_openai():
     # Cleanup
     os.close(db_fd)
     os.unlink(db_path)
+    response_cache.close()
+    os.close(cache_fd)
+    os.unlink(cache_path)
 
     # Restore original API key
     if original_key:
@@ -197,6 +238,50 @@ def sample_data(app_context):
     }
 
 
+@pytest.fixture(scope="function")
+def create_started_tournament(client):
+    """
+    Return a function that creates a tournament and starts its bracket
+    Call it with the number of custom prompts and any extra creation
+    settings (e.g. voting_mode); it returns the tournament id
+    """
+
+    def create(num_prompts=4, **settings):
+        response = client.post(
+            "/api/tournament",
+            json={
+                "input_question": f"Question with {num_prompts} prompts",
+                "custom_prompts": [f"Prompt variation {i}" for i in range(num_prompts)],
+                "total_prompts": num_prompts,
+                **settings,
+            },
+        )
+        assert response.status_code == 201
+        tournament_id = response.get_json()["tournament_id"]
+
+        response = client.post(f"/api/tournament/{tournament_id}/start-bracket")
+        assert response.status_code == 201
+        return tournament_id
+
+    return create
+
+
+@pytest.fixture(scope="function")
+def query_counter(app_context):
+    """
+    Count SQL statements executed against the test database
+    Returns a list that collects each statement; use len() for the count
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
 @pytest.fixture(autouse=True)
 def prevent_live_server_tests():
     """
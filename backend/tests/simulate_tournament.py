@@ -112,8 +112,10 @@ class TournamentSimulator:
         """Simulate a match by randomly selecting a winner"""
         match_id = match["match_id"]
 
-        # Get the prompt IDs (we need to fetch them from the API)
-        response = requests.get(f"{self.base_url}/prompts")
+        # Only this tournament's prompts, to stay within one page
+        response = requests.get(
+            f"{self.base_url}/prompts", params={"tournament_id": self.tournament_id}
+        )
         if response.status_code != 200:
             print(f"❌ Failed to get prompts: {response.status_code}")
             sys.exit(1)
@@ -151,10 +153,8 @@ class TournamentSimulator:
             result = response.json()
             if result.get("round_completed"):
                 print(f"   ✅ Round {match['round_number']} completed!")
-                if result.get("next_round_created"):
-                    print(
-                        f"   🎯 Round {result['next_round']} created with {len(result['next_round_matches'])} matches"
-                    )
+                if result.get("next_round"):
+                    print(f"   🎯 Round {result['next_round']} is up next")
                 if result.get("tournament_completed"):
                     print(
                         f"   🎉 TOURNAMENT COMPLETED! Winner: '{result['tournament_winner']}'"
@@ -0,0 +1,181 @@
+"""
+Tests for queued match results (Prefer: respond-async) and vote receipts
+"""
+
+import pytest
+from services.vote_queue import vote_queue
+
+ASYNC = {"Prefer": "respond-async"}
+
+
+def _round_matches(client, tournament_id, round_number):
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    return data["rounds"][str(round_number)]
+
+
+def _queue_result(client, match, winner_key="prompt_1_id"):
+    return client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match[winner_key]},
+        headers=ASYNC,
+    )
+
+
+@pytest.mark.unit
+def test_async_result_returns_a_receipt(client, create_started_tournament):
+    tournament_id = create_started_tournament(4)
+    match = _round_matches(client, tournament_id, 1)[0]
+
+    response = _queue_result(client, match)
+
+    assert response.status_code == 202
+    assert response.headers["Preference-Applied"] == "respond-async"
+    receipt = response.get_json()
+    assert receipt["status"] == "queued"
+    assert response.headers["Location"].endswith(
+        f"/api/vote-receipts/{receipt['receipt_id']}"
+    )
+
+    assert vote_queue.wait_idle(timeout=10)
+    receipt = client.get(response.headers["Location"]).get_json()
+    assert receipt["status"] == "applied"
+    assert receipt["result"]["results_stored"] >= 1
+    assert _round_matches(client, tournament_id, 1)[0]["status"] == "completed"
+
+
+@pytest.mark.unit
+def test_queued_round_is_applied_and_advanced(client, create_started_tournament):
+    tournament_id = create_started_tournament(16)
+    matches = _round_matches(client, tournament_id, 1)
+
+    locations = [_queue_result(client, match).headers["Location"] for match in matches]
+    assert vote_queue.wait_idle(timeout=10)
+
+    receipts = [client.get(location).get_json() for location in locations]
+    assert all(receipt["status"] == "applied" for receipt in receipts)
+    assert len(_round_matches(client, tournament_id, 2)) == 4
+    status = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    assert status["current_round"] == 2
+    assert status["progress"]["completed_matches"] == 8
+
+
+@pytest.mark.unit
+def test_second_queued_result_for_a_match_is_rejected(
+    client, create_started_tournament
+):
+    tournament_id = create_started_tournament(4)
+    match = _round_matches(client, tournament_id, 1)[0]
+
+    first = _queue_result(client, match).headers["Location"]
+    second = _queue_result(client, match, "prompt_2_id").headers["Location"]
+    assert vote_queue.wait_idle(timeout=10)
+
+    assert client.get(first).get_json()["status"] == "applied"
+    rejected = client.get(second).get_json()
+    assert rejected["status"] == "rejected"
+    assert rejected["error"] == "Match already completed"
+    assert _round_matches(client, tournament_id, 1)[0]["winner"] == match["prompt_1"]
+
+
+@pytest.mark.unit
+def test_async_result_checks_participants_up_front(client, create_started_tournament):
+    tournament_id = create_started_tournament(4)
+    match = _round_matches(client, tournament_id, 1)[0]
+
+    response = client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": 999999},
+        headers=ASYNC,
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_unknown_receipt_is_404(client):
+    assert client.get("/api/vote-receipts/does-not-exist").status_code == 404
+
+
+@pytest.mark.unit
+def test_receipt_applied_twice_keeps_its_outcome(client, create_started_tournament):
+    from services.match_service import match_service
+
+    tournament_id = create_started_tournament(4)
+    match = _round_matches(client, tournament_id, 1)[0]
+    location = _queue_result(client, match).headers["Location"]
+    assert vote_queue.wait_idle(timeout=10)
+    receipt_id = client.get(location).get_json()["receipt_id"]
+
+    # e.g. the same receipt re-queued by resume() in another worker
+    match_service.apply_queued_results(tournament_id, [receipt_id])
+
+    receipt = client.get(location).get_json()
+    assert receipt["status"] == "applied"
+    assert receipt["error"] is None
+
+
+def _add_receipt(tournament_id, match, status, claimed_at=None):
+    from database import db
+    from models import VoteReceipt
+
+    receipt = VoteReceipt(
+        id=f"receipt-{match['match_id']}",
+        tournament_id=tournament_id,
+        match_id=match["match_id"],
+        winner_id=match["prompt_1_id"],
+        status=status,
+        claimed_at=claimed_at,
+    )
+    db.session.add(receipt)
+    db.session.commit()
+    return receipt.id
+
+
+@pytest.mark.unit
+def test_resume_only_requeues_stale_claims(client, test_app, create_started_tournament):
+    from datetime import datetime, timedelta, timezone
+
+    tournament_id = create_started_tournament(4)
+    fresh_match, stale_match = _round_matches(client, tournament_id, 1)
+    now = datetime.now(timezone.utc)
+    fresh = _add_receipt(tournament_id, fresh_match, "processing", now)
+    stale = _add_receipt(
+        tournament_id, stale_match, "processing", now - timedelta(hours=1)
+    )
+
+    vote_queue.resume(test_app)
+    assert vote_queue.wait_idle(timeout=10)
+
+    assert client.get(f"/api/vote-receipts/{fresh}").get_json()["status"] == (
+        "processing"
+    )
+    assert client.get(f"/api/vote-receipts/{stale}").get_json()["status"] == ("applied")
+
+
+@pytest.mark.unit
+def test_background_work_starts_on_the_first_request_not_on_import(monkeypatch):
+    """Importing the app (e.g. for "flask db upgrade") must not touch the db"""
+    import importlib
+    import sys
+
+    from services.job_queue import job_queue
+    from services.vote_buffer import vote_buffer
+    from services.vote_queue import vote_queue
+
+    started = []
+    monkeypatch.setattr(vote_queue, "resume", lambda app: started.append("votes"))
+    monkeypatch.setattr(job_queue, "resume", lambda app: started.append("jobs"))
+    monkeypatch.setattr(
+        vote_buffer,
+        "start_background_flush",
+        lambda app, flush: started.append("flush"),
+    )
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    app_module = importlib.import_module("app")
+    assert started == []
+
+    client = app_module.app.test_client()
+    client.get("/")
+    client.get("/")
+
+    assert started == ["votes", "jobs", "flush"]
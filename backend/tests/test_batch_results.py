@@ -0,0 +1,135 @@
+"""
+Tests for the batch match result endpoint
+"""
+
+import pytest
+
+
+def _current_round(client, tournament_id):
+    data = client.get(
+        f"/api/tournament/{tournament_id}/status?rounds=current"
+    ).get_json()
+    return data, [m for ms in data["rounds"].values() for m in ms]
+
+
+def _results_for(matches):
+    return [
+        {"match_id": match["match_id"], "winner_id": match["prompt_1_id"]}
+        for match in matches
+        if match["status"] == "pending"
+    ]
+
+
+@pytest.mark.unit
+def test_batch_completes_a_round_and_advances_once(
+    client, query_counter, create_started_tournament
+):
+    tournament_id = create_started_tournament(16)
+    _, matches = _current_round(client, tournament_id)
+
+    query_counter.clear()
+    response = client.post(
+        f"/api/tournament/{tournament_id}/results", json=_results_for(matches)
+    )
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["results_stored"] == 8
+    assert data["rounds_completed"] == [1]
+    assert data["next_round"] == 2
+    assert data["tournament_completed"] is False
+    # Start and eight results each get their own version
+    assert data["version"] == 10
+    # Round 2 was laid out at the start, so the completed round is never read
+    assert not [sql for sql in query_counter if " matches.round_number = " in sql]
+
+    status, round_2 = _current_round(client, tournament_id)
+    assert status["current_round"] == 2
+    assert len(round_2) == 4
+    assert status["progress"]["completed_matches"] == 8
+
+
+@pytest.mark.unit
+def test_batch_plays_a_tournament_to_completion(client, create_started_tournament):
+    tournament_id = create_started_tournament(11)
+
+    while True:
+        status, matches = _current_round(client, tournament_id)
+        if status["status"] == "completed":
+            break
+        response = client.post(
+            f"/api/tournament/{tournament_id}/results", json=_results_for(matches)
+        )
+        assert response.status_code == 200
+
+    assert response.get_json()["tournament_completed"] is True
+    assert status["winner"] is not None
+    assert status["progress"]["completion_percentage"] == 100.0
+
+    changes = client.get(f"/api/tournament/{tournament_id}/changes?since=1")
+    assert changes.get_json()["full_resync"] is False
+    assert len(changes.get_json()["matches"]) == 10
+
+
+@pytest.mark.unit
+def test_batch_updates_prompt_metadata(client, app_context, create_started_tournament):
+    from models import PromptMetaData
+
+    tournament_id = create_started_tournament(4)
+    _, matches = _current_round(client, tournament_id)
+    client.post(f"/api/tournament/{tournament_id}/results", json=_results_for(matches))
+
+    counts = {
+        row.prompt_id: (row.win_count, row.loss_count)
+        for row in PromptMetaData.query.filter_by(tournament_id=tournament_id)
+    }
+    for match in matches:
+        assert counts[match["prompt_1_id"]] == (1, 0)
+        assert counts[match["prompt_2_id"]] == (0, 1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda results, matches: results.append(dict(results[0])),
+        lambda results, matches: results[-1].update(winner_id=999999),
+        lambda results, matches: results[-1].update(match_id=999999),
+        lambda results, matches: results[-1].update(winner_id="1"),
+    ],
+    ids=["duplicate", "wrong-winner", "unknown-match", "bad-type"],
+)
+def test_invalid_batch_stores_nothing(client, mutate, create_started_tournament):
+    tournament_id = create_started_tournament(8)
+    status, matches = _current_round(client, tournament_id)
+    results = _results_for(matches)
+    mutate(results, matches)
+
+    response = client.post(f"/api/tournament/{tournament_id}/results", json=results)
+
+    assert response.status_code == 400
+    after, _ = _current_round(client, tournament_id)
+    assert after["version"] == status["version"]
+    assert after["progress"]["completed_matches"] == 0
+
+
+@pytest.mark.unit
+def test_batch_rejects_completed_matches(client, create_started_tournament):
+    tournament_id = create_started_tournament(4)
+    _, matches = _current_round(client, tournament_id)
+    results = _results_for(matches)
+    client.post(f"/api/match/{matches[0]['match_id']}/result", json=results[0])
+
+    response = client.post(f"/api/tournament/{tournament_id}/results", json=results)
+
+    assert response.status_code == 400
+    assert "already completed" in response.get_json()["error"]
+
+
+@pytest.mark.unit
+def test_batch_for_missing_tournament_is_404(client):
+    response = client.post(
+        "/api/tournament/999/results", json=[{"match_id": 1, "winner_id": 1}]
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,70 @@
+"""
+Tests for ETag / If-None-Match handling on tournament read endpoints
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("endpoint", ["status", "matches"])
+def test_matching_etag_returns_304(client, endpoint, create_started_tournament):
+    tournament_id = create_started_tournament()
+    url = f"/api/tournament/{tournament_id}/{endpoint}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert not etag.startswith("W/")
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.unit
+def test_304_does_not_build_payload(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    url = f"/api/tournament/{tournament_id}/status"
+    etag = client.get(url).headers["ETag"]
+
+    from services.snapshot_cache import snapshot_cache
+
+    before = snapshot_cache.stats()
+    client.get(url, headers={"If-None-Match": etag})
+    after = snapshot_cache.stats()
+
+    assert after["hits"] == before["hits"]
+    assert after["misses"] == before["misses"]
+
+
+@pytest.mark.unit
+def test_etag_changes_after_match_result(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    url = f"/api/tournament/{tournament_id}/status"
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    match = response.get_json()["rounds"]["1"][0]
+
+    client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_1_id"]},
+    )
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.get_json()["progress"]["completed_matches"] == 1
+
+
+@pytest.mark.unit
+def test_round_filter_has_its_own_etag(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    url = f"/api/tournament/{tournament_id}/matches"
+
+    all_etag = client.get(url).headers["ETag"]
+    round_etag = client.get(f"{url}?round=1").headers["ETag"]
+
+    assert all_etag != round_etag
+    response = client.get(f"{url}?round=1", headers={"If-None-Match": all_etag})
+    assert response.status_code == 200
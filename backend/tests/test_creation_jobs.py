@@ -0,0 +1,152 @@
+"""
+Tests for background tournament creation jobs (Prefer: respond-async)
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from database import db
+from models import CreationJob, Tournament
+from services.job_queue import job_queue
+
+ASYNC = {"Prefer": "respond-async"}
+
+
+def _creation_request(num_prompts=4):
+    return {
+        "input_question": f"Background question with {num_prompts} prompts",
+        "custom_prompts": [f"Background prompt {i}" for i in range(num_prompts)],
+        "total_prompts": num_prompts,
+    }
+
+
+@pytest.mark.unit
+def test_async_creation_returns_a_job(client):
+    response = client.post("/api/tournament", json=_creation_request(), headers=ASYNC)
+
+    assert response.status_code == 202
+    assert response.headers["Preference-Applied"] == "respond-async"
+    job = response.get_json()
+    assert job["status"] == "queued"
+    assert response.headers["Location"].endswith(f"/api/jobs/{job['job_id']}")
+
+    assert job_queue.wait_idle(timeout=10)
+    job = client.get(response.headers["Location"]).get_json()
+    assert job["status"] == "completed"
+    assert job["result"]["prompts"] == _creation_request()["custom_prompts"]
+    tournament_id = job["tournament_id"]
+    assert job["result"]["tournament_id"] == tournament_id
+
+    status = client.get(f"/api/tournament/{tournament_id}/status")
+    assert status.status_code == 200
+    assert status.get_json()["total_prompts"] == 4
+
+
+@pytest.mark.unit
+def test_async_creation_validates_up_front(client):
+    request_data = _creation_request()
+    request_data["total_prompts"] = 1
+
+    response = client.post("/api/tournament", json=request_data, headers=ASYNC)
+
+    assert response.status_code == 400
+    assert db.session.query(CreationJob).count() == 0
+
+
+@pytest.mark.unit
+def test_failed_job_records_the_error(client, monkeypatch):
+    from services.tournament_service import tournament_service
+
+    def failing_create(data):
+        raise ValueError("simulated failure")
+
+    monkeypatch.setattr(tournament_service, "_create_tournament", failing_create)
+    response = client.post("/api/tournament", json=_creation_request(), headers=ASYNC)
+    assert job_queue.wait_idle(timeout=10)
+
+    job = client.get(response.headers["Location"]).get_json()
+    assert job["status"] == "failed"
+    assert job["error"] == "simulated failure"
+    assert job["tournament_id"] is None
+    assert db.session.query(Tournament).count() == 0
+
+
+@pytest.mark.unit
+def test_resume_reruns_unfinished_jobs(client, test_app):
+    now = datetime.now(timezone.utc)
+    db.session.add_all(
+        [
+            CreationJob(
+                id="interrupted",
+                payload=_creation_request(),
+                status="running",
+                claimed_at=now - timedelta(seconds=job_queue.lease_seconds + 1),
+                worker_id="gone:1",
+            ),
+            # Still leased by a live worker, which will finish it
+            CreationJob(
+                id="in-progress",
+                payload=_creation_request(),
+                status="running",
+                claimed_at=now,
+                worker_id="alive:1",
+            ),
+            CreationJob(id="finished", payload=_creation_request(), status="completed"),
+        ]
+    )
+    db.session.commit()
+
+    job_queue.resume(test_app)
+    assert job_queue.wait_idle(timeout=10)
+
+    assert client.get("/api/jobs/interrupted").get_json()["status"] == "completed"
+    assert client.get("/api/jobs/in-progress").get_json()["status"] == "running"
+    assert client.get("/api/jobs/finished").get_json()["result"] is None
+    assert db.session.query(Tournament).count() == 1
+
+
+@pytest.mark.unit
+def test_job_taken_over_after_its_lease_expired_is_not_committed(
+    client, test_app, monkeypatch
+):
+    from services.tournament_service import tournament_service
+
+    db.session.add(CreationJob(id="slow", payload=_creation_request()))
+    db.session.commit()
+    create_tournament = tournament_service._create_tournament
+
+    def slow_create(data):
+        # Another worker reclaims the job while this one is still creating
+        with test_app.app_context():
+            db.session.execute(
+                db.update(CreationJob)
+                .filter_by(id="slow")
+                .values(claimed_at=datetime.now(timezone.utc), worker_id="other:1")
+            )
+            db.session.commit()
+        return create_tournament(data)
+
+    monkeypatch.setattr(tournament_service, "_create_tournament", slow_create)
+    job_queue.submit(test_app, "slow")
+    assert job_queue.wait_idle(timeout=10)
+
+    assert client.get("/api/jobs/slow").get_json()["status"] == "running"
+    assert db.session.query(Tournament).count() == 0
+
+
+@pytest.mark.unit
+def test_job_submitted_twice_runs_once(client, test_app):
+    db.session.add(CreationJob(id="twice", payload=_creation_request()))
+    db.session.commit()
+
+    job_queue.submit(test_app, "twice")
+    job_queue.submit(test_app, "twice")
+    assert job_queue.wait_idle(timeout=10)
+
+    assert client.get("/api/jobs/twice").get_json()["status"] == "completed"
+    assert db.session.query(Tournament).count() == 1
+
+
+@pytest.mark.unit
+def test_unknown_job_is_404(client):
+    assert client.get("/api/jobs/does-not-exist").status_code == 404
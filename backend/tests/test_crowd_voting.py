@@ -0,0 +1,247 @@
+"""
+Tests for crowd voting: buffered vote tallies and quorum/margin closing
+"""
+
+from functools import partial
+
+import pytest
+from services.vote_buffer import VoteBuffer, vote_buffer
+
+
+@pytest.fixture
+def create_crowd_tournament(create_started_tournament):
+    """Create and start a crowd voting tournament with the given settings"""
+    return partial(create_started_tournament, voting_mode="crowd")
+
+
+def _first_match(client, tournament_id):
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    return data["rounds"]["1"][0]
+
+
+def _vote(client, match, prompt_key, times=1):
+    responses = []
+    for _ in range(times):
+        response = client.post(
+            f"/api/match/{match['match_id']}/vote",
+            json={"prompt_id": match[prompt_key]},
+        )
+        assert response.status_code == 202
+        responses.append(response.get_json())
+    return responses
+
+
+@pytest.mark.unit
+class TestVoteBuffer:
+    """Test the in-memory accumulator on its own"""
+
+    def test_sums_votes_per_match_until_drained(self):
+        buffer = VoteBuffer(max_votes=100, max_age_seconds=60)
+        buffer.add(1, 0)
+        buffer.add(1, 0)
+        buffer.add(1, 1)
+        buffer.add(2, 1)
+
+        assert buffer.pending(1) == [2, 1]
+        assert buffer.drain() == {1: [2, 1], 2: [0, 1]}
+        assert buffer.pending(1) == [0, 0]
+        assert buffer.stats()["flushed_votes"] == 4
+
+    def test_restore_puts_drained_votes_back(self):
+        buffer = VoteBuffer(max_votes=100, max_age_seconds=60)
+        buffer.add(1, 0)
+        tallies = buffer.drain()
+        buffer.add(1, 1)
+
+        buffer.restore(tallies)
+
+        assert buffer.pending(1) == [1, 1]
+        assert buffer.stats()["buffered_votes"] == 2
+        assert buffer.stats()["flushed_votes"] == 0
+
+    def test_due_by_count(self):
+        buffer = VoteBuffer(max_votes=3, max_age_seconds=60)
+
+        assert buffer.add(1, 0) is False
+        assert buffer.add(1, 0) is False
+        assert buffer.add(1, 1) is True
+
+    def test_due_by_age(self):
+        buffer = VoteBuffer(max_votes=100, max_age_seconds=0)
+
+        assert buffer.is_due() is False
+        assert buffer.add(1, 0) is True
+
+
+@pytest.mark.unit
+def test_crowd_settings_are_reported(client, create_crowd_tournament):
+    tournament_id = create_crowd_tournament(vote_margin=3)
+
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+
+    assert data["voting"] == {"mode": "crowd", "quorum": None, "margin": 3}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "settings",
+    [{"voting_mode": "poll"}, {"voting_mode": "crowd", "vote_quorum": 0}],
+)
+def test_invalid_voting_settings_are_rejected(client, settings):
+    response = client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Question",
+            "custom_prompts": ["A", "B"],
+            "total_prompts": 2,
+            **settings,
+        },
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_votes_are_buffered_not_written(
+    client, query_counter, monkeypatch, create_crowd_tournament
+):
+    monkeypatch.setattr(vote_buffer, "max_votes", 1000)
+    monkeypatch.setattr(vote_buffer, "max_age_seconds", 3600)
+    tournament_id = create_crowd_tournament(vote_quorum=50)
+    match = _first_match(client, tournament_id)
+
+    query_counter.clear()
+    _vote(client, match, "prompt_1_id", times=7)
+    _vote(client, match, "prompt_2_id", times=2)
+
+    assert not any(sql.startswith(("UPDATE", "INSERT")) for sql in query_counter)
+    tally = client.get(f"/api/match/{match['match_id']}/votes").get_json()
+    assert tally["prompt_1_votes"] == 7
+    assert tally["prompt_2_votes"] == 2
+    assert tally["buffered_votes"] == 9
+
+
+@pytest.mark.unit
+def test_flush_writes_tallies_in_one_statement(
+    client, query_counter, monkeypatch, create_crowd_tournament
+):
+    monkeypatch.setattr(vote_buffer, "max_votes", 6)
+    tournament_id = create_crowd_tournament(vote_quorum=50)
+    match = _first_match(client, tournament_id)
+
+    _vote(client, match, "prompt_1_id", times=5)
+    query_counter.clear()
+    _vote(client, match, "prompt_2_id")
+
+    tally_updates = [sql for sql in query_counter if sql.startswith("UPDATE matches")]
+    assert len(tally_updates) == 1
+    tally = client.get(f"/api/match/{match['match_id']}/votes").get_json()
+    assert (tally["prompt_1_votes"], tally["prompt_2_votes"]) == (5, 1)
+    assert tally["buffered_votes"] == 0
+    assert tally["status"] == "pending"
+
+
+@pytest.mark.unit
+def test_quorum_closes_the_match(client, monkeypatch, create_crowd_tournament):
+    monkeypatch.setattr(vote_buffer, "max_votes", 5)
+    tournament_id = create_crowd_tournament(vote_quorum=5)
+    match = _first_match(client, tournament_id)
+
+    _vote(client, match, "prompt_2_id", times=1)
+    responses = _vote(client, match, "prompt_1_id", times=4)
+
+    assert responses[-1]["closed_matches"] == [match["match_id"]]
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    closed = data["rounds"]["1"][0]
+    assert closed["status"] == "completed"
+    assert closed["winner"] == match["prompt_1"]
+    assert data["progress"]["completed_matches"] == 1
+
+
+@pytest.mark.unit
+def test_margin_closes_the_match_before_quorum(
+    client, monkeypatch, create_crowd_tournament
+):
+    monkeypatch.setattr(vote_buffer, "max_votes", 1)
+    tournament_id = create_crowd_tournament(vote_quorum=100, vote_margin=3)
+    match = _first_match(client, tournament_id)
+
+    responses = _vote(client, match, "prompt_2_id", times=3)
+
+    assert [r["closed_matches"] for r in responses] == [[], [], [match["match_id"]]]
+    response = client.post(
+        f"/api/match/{match['match_id']}/vote", json={"prompt_id": match["prompt_2_id"]}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_tie_at_quorum_stays_open(client, monkeypatch, create_crowd_tournament):
+    monkeypatch.setattr(vote_buffer, "max_votes", 1)
+    tournament_id = create_crowd_tournament(vote_quorum=2)
+    match = _first_match(client, tournament_id)
+
+    _vote(client, match, "prompt_1_id")
+    responses = _vote(client, match, "prompt_2_id")
+    assert responses[-1]["closed_matches"] == []
+
+    responses = _vote(client, match, "prompt_2_id")
+    assert responses[-1]["closed_matches"] == [match["match_id"]]
+
+
+@pytest.mark.unit
+def test_single_mode_rejects_crowd_votes(client, create_started_tournament):
+    tournament_id = create_started_tournament(2)
+    match = _first_match(client, tournament_id)
+
+    response = client.post(
+        f"/api/match/{match['match_id']}/vote", json={"prompt_id": match["prompt_1_id"]}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_crowd_matches_reject_direct_results(client, create_crowd_tournament):
+    tournament_id = create_crowd_tournament(vote_quorum=50)
+    match = _first_match(client, tournament_id)
+    result = {"match_id": match["match_id"], "winner_id": match["prompt_1_id"]}
+
+    responses = [
+        client.post(f"/api/match/{match['match_id']}/result", json=result),
+        client.post(
+            f"/api/match/{match['match_id']}/result",
+            json=result,
+            headers={"Prefer": "respond-async"},
+        ),
+        client.post(f"/api/tournament/{tournament_id}/results", json=[result]),
+    ]
+
+    assert [response.status_code for response in responses] == [400, 400, 400]
+    for response in responses:
+        assert "decided by votes" in response.get_json()["error"]
+    assert _first_match(client, tournament_id)["status"] == "pending"
+
+
+@pytest.mark.unit
+def test_failed_flush_keeps_the_votes(client, monkeypatch, create_crowd_tournament):
+    from database import db
+    from services.match_service import match_service
+
+    monkeypatch.setattr(vote_buffer, "max_votes", 1000)
+    tournament_id = create_crowd_tournament(vote_quorum=50)
+    match = _first_match(client, tournament_id)
+    _vote(client, match, "prompt_1_id", times=3)
+
+    def failing_commit():
+        raise RuntimeError("database is locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(db.session, "commit", failing_commit)
+        with pytest.raises(RuntimeError):
+            match_service.flush_votes()
+
+    assert vote_buffer.pending(match["match_id"]) == [3, 0]
+    match_service.flush_votes()
+    tally = client.get(f"/api/match/{match['match_id']}/votes").get_json()
+    assert (tally["prompt_1_votes"], tally["buffered_votes"]) == (3, 0)
@@ -0,0 +1,203 @@
+"""
+Tests for Idempotency-Key handling on match result submission
+"""
+
+import pytest
+from services.idempotency_store import (
+    IN_PROGRESS,
+    MISMATCH,
+    REPLAY,
+    STARTED,
+    IdempotencyStore,
+)
+
+
+def _first_match(client, tournament_id):
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    return data["rounds"]["1"][0]
+
+
+def _submit(client, match, key, winner_key="prompt_1_id"):
+    return client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match[winner_key]},
+        headers={"Idempotency-Key": key},
+    )
+
+
+@pytest.mark.unit
+class TestIdempotencyStore:
+    """Test the TTL-evicted store against the test database"""
+
+    def test_replays_finished_response(self, app_context):
+        store = IdempotencyStore(ttl_seconds=60, max_entries=10)
+        fingerprint = store.fingerprint(b"{}")
+        key = ("POST", "/a", "k")
+
+        assert store.begin(key, fingerprint) == (STARTED, None)
+        assert store.begin(key, fingerprint) == (IN_PROGRESS, None)
+        store.finish(key, (200, {}, b"ok"))
+
+        assert store.begin(key, fingerprint) == (REPLAY, (200, {}, b"ok"))
+        assert store.begin(key, store.fingerprint(b"[]")) == (MISMATCH, None)
+        assert store.begin(("PUT", "/a", "k"), fingerprint) == (STARTED, None)
+        assert store.stats()["replays"] == 1
+
+    def test_keys_are_shared_between_workers(self, app_context):
+        # Two stores stand in for the same key reaching two worker processes
+        first, second = IdempotencyStore(), IdempotencyStore()
+        fingerprint = first.fingerprint(b"{}")
+        key = ("POST", "/a", "k")
+
+        assert first.begin(key, fingerprint) == (STARTED, None)
+        assert second.begin(key, fingerprint) == (IN_PROGRESS, None)
+        first.finish(key, (201, {"Location": "/b"}, b"ok"))
+
+        assert second.begin(key, fingerprint) == (
+            REPLAY,
+            (201, {"Location": "/b"}, b"ok"),
+        )
+        assert second.begin(key, second.fingerprint(b"[]")) == (MISMATCH, None)
+
+    def test_abandoned_key_can_be_claimed_again(self, app_context):
+        first, second = IdempotencyStore(), IdempotencyStore()
+        fingerprint = first.fingerprint(b"{}")
+        key = ("POST", "/a", "k")
+
+        first.begin(key, fingerprint)
+        first.abandon(key)
+
+        assert second.begin(key, fingerprint) == (STARTED, None)
+
+    def test_stale_claim_is_taken_over(self, app_context):
+        now = [1_000_000.0]
+        first, second = (
+            IdempotencyStore(lease_seconds=60, clock=lambda: now[0]) for _ in range(2)
+        )
+        fingerprint = first.fingerprint(b"{}")
+        key = ("POST", "/a", "k")
+        first.begin(key, fingerprint)
+        now[0] += 59
+        assert second.begin(key, fingerprint) == (IN_PROGRESS, None)
+
+        # The first worker died and its lease has run out
+        now[0] += 1
+        assert second.begin(key, fingerprint) == (STARTED, None)
+        assert first.begin(key, fingerprint) == (IN_PROGRESS, None)
+        # A late response from the old claim does not displace the new one
+        first.finish(key, (200, {}, b"old"))
+        first.abandon(key)
+        second.finish(key, (200, {}, b"new"))
+
+        assert first.begin(key, fingerprint) == (REPLAY, (200, {}, b"new"))
+
+    def test_entries_expire(self, app_context):
+        now = [1_000_000.0]
+        store = IdempotencyStore(ttl_seconds=3600, max_entries=2, clock=lambda: now[0])
+        fingerprint = store.fingerprint(b"")
+        for name in ("a", "b", "c"):
+            key = ("POST", "/a", name)
+            store.begin(key, fingerprint)
+            store.finish(key, (200, {}, b""))
+
+        assert store.stats()["entries"] == 3
+        assert store.stats()["memory_entries"] == 2
+        now[0] += 3599
+        assert store.stats()["entries"] == 3
+        now[0] += 1
+        assert store.stats()["entries"] == 0
+        assert store.begin(("POST", "/a", "a"), fingerprint) == (STARTED, None)
+        assert store.stats()["evictions"] == 3
+
+
+@pytest.mark.unit
+def test_retry_replays_the_original_response(
+    client, query_counter, create_started_tournament
+):
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+
+    first = _submit(client, match, "retry-1")
+    query_counter.clear()
+    retry = _submit(client, match, "retry-1")
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.get_json() == first.get_json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert query_counter == []
+
+
+@pytest.mark.unit
+def test_new_key_still_hits_the_match(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+
+    assert _submit(client, match, "first").status_code == 200
+    response = _submit(client, match, "second")
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Match already completed"
+
+
+@pytest.mark.unit
+def test_client_errors_are_replayed(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+    _submit(client, match, "first")
+
+    rejected = _submit(client, match, "late")
+    retry = _submit(client, match, "late")
+
+    assert rejected.status_code == retry.status_code == 400
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
+
+@pytest.mark.unit
+def test_key_reused_for_another_body_is_rejected(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+
+    assert _submit(client, match, "shared").status_code == 200
+    response = _submit(client, match, "shared", "prompt_2_id")
+
+    assert response.status_code == 422
+
+
+@pytest.mark.unit
+def test_server_errors_are_not_stored(client, monkeypatch, create_started_tournament):
+    from services.match_service import match_service
+
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+    store_match_result = match_service.store_match_result
+
+    def failing_store(*args):
+        raise RuntimeError("simulated failure")
+
+    monkeypatch.setattr(match_service, "store_match_result", failing_store)
+    assert _submit(client, match, "flaky").status_code == 500
+
+    monkeypatch.setattr(match_service, "store_match_result", store_match_result)
+    response = _submit(client, match, "flaky")
+
+    assert response.status_code == 200
+    assert "Idempotent-Replayed" not in response.headers
+
+
+@pytest.mark.unit
+def test_store_errors_are_json(client, monkeypatch, create_started_tournament):
+    from services.idempotency_store import idempotency_store
+    from sqlalchemy.exc import OperationalError
+
+    tournament_id = create_started_tournament()
+    match = _first_match(client, tournament_id)
+
+    def failing_begin(*args):
+        raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(idempotency_store, "begin", failing_begin)
+    response = _submit(client, match, "locked")
+
+    assert response.status_code == 500
+    assert response.get_json() == {"error": "Internal server error"}
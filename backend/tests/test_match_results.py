@@ -0,0 +1,245 @@
+"""
+Tests for match result submission and its transaction boundaries
+"""
+
+import threading
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+
+
+def _pending_matches(client, tournament_id):
+    data = client.get(
+        f"/api/tournament/{tournament_id}/status?rounds=current&fields=rounds"
+    ).get_json()
+    return [
+        match
+        for matches in data["rounds"].values()
+        for match in matches
+        if match["status"] == "pending"
+    ]
+
+
+def _vote(client, match):
+    return client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_1_id"]},
+    )
+
+
+@pytest.mark.unit
+def test_every_vote_commits_once(client, app_context, create_started_tournament):
+    """Plain, round-advancing and tournament-completing votes each commit once"""
+    from database import db
+
+    tournament_id = create_started_tournament(5)
+    commits = []
+
+    def on_commit(conn):
+        commits.append(1)
+
+    event.listen(db.engine, "commit", on_commit)
+    try:
+        outcomes = []
+        while matches := _pending_matches(client, tournament_id):
+            for match in matches:
+                commits.clear()
+                response = _vote(client, match)
+                assert response.status_code == 200
+                assert len(commits) == 1
+                outcomes.append(response.get_json())
+    finally:
+        event.remove(db.engine, "commit", on_commit)
+
+    assert any("next_round" in outcome for outcome in outcomes)
+    assert outcomes[-1]["tournament_completed"] is True
+
+
+@pytest.mark.unit
+def test_failed_completion_rolls_back_the_vote(
+    client, app_context, monkeypatch, create_started_tournament
+):
+    """A failure while completing the tournament leaves the vote unrecorded"""
+    from database import db
+    from models import Match, Tournament
+    from services.change_log_service import change_log_service
+
+    tournament_id = create_started_tournament(2)
+    (match,) = _pending_matches(client, tournament_id)
+    version = client.get(f"/api/tournament/{tournament_id}/status").get_json()[
+        "version"
+    ]
+
+    record = change_log_service.record
+
+    def failing_record(tournament, change_type, data):
+        if change_type == "tournament_completed":
+            raise RuntimeError("simulated failure")
+        record(tournament, change_type, data)
+
+    monkeypatch.setattr(change_log_service, "record", failing_record)
+    response = _vote(client, match)
+
+    assert response.status_code == 500
+    # The request shares this test's app context; end its session as teardown would
+    db.session.rollback()
+    stored = db.session.get(Match, match["match_id"])
+    assert stored.status == "pending"
+    assert stored.winner_id is None
+    tournament = db.session.get(Tournament, tournament_id)
+    assert tournament.version == version
+    assert tournament.completed_matches == 0
+
+
+@pytest.mark.integration
+def test_concurrent_votes_on_one_round(test_app, create_started_tournament):
+    """
+    Hammer every match of a round from many threads at once
+
+    Each match gets two conflicting votes. Exactly one vote per match may
+    win, and the next round must be created exactly once.
+    """
+    from database import db
+    from models import Match, Tournament, TournamentChange
+
+    client = test_app.test_client()
+    tournament_id = create_started_tournament(16)
+    matches = _pending_matches(client, tournament_id)
+    assert len(matches) == 8
+
+    votes = [(match, match["prompt_1_id"]) for match in matches] + [
+        (match, match["prompt_2_id"]) for match in matches
+    ]
+    barrier = threading.Barrier(len(votes))
+    statuses = []
+    statuses_lock = threading.Lock()
+
+    def cast_vote(match, winner_id):
+        # Each thread gets its own client, app context and database session
+        thread_client = test_app.test_client()
+        barrier.wait()
+        response = thread_client.post(
+            f"/api/match/{match['match_id']}/result", json={"winner_id": winner_id}
+        )
+        with statuses_lock:
+            statuses.append((match["match_id"], response.status_code))
+
+    threads = [threading.Thread(target=cast_vote, args=vote) for vote in votes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    accepted = Counter(match_id for match_id, code in statuses if code == 200)
+    assert sorted(code for _, code in statuses) == [200] * 8 + [400] * 8
+    assert all(count == 1 for count in accepted.values())
+
+    tournament = db.session.get(Tournament, tournament_id)
+    round_2 = Match.query.filter_by(tournament_id=tournament_id, round_number=2).all()
+    assert len(round_2) == 4
+    assert tournament.current_round == 2
+    assert tournament.completed_matches == 8
+    assert tournament.total_matches == 15
+    # Start and eight results, each logged once
+    assert tournament.version == 10
+    assert TournamentChange.query.filter_by(tournament_id=tournament_id).count() == 9
+
+
+@pytest.mark.unit
+def test_prompt_metadata_is_precreated_and_blindly_incremented(
+    client, query_counter, create_started_tournament
+):
+    """Bracket start creates every counter row; votes only UPDATE them"""
+    from models import PromptMetaData
+
+    tournament_id = create_started_tournament(4)
+    rows = PromptMetaData.query.filter_by(tournament_id=tournament_id).all()
+    assert len(rows) == 4
+    assert all(row.win_count == 0 and row.loss_count == 0 for row in rows)
+
+    match = _pending_matches(client, tournament_id)[0]
+    query_counter.clear()
+    assert _vote(client, match).status_code == 200
+
+    metadata_sql = [sql for sql in query_counter if "prompt_metadata" in sql]
+    assert len(metadata_sql) == 2
+    assert all(sql.startswith("UPDATE") for sql in metadata_sql)
+
+    counts = {
+        row.prompt_id: (row.win_count, row.loss_count)
+        for row in PromptMetaData.query.filter_by(tournament_id=tournament_id)
+    }
+    assert counts[match["prompt_1_id"]] == (1, 0)
+    assert counts[match["prompt_2_id"]] == (0, 1)
+
+
+@pytest.mark.unit
+def test_vote_checks_round_completion_without_loading_the_round(
+    client, query_counter, create_started_tournament
+):
+    """No vote reads the round's matches; the next round is already laid out"""
+    from models import TournamentRound
+
+    tournament_id = create_started_tournament(8)
+    matches = _pending_matches(client, tournament_id)
+
+    round_reads = []
+    for match in matches:
+        query_counter.clear()
+        assert _vote(client, match).status_code == 200
+        round_reads.append(
+            len([sql for sql in query_counter if " matches.round_number = " in sql])
+        )
+
+    assert round_reads == [0, 0, 0, 0]
+
+    rounds = {
+        record.round_number: (record.total_matches, record.pending_matches)
+        for record in TournamentRound.query.filter_by(tournament_id=tournament_id)
+    }
+    assert rounds == {1: (4, 0), 2: (2, 2), 3: (1, 1)}
+
+
+@pytest.mark.unit
+def test_bracket_is_inserted_one_statement_per_round(
+    client, query_counter, create_started_tournament
+):
+    """Bracket start bulk inserts every round; votes only fill next slots"""
+    tournament_id = create_started_tournament(64)
+    match_inserts = [
+        sql for sql in query_counter if sql.startswith("INSERT INTO matches")
+    ]
+    assert len(match_inserts) == 6
+
+    matches = _pending_matches(client, tournament_id)
+    assert len(matches) == 32
+    query_counter.clear()
+    for match in matches:
+        response = _vote(client, match)
+
+    assert response.get_json()["next_round"] == 2
+    assert not [sql for sql in query_counter if sql.startswith("INSERT INTO matches")]
+    round_2 = _pending_matches(client, tournament_id)
+    assert len(round_2) == 16
+    winners = {match["prompt_1_id"] for match in matches}
+    assert {m["prompt_1_id"] for m in round_2} | {
+        m["prompt_2_id"] for m in round_2
+    } == winners
+
+
+@pytest.mark.unit
+def test_waiting_match_rejects_results(client, create_started_tournament):
+    """A match whose participants are not known yet cannot be decided"""
+    tournament_id = create_started_tournament(3)
+    status = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    final = status["rounds"]["2"][0]
+    assert final["status"] == "waiting"
+
+    response = client.post(
+        f"/api/match/{final['match_id']}/result",
+        json={"winner_id": final["prompt_1_id"]},
+    )
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Match is still waiting for its participants"
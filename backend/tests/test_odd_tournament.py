@@ -140,10 +140,10 @@ def test_five_prompts(client):
     bracket_result = response.get_json()
     print(f"✅ Bracket started with {bracket_result['total_matches']} matches")
 
-    # Should have 2 matches (4 prompts paired, 1 gets bye)
+    # Should have 1 match (an 8-slot bracket: 2 prompts play, 3 get byes)
     assert (
-        bracket_result["total_matches"] == 2
-    ), f"Expected 2 matches, got {bracket_result['total_matches']}"
+        bracket_result["total_matches"] == 1
+    ), f"Expected 1 match, got {bracket_result['total_matches']}"
 
     print("✅ 5-prompt tournament structure looks correct!")
 
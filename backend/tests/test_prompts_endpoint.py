@@ -0,0 +1,68 @@
+"""
+Tests for the paginated, filterable /prompts endpoint
+"""
+
+import pytest
+
+
+def _create_tournament(client, question, num_prompts):
+    response = client.post(
+        "/api/tournament",
+        json={
+            "input_question": question,
+            "custom_prompts": [f"{question} #{i}" for i in range(num_prompts)],
+            "total_prompts": num_prompts,
+        },
+    )
+    return response.get_json()["tournament_id"]
+
+
+@pytest.mark.unit
+def test_prompts_paginate_with_cursor(client):
+    _create_tournament(client, "Paged question", 5)
+
+    response = client.get("/api/prompts?limit=2")
+    first_page = response.get_json()
+    assert len(first_page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == str(first_page[-1]["id"])
+    assert f"after_id={cursor}" in response.headers["Link"]
+
+    seen = list(first_page)
+    while cursor:
+        response = client.get(f"/api/prompts?limit=2&after_id={cursor}")
+        seen.extend(response.get_json())
+        cursor = response.headers.get("X-Next-Cursor")
+
+    assert [p["text"] for p in seen] == [f"Paged question #{i}" for i in range(5)]
+    assert [p["id"] for p in seen] == sorted(p["id"] for p in seen)
+
+
+@pytest.mark.unit
+def test_prompts_filter_by_tournament_and_question(client, app_context):
+    from database import db
+    from models import Tournament
+
+    first_id = _create_tournament(client, "First question", 3)
+    second_id = _create_tournament(client, "Second question", 4)
+
+    response = client.get(f"/api/prompts?tournament_id={second_id}")
+    texts = [p["text"] for p in response.get_json()]
+    assert texts == [f"Second question #{i}" for i in range(4)]
+    assert "X-Next-Cursor" not in response.headers
+
+    question_id = db.session.get(Tournament, first_id).input_question_id
+    response = client.get(f"/api/prompts?input_question_id={question_id}")
+    assert len(response.get_json()) == 3
+
+
+@pytest.mark.unit
+def test_prompts_page_size_is_capped(client, monkeypatch):
+    monkeypatch.setattr("services.prompt_service.MAX_PROMPTS_PAGE_SIZE", 2)
+    _create_tournament(client, "Big question", 3)
+
+    response = client.get("/api/prompts?limit=1000")
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
+    assert "X-Next-Cursor" in response.headers
@@ -0,0 +1,130 @@
+"""
+Tests for the test-prompt response cache
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from services.response_cache import ResponseCache
+
+
+def _mock_completion(content):
+    response = MagicMock()
+    response.choices[0].message.content = content
+    response.usage.prompt_tokens = 10
+    response.usage.completion_tokens = 8
+    response.usage.total_tokens = 18
+    return response
+
+
+def _test_prompt(client, **overrides):
+    return client.post(
+        "/api/test-prompt",
+        json={"prompt": "What is the capital of France?", **overrides},
+    )
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test the two-tier cache on its own"""
+
+    def test_entries_survive_a_restart(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        cache = ResponseCache(path=path, ttl_seconds=60)
+        key = cache.make_key("p", "gpt-4", 100, 0.5)
+        cache.put(key, {"response": "r"}, 0.5)
+        cache.close()
+
+        restarted = ResponseCache(path=path, ttl_seconds=60)
+        assert restarted.get(key) == {"response": "r"}
+        assert restarted.get(key) == {"response": "r"}
+        stats = restarted.stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+        restarted.close()
+
+    def test_entries_expire_except_at_temperature_zero(self, tmp_path):
+        cache = ResponseCache(path=str(tmp_path / "cache.db"), ttl_seconds=0.05)
+        warm = cache.make_key("p", "gpt-4", 100, 0.7)
+        deterministic = cache.make_key("p", "gpt-4", 100, 0)
+        cache.put(warm, {"response": "warm"}, 0.7)
+        cache.put(deterministic, {"response": "fixed"}, 0)
+
+        time.sleep(0.06)
+        assert cache.get(warm) is None
+        assert cache.get(deterministic) == {"response": "fixed"}
+        assert cache.make_key("p", "gpt-4", 100, 0.0) == deterministic
+        cache.close()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResponseCache(
+            path=str(tmp_path / "cache.db"), max_entries=2, memory_entries=1
+        )
+        for name in ("a", "b"):
+            cache.put(name, {"response": name}, 0.7)
+            time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", {"response": "c"}, 0.7)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"response": "a"}
+        assert cache.stats()["disk_entries"] == 2
+        assert cache.stats()["evictions"] == 1
+        cache.close()
+
+
+@pytest.mark.unit
+@patch("services.openai_service.openai_service.client.chat.completions.create")
+def test_repeated_test_prompt_is_served_from_cache(mock_openai, client):
+    mock_openai.return_value = _mock_completion("Paris.")
+
+    first = _test_prompt(client).get_json()
+    second = _test_prompt(client).get_json()
+
+    assert mock_openai.call_count == 1
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["response"] == first["response"] == "Paris."
+    stats = client.get("/api/test-prompt-cache-stats").get_json()
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.unit
+@patch("services.openai_service.openai_service.client.chat.completions.create")
+def test_different_settings_are_cached_separately(mock_openai, client):
+    mock_openai.return_value = _mock_completion("Paris.")
+
+    _test_prompt(client)
+    _test_prompt(client, temperature=0.2)
+
+    assert mock_openai.call_count == 2
+
+
+@pytest.mark.unit
+@patch("services.openai_service.openai_service.client.chat.completions.create")
+def test_bypass_flag_calls_the_api_and_refreshes(mock_openai, client):
+    mock_openai.return_value = _mock_completion("Paris.")
+    _test_prompt(client)
+
+    mock_openai.return_value = _mock_completion("It is Paris.")
+    bypassed = _test_prompt(client, bypass_cache=True).get_json()
+    cached = _test_prompt(client).get_json()
+
+    assert mock_openai.call_count == 2
+    assert bypassed["cached"] is False
+    assert cached["response"] == "It is Paris."
+
+
+@pytest.mark.unit
+@patch("services.openai_service.openai_service.client.chat.completions.create")
+def test_failed_calls_are_not_cached(mock_openai, client):
+    mock_openai.side_effect = Exception("API Error")
+    assert _test_prompt(client).status_code == 500
+
+    mock_openai.side_effect = None
+    mock_openai.return_value = _mock_completion("Paris.")
+    response = _test_prompt(client)
+
+    assert response.status_code == 200
+    assert response.get_json()["cached"] is False
@@ -0,0 +1,82 @@
+"""
+Tests for the versioned tournament snapshot cache
+"""
+
+import pytest
+from services.snapshot_cache import SnapshotCache, snapshot_cache
+
+
+@pytest.mark.unit
+class TestSnapshotCache:
+    """Test the bounded LRU behaviour of SnapshotCache"""
+
+    def test_get_or_build_counts_hits_and_misses(self):
+        cache = SnapshotCache(max_bytes=1024)
+        builds = []
+
+        def build():
+            builds.append(1)
+            return b"payload"
+
+        assert cache.get_or_build(("status", 1, 1), build) == b"payload"
+        assert cache.get_or_build(("status", 1, 1), build) == b"payload"
+
+        assert len(builds) == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size_bytes"] == len(b"payload")
+
+    def test_evicts_least_recently_used_over_byte_limit(self):
+        cache = SnapshotCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", b"cccc")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("c") == b"cccc"
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] == 8
+
+    def test_skips_payloads_larger_than_cache(self):
+        cache = SnapshotCache(max_bytes=4)
+        cache.put("big", b"too large")
+
+        assert cache.get("big") is None
+        assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_repeated_polls_are_served_from_cache(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+
+    first = client.get(f"/api/tournament/{tournament_id}/status")
+    second = client.get(f"/api/tournament/{tournament_id}/status")
+
+    assert first.get_json() == second.get_json()
+    stats = client.get("/api/cache-stats").get_json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.unit
+def test_match_result_invalidates_cached_status(client, create_started_tournament):
+    tournament_id = create_started_tournament()
+    status = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    client.get(f"/api/tournament/{tournament_id}/matches")
+    match = status["rounds"]["1"][0]
+
+    response = client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_1_id"]},
+    )
+    assert response.status_code == 200
+
+    status = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    assert status["progress"]["completed_matches"] == 1
+    matches = client.get(f"/api/tournament/{tournament_id}/matches").get_json()
+    assert matches["matches"][0]["status"] == "completed"
+    assert snapshot_cache.stats()["hits"] == 0
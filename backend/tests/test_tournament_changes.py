@@ -0,0 +1,117 @@
+"""
+Tests for the incremental tournament changes endpoint
+"""
+
+import pytest
+
+
+def _status(client, tournament_id):
+    return client.get(f"/api/tournament/{tournament_id}/status").get_json()
+
+
+@pytest.mark.unit
+def test_no_changes_at_current_version(client, create_started_tournament):
+    tournament_id = create_started_tournament(3)
+    version = _status(client, tournament_id)["version"]
+
+    response = client.get(f"/api/tournament/{tournament_id}/changes?since={version}")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["version"] == version
+    assert data["full_resync"] is False
+    assert data["matches"] == []
+    assert data["rounds"] == {}
+
+
+@pytest.mark.unit
+def test_changes_report_completed_matches_and_their_next_slot(
+    client, create_started_tournament
+):
+    tournament_id = create_started_tournament(3)
+    status = _status(client, tournament_id)
+    match = status["rounds"]["1"][0]
+    final = status["rounds"]["2"][0]
+
+    client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_2_id"]},
+    )
+
+    data = client.get(
+        f"/api/tournament/{tournament_id}/changes?since={status['version']}"
+    ).get_json()
+    assert data["version"] == status["version"] + 1
+    # The bye took the final's first slot; the match winner fills the second
+    assert final["prompt_1"] == status["byes"]["1"][0]
+    assert data["matches"] == [
+        {
+            "match_id": match["match_id"],
+            "round_number": 1,
+            "status": "completed",
+            "winner_id": match["prompt_2_id"],
+            "winner": match["prompt_2"],
+            "next_match_id": final["match_id"],
+            "next_slot": 2,
+        }
+    ]
+    assert data["rounds"] == {}
+    assert data["status"] == "in_progress"
+
+
+@pytest.mark.unit
+def test_changes_since_bracket_start_include_every_round(
+    client, create_started_tournament
+):
+    tournament_id = create_started_tournament(num_prompts=5)
+    status = _status(client, tournament_id)
+
+    data = client.get(
+        f"/api/tournament/{tournament_id}/changes?since={status['version'] - 1}"
+    ).get_json()
+
+    assert data["rounds"] == status["rounds"]
+    assert data["byes"]["1"] == status["byes"]["1"]
+
+
+@pytest.mark.unit
+def test_changes_report_tournament_winner(client, create_started_tournament):
+    tournament_id = create_started_tournament(num_prompts=2)
+    status = _status(client, tournament_id)
+    match = status["rounds"]["1"][0]
+
+    client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_1_id"]},
+    )
+
+    data = client.get(
+        f"/api/tournament/{tournament_id}/changes?since={status['version']}"
+    ).get_json()
+    assert data["status"] == "completed"
+    assert data["winner"] == match["prompt_1"]
+
+
+@pytest.mark.unit
+def test_changes_older_than_log_require_full_resync(client, create_started_tournament):
+    tournament_id = create_started_tournament(3)
+
+    data = client.get(f"/api/tournament/{tournament_id}/changes?since=0").get_json()
+
+    assert data["full_resync"] is True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", ["", "?since=abc", "?since=-1"])
+def test_changes_require_valid_since(client, query, create_started_tournament):
+    tournament_id = create_started_tournament(3)
+
+    response = client.get(f"/api/tournament/{tournament_id}/changes{query}")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_changes_tournament_not_found(client):
+    response = client.get("/api/tournament/99999/changes?since=1")
+    assert response.status_code == 404
@@ -131,3 +131,246 @@ def test_tournament_creation_no_ai_needed(client):
     assert len(data["prompts"]) == 8
 
     print("✅ Tournament creation without AI generation works!")
+
+
+@pytest.mark.unit
+def test_tournament_creation_bulk_inserts_prompts(client, query_counter):
+    """Prompts go in with one INSERT and the response is not read back"""
+    prompts = [f"Bulk prompt {i}" for i in range(16)]
+
+    response = client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Which bulk prompt is best?",
+            "custom_prompts": prompts,
+            "total_prompts": 16,
+        },
+    )
+
+    assert response.status_code == 201
+    assert response.get_json()["prompts"] == prompts
+    prompt_inserts = [s for s in query_counter if s.startswith("INSERT INTO prompts")]
+    assert len(prompt_inserts) == 1
+    assert not [s for s in query_counter if s.startswith("SELECT")]
+
+
+@pytest.mark.unit
+def test_failed_tournament_creation_leaves_no_question(client):
+    """Validation errors must not leave an orphaned input question behind"""
+    from database import db
+    from models import InputQuestion
+
+    response = client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Will this question be stored?",
+            "custom_prompts": ["Prompt A", "Prompt B"],
+            "total_prompts": "two",
+        },
+    )
+
+    assert response.status_code == 400
+    assert db.session.query(InputQuestion).count() == 0
+
+
+@pytest.mark.unit
+def test_large_prompt_generation_is_chunked_and_concurrent(client, monkeypatch):
+    """Large requests are split into concurrent chunks and deduped across them"""
+    import threading
+    import time
+
+    import services.openai_service as openai_module
+
+    monkeypatch.setattr(openai_module, "PROMPTS_PER_REQUEST", 10)
+    lock = threading.Lock()
+    calls = []
+    in_flight = [0, 0]  # current, peak
+
+    def fake_create(**kwargs):
+        with lock:
+            call_number = len(calls)
+            calls.append(kwargs)
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        # Every chunk repeats the same opening prompt
+        lines = ["Shared prompt"] + [
+            f"Chunk {call_number} prompt {i}" for i in range(9)
+        ]
+        response = MagicMock()
+        response.choices[0].message.content = "\n".join(lines)
+        return response
+
+    with patch(
+        "services.openai_service.openai_service.client.chat.completions.create",
+        side_effect=fake_create,
+    ):
+        response = client.post(
+            "/api/tournament",
+            json={
+                "input_question": "Which generated prompt is best?",
+                "total_prompts": 40,
+            },
+        )
+
+    assert response.status_code == 201
+    prompts = response.get_json()["prompts"]
+    assert len(prompts) == 40
+    assert len({prompt.lower() for prompt in prompts}) == 40
+    assert prompts.count("Shared prompt") == 1
+    assert in_flight[1] > 1
+
+    # Each chunk asks for a different style, and 10% extra covers overlaps
+    contents = [call["messages"][1]["content"] for call in calls]
+    assert len(set(contents)) == len(contents) == 5
+    assert "batch 1 of 5" in contents[0]
+    assert "Generate 4 different ways" in contents[-1]
+
+
+@pytest.mark.unit
+def test_large_prompt_generation_fits_in_one_wave(app_context):
+    """256 prompts are generated in one wave of concurrent requests"""
+    import threading
+
+    from services.openai_service import (
+        MAX_CONCURRENT_REQUESTS,
+        TOKENS_PER_PROMPT,
+        openai_service,
+    )
+
+    lock = threading.Lock()
+    calls = []
+    # Every call waits until all of them have been sent, so a second wave
+    # would time out instead of passing
+    all_sent = threading.Event()
+
+    def fake_create(**kwargs):
+        with lock:
+            call_number = len(calls)
+            calls.append(kwargs)
+            if len(calls) == MAX_CONCURRENT_REQUESTS:
+                all_sent.set()
+        all_sent.wait(timeout=2)
+        requested = int(kwargs["messages"][1]["content"].split()[1])
+        response = MagicMock()
+        response.choices[0].message.content = "\n".join(
+            f"Chunk {call_number} prompt {i}" for i in range(requested)
+        )
+        return response
+
+    with patch(
+        "services.openai_service.openai_service.client.chat.completions.create",
+        side_effect=fake_create,
+    ):
+        prompts = openai_service.generate_prompts("Which prompt is best?", 256)
+
+    assert len(prompts) == 256
+    assert len(calls) == MAX_CONCURRENT_REQUESTS
+    assert all_sent.is_set()
+    # Each call leaves room in its completion for every prompt it asks for
+    for call in calls:
+        requested = int(call["messages"][1]["content"].split()[1])
+        assert call["max_tokens"] >= requested * TOKENS_PER_PROMPT
+
+
+@pytest.mark.unit
+def test_repeated_question_reuses_pooled_prompts(client):
+    """A question seen before is served from stored prompts, not OpenAI"""
+    pooled = [f"Pooled prompt {i}" for i in range(4)]
+    client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Which pooled prompt is best?",
+            "custom_prompts": pooled,
+            "total_prompts": 4,
+        },
+    )
+
+    with patch(
+        "services.openai_service.openai_service.client.chat.completions.create"
+    ) as mock_create:
+        response = client.post(
+            "/api/tournament",
+            json={
+                "input_question": "  which POOLED prompt   is best? ",
+                "custom_prompts": ["Pooled prompt 1", "A brand new prompt"],
+                "total_prompts": 4,
+            },
+        )
+
+    assert response.status_code == 201
+    assert response.get_json()["prompts"] == [
+        "Pooled prompt 1",
+        "A brand new prompt",
+        "Pooled prompt 0",
+        "Pooled prompt 2",
+    ]
+    mock_create.assert_not_called()
+
+
+@pytest.mark.unit
+def test_pool_shortfall_is_generated_with_ai(client):
+    """Only the prompts the pool cannot cover are generated"""
+    client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Which topped-up prompt is best?",
+            "custom_prompts": ["Stored prompt A", "Stored prompt B"],
+            "total_prompts": 2,
+        },
+    )
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = "Fresh prompt A\nFresh prompt B"
+    with patch(
+        "services.openai_service.openai_service.client.chat.completions.create",
+        return_value=mock_response,
+    ) as mock_create:
+        response = client.post(
+            "/api/tournament",
+            json={
+                "input_question": "Which topped-up prompt is best?",
+                "total_prompts": 4,
+            },
+        )
+
+    assert response.get_json()["prompts"] == [
+        "Stored prompt A",
+        "Stored prompt B",
+        "Fresh prompt A",
+        "Fresh prompt B",
+    ]
+    assert mock_create.call_count == 1
+    assert "Generate 2 different ways" in str(mock_create.call_args)
+
+
+@pytest.mark.unit
+def test_pooled_prompts_count_when_openai_is_unavailable(client, monkeypatch):
+    """A request the pool covers needs no OpenAI key"""
+    from services.openai_service import openai_service
+
+    client.post(
+        "/api/tournament",
+        json={
+            "input_question": "Which offline prompt is best?",
+            "custom_prompts": [f"Offline prompt {i}" for i in range(4)],
+            "total_prompts": 4,
+        },
+    )
+    monkeypatch.setattr(openai_service, "is_available", lambda: False)
+
+    request_data = {
+        "input_question": "Which offline prompt is best?",
+        "custom_prompts": ["A brand new prompt"],
+        "total_prompts": 4,
+    }
+    response = client.post("/api/tournament", json=request_data)
+    assert response.status_code == 201
+    assert response.get_json()["prompts"][0] == "A brand new prompt"
+
+    request_data["total_prompts"] = 6
+    response = client.post("/api/tournament", json=request_data)
+    assert response.status_code == 400
+    assert "You provided 1 prompts but need 6" in response.get_json()["error"]
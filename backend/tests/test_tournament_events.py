@@ -0,0 +1,139 @@
+"""
+Tests for live tournament updates over Server-Sent Events
+"""
+
+import json
+
+import pytest
+from services.event_service import EventService
+
+
+def _parse_event(message):
+    """Parse one SSE message into (event_type, data)"""
+    fields = dict(
+        line.split(": ", 1) for line in message.strip().split("\n") if ": " in line
+    )
+    return fields["event"], json.loads(fields["data"])
+
+
+@pytest.mark.unit
+class TestEventService:
+    """Test the in-process event hub"""
+
+    def test_stream_delivers_published_events(self):
+        events = EventService()
+        stream = events.stream(1, lambda: 3, heartbeat_seconds=0.01)
+
+        assert _parse_event(next(stream)) == ("connected", {"version": 3})
+
+        events.publish(1, "match_completed", {"version": 4, "match_id": 7})
+        events.publish(2, "match_completed", {"version": 9, "match_id": 8})
+        message = next(stream)
+
+        assert "id: 4\n" in message
+        assert _parse_event(message) == (
+            "match_completed",
+            {"version": 4, "match_id": 7},
+        )
+        stream.close()
+
+    def test_heartbeat_reports_version_changes(self):
+        events = EventService()
+        versions = iter([1, 1, 2])
+        stream = events.stream(1, lambda: next(versions), heartbeat_seconds=0.01)
+
+        next(stream)
+        assert next(stream) == ": keepalive\n\n"
+        assert _parse_event(next(stream)) == ("tournament_updated", {"version": 2})
+        stream.close()
+
+    def test_dropped_event_triggers_a_resync(self, monkeypatch):
+        import services.event_service as event_module
+
+        monkeypatch.setattr(event_module, "SUBSCRIBER_QUEUE_SIZE", 1)
+        events = EventService()
+        stream = events.stream(1, lambda: 3, heartbeat_seconds=0.01)
+        next(stream)
+
+        events.publish(1, "match_completed", {"version": 4, "match_id": 7})
+        events.publish(1, "match_completed", {"version": 5, "match_id": 8})
+        assert _parse_event(next(stream))[1]["version"] == 4
+
+        events.publish(1, "match_completed", {"version": 6, "match_id": 9})
+        assert _parse_event(next(stream)) == ("tournament_updated", {"version": 6})
+        stream.close()
+
+    def test_event_after_another_workers_write_triggers_a_resync(self):
+        events = EventService()
+        stream = events.stream(1, lambda: 3, heartbeat_seconds=0.01)
+        next(stream)
+
+        # Version 4 was written by another worker and never published here
+        events.publish(1, "match_completed", {"version": 5, "match_id": 7})
+        assert _parse_event(next(stream)) == ("tournament_updated", {"version": 5})
+
+        events.publish(1, "match_completed", {"version": 4, "match_id": 6})
+        events.publish(1, "match_completed", {"version": 6, "match_id": 8})
+        assert _parse_event(next(stream)) == (
+            "match_completed",
+            {"version": 6, "match_id": 8},
+        )
+        stream.close()
+
+    def test_closing_stream_unsubscribes(self):
+        events = EventService()
+        stream = events.stream(1, lambda: 1)
+        next(stream)
+        stream.close()
+
+        assert events._subscribers == {}
+
+
+@pytest.mark.unit
+def test_events_endpoint_streams_tournament_progress(client, create_started_tournament):
+    tournament_id = create_started_tournament(3)
+    status = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+
+    response = client.get(f"/api/tournament/{tournament_id}/events", buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    stream = response.response
+    assert _parse_event(next(stream).decode()) == (
+        "connected",
+        {"version": status["version"]},
+    )
+
+    # The final is laid out up front with the bye prompt waiting in it
+    match = status["rounds"]["1"][0]
+    final = status["rounds"]["2"][0]
+    assert final["status"] == "waiting"
+    client.post(
+        f"/api/match/{match['match_id']}/result",
+        json={"winner_id": match["prompt_1_id"]},
+    )
+    event_type, data = _parse_event(next(stream).decode())
+    assert event_type == "match_completed"
+    assert data["match_id"] == match["match_id"]
+    assert data["winner"] == match["prompt_1"]
+    assert data["next_match_id"] == final["match_id"]
+
+    final = client.get(f"/api/tournament/{tournament_id}/status?rounds=2").get_json()[
+        "rounds"
+    ]["2"][0]
+    assert final["status"] == "pending"
+
+    client.post(
+        f"/api/match/{final['match_id']}/result",
+        json={"winner_id": final["prompt_2_id"]},
+    )
+    assert _parse_event(next(stream).decode())[0] == "match_completed"
+    event_type, data = _parse_event(next(stream).decode())
+    assert event_type == "tournament_completed"
+    assert data["winner"] == final["prompt_2"]
+    response.close()
+
+
+@pytest.mark.unit
+def test_events_endpoint_tournament_not_found(client):
+    response = client.get("/api/tournament/99999/events")
+    assert response.status_code == 404
@@ -0,0 +1,270 @@
+"""
+Tests for tournament status loading and its query cost
+"""
+
+import pytest
+
+
+def _count_status_queries(client, query_counter, tournament_id):
+    """Return the number of SQL statements issued by one status request"""
+    query_counter.clear()
+    response = client.get(f"/api/tournament/{tournament_id}/status")
+    assert response.status_code == 200
+    return len(query_counter)
+
+
+@pytest.mark.unit
+def test_status_query_count_is_flat_across_bracket_sizes(
+    client, query_counter, create_started_tournament
+):
+    """Status should cost the same number of queries for small and large brackets"""
+    counts = []
+    for num_prompts in (4, 16, 64):
+        tournament_id = create_started_tournament(num_prompts)
+        counts.append(_count_status_queries(client, query_counter, tournament_id))
+
+    assert len(set(counts)) == 1, f"Query count grew with bracket size: {counts}"
+
+
+@pytest.mark.unit
+def test_status_serializes_snapshot(client, create_started_tournament):
+    """Status payload should resolve prompt texts for every match"""
+    tournament_id = create_started_tournament(8)
+
+    response = client.get(f"/api/tournament/{tournament_id}/status")
+    data = response.get_json()
+
+    assert data["total_prompts"] == 8
+    # Every round is laid out when the bracket starts
+    assert data["progress"]["total_matches"] == 7
+    round_1 = data["rounds"]["1"]
+    assert len(round_1) == 4
+    for match in round_1:
+        assert match["prompt_1"] in data["prompts"]
+        assert match["prompt_2"] in data["prompts"]
+        assert match["winner"] is None
+
+
+def _complete_round(client, tournament_id, round_number):
+    """Submit prompt_1 as the winner of every pending match in a round"""
+    response = client.get(f"/api/tournament/{tournament_id}/status")
+    for match in response.get_json()["rounds"][str(round_number)]:
+        if match["status"] == "pending":
+            response = client.post(
+                f"/api/match/{match['match_id']}/result",
+                json={"winner_id": match["prompt_1_id"]},
+            )
+            assert response.status_code == 200
+
+
+@pytest.mark.unit
+def test_status_query_count_is_flat_across_rounds(
+    client, query_counter, create_started_tournament
+):
+    """Later rounds with byes should not add queries to the status call"""
+    tournament_id = create_started_tournament(11)
+    counts = [_count_status_queries(client, query_counter, tournament_id)]
+
+    for round_number in (1, 2):
+        _complete_round(client, tournament_id, round_number)
+        counts.append(_count_status_queries(client, query_counter, tournament_id))
+
+    assert len(set(counts)) == 1, f"Query count grew with rounds: {counts}"
+
+
+@pytest.mark.unit
+def test_status_byes_fill_round_two_slots(client, create_started_tournament):
+    """Round 1 byes are the prompts that did not play, already placed in round 2"""
+    tournament_id = create_started_tournament(5)
+
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    round_1 = data["rounds"]["1"]
+    played = {m["prompt_1"] for m in round_1} | {m["prompt_2"] for m in round_1}
+    assert sorted(data["byes"]["1"]) == sorted(
+        p for p in data["prompts"] if p not in played
+    )
+    assert len(round_1) == 1 and len(data["byes"]["1"]) == 3
+    assert data["byes"]["2"] == data["byes"]["3"] == []
+
+    # Two byes meet in one round 2 match; the third waits for round 1's winner
+    round_2 = data["rounds"]["2"]
+    placed = {m["prompt_1"] for m in round_2} | {m["prompt_2"] for m in round_2}
+    assert set(data["byes"]["1"]) < placed
+    assert sorted(m["status"] for m in round_2) == ["pending", "waiting"]
+    assert data["rounds"]["3"][0]["status"] == "waiting"
+    assert round_1[0]["next_match_id"] in {m["match_id"] for m in round_2}
+
+
+@pytest.mark.unit
+def test_byes_are_recorded_when_the_bracket_starts(
+    client, app_context, create_started_tournament
+):
+    """Starting a bracket persists its byes; later rounds assign none"""
+    from models import RoundBye
+
+    tournament_id = create_started_tournament(5)
+    _complete_round(client, tournament_id, 1)
+
+    byes = RoundBye.query.filter_by(tournament_id=tournament_id).all()
+    assert [bye.round_number for bye in byes] == [1, 1, 1]
+
+    data = client.get(f"/api/tournament/{tournament_id}/status").get_json()
+    assert data["byes"]["1"] == [bye.prompt.prompt_text for bye in byes]
+    assert data["byes"]["2"] == []
+
+
+@pytest.mark.unit
+def test_status_fields_limit_the_payload(client, create_started_tournament):
+    """Only the requested fields are returned, plus the id and version"""
+    tournament_id = create_started_tournament(4)
+
+    response = client.get(
+        f"/api/tournament/{tournament_id}/status?fields=status,current_round"
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "tournament_id": tournament_id,
+        "version": 2,
+        "status": "in_progress",
+        "current_round": 1,
+    }
+
+
+@pytest.mark.unit
+def test_status_rounds_window(client, create_started_tournament):
+    """rounds=current, rounds=N and rounds=A..B select only those rounds"""
+    tournament_id = create_started_tournament(8)
+    _complete_round(client, tournament_id, 1)
+    _complete_round(client, tournament_id, 2)
+    url = f"/api/tournament/{tournament_id}/status"
+
+    data = client.get(f"{url}?rounds=current").get_json()
+    assert data["current_round"] == 3
+    assert list(data["rounds"]) == ["3"]
+    assert list(data["byes"]) == ["3"]
+
+    data = client.get(f"{url}?rounds=2").get_json()
+    assert list(data["rounds"]) == ["2"]
+    assert len(data["rounds"]["2"]) == 2
+
+    data = client.get(f"{url}?rounds=1..2&fields=rounds").get_json()
+    assert sorted(data["rounds"]) == ["1", "2"]
+    assert "prompts" not in data
+
+    full = client.get(url).get_json()
+    assert data["rounds"]["1"] == full["rounds"]["1"]
+
+
+@pytest.mark.unit
+def test_current_rounds_include_later_pending_matches(
+    client, create_started_tournament
+):
+    """rounds=current covers a later match that is ready before its round"""
+    tournament_id = create_started_tournament(8)
+    url = f"/api/tournament/{tournament_id}/status"
+    round_1 = client.get(f"{url}?rounds=1").get_json()["rounds"]["1"]
+    # Decide both matches feeding one round 2 match, leaving the rest open
+    ready_match_id = round_1[0]["next_match_id"]
+    for match in round_1:
+        if match["next_match_id"] == ready_match_id:
+            client.post(
+                f"/api/match/{match['match_id']}/result",
+                json={"winner_id": match["prompt_1_id"]},
+            )
+
+    data = client.get(f"{url}?rounds=current").get_json()
+
+    assert data["current_round"] == 1
+    assert list(data["rounds"]) == ["1", "2"]
+    ready = [m for m in data["rounds"]["2"] if m["match_id"] == ready_match_id]
+    assert ready[0]["status"] == "pending"
+
+
+@pytest.mark.unit
+def test_current_round_costs_no_more_than_full_status(
+    client, query_counter, create_started_tournament
+):
+    """The current-round view stays flat and skips the prompt list"""
+    tournament_id = create_started_tournament(64)
+    full_count = _count_status_queries(client, query_counter, tournament_id)
+
+    query_counter.clear()
+    response = client.get(
+        f"/api/tournament/{tournament_id}/status?rounds=current&fields=rounds"
+    )
+    assert response.status_code == 200
+    assert len(query_counter) < full_count
+    assert not any("prompts.input_question_id" in sql for sql in query_counter)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query", ["fields=bogus", "rounds=latest", "rounds=5..3", "rounds=0"]
+)
+def test_status_rejects_invalid_subsets(client, query, create_started_tournament):
+    """Unknown fields and malformed round windows are a 400"""
+    tournament_id = create_started_tournament(4)
+
+    response = client.get(f"/api/tournament/{tournament_id}/status?{query}")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.unit
+def test_status_subsets_have_their_own_etag(client, create_started_tournament):
+    """A subset must not revalidate against the full payload's ETag"""
+    tournament_id = create_started_tournament(4)
+    url = f"/api/tournament/{tournament_id}/status"
+    etag = client.get(url).headers["ETag"]
+
+    response = client.get(f"{url}?rounds=current", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.unit
+def test_progress_counters_follow_the_bracket(
+    client, app_context, create_started_tournament
+):
+    """Counters on the tournament row match the matches table as play goes on"""
+    from database import db
+    from models import Match, Tournament
+
+    tournament_id = create_started_tournament(5)
+    url = f"/api/tournament/{tournament_id}/status"
+
+    for round_number in (1, 2, 3):
+        _complete_round(client, tournament_id, round_number)
+        db.session.expire_all()
+        tournament = db.session.get(Tournament, tournament_id)
+        matches = Match.query.filter_by(tournament_id=tournament_id).all()
+        assert tournament.total_matches == len(matches)
+        assert tournament.completed_matches == len(
+            [m for m in matches if m.status == "completed"]
+        )
+        open_rounds = [m.round_number for m in matches if m.status != "completed"]
+        assert tournament.current_round == min(open_rounds, default=round_number)
+
+    data = client.get(url).get_json()
+    assert data["status"] == "completed"
+    assert data["progress"]["completion_percentage"] == 100.0
+    assert data["winner"] == tournament.winner_prompt.prompt_text
+
+
+@pytest.mark.unit
+def test_progress_does_not_read_matches(
+    client, query_counter, create_started_tournament
+):
+    """Progress and current round come from the tournament row alone"""
+    tournament_id = create_started_tournament(16)
+
+    query_counter.clear()
+    response = client.get(
+        f"/api/tournament/{tournament_id}/status?fields=progress,current_round"
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["progress"]["total_matches"] == 15
+    assert not any("FROM matches" in sql for sql in query_counter)
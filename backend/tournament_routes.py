@@ -1,9 +1,25 @@
-from flask import Blueprint, jsonify, request
-from models import Prompt
+import json
+
+from database import db
+from flask import (
+    Blueprint,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+    url_for,
+)
+from services.change_log_service import change_log_service
+from services.event_service import event_service
+from services.idempotency_store import idempotency_store
 from services.match_service import match_service
-from services.prompt_service import prompt_service
+from services.prompt_service import DEFAULT_PROMPTS_PAGE_SIZE, prompt_service
+from services.response_cache import response_cache
+from services.snapshot_cache import snapshot_cache
 from services.tournament_service import tournament_service
+from services.vote_buffer import vote_buffer
 from utils.error_handlers import handle_api_errors
+from utils.idempotency import idempotent
 
 # Create a Blueprint for tournament-related routes
 tournament_bp = Blueprint("tournament", __name__)
@@ -14,25 +30,130 @@ tournament_bp = Blueprint("tournament", __name__)
 @handle_api_errors
 def create_tournament():
     data = request.json
+
+    # With "Prefer: respond-async" prompt generation and the writes run in
+    # a background job; the client polls the job for the new tournament
+    if "respond-async" in request.headers.get("Prefer", ""):
+        job = tournament_service.enqueue_tournament_creation(data)
+        response = jsonify(job)
+        response.status_code = 202
+        response.headers["Location"] = url_for(".get_job", job_id=job["job_id"])
+        response.headers["Preference-Applied"] = "respond-async"
+        return response
+
     result = tournament_service.create_tournament(data)
     return jsonify(result), 201
 
 
+# Route to check the state of a background tournament creation
+@tournament_bp.route("/jobs/<job_id>", methods=["GET"])
+@handle_api_errors
+def get_job(job_id):
+    return jsonify(tournament_service.get_creation_job(job_id))
+
+
+def _cached_json_response(cache_key, build_payload):
+    """
+    Serve a JSON payload from the snapshot cache with a strong ETag
+
+    The ETag is derived from the cache key, which includes the tournament
+    version, so a matching If-None-Match is answered with 304 before the
+    payload is looked up or built.
+    """
+    etag = "-".join(str(part) for part in cache_key)
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        body = snapshot_cache.get_or_build(
+            cache_key, lambda: current_app.json.dumps(build_payload()).encode()
+        )
+        response = current_app.response_class(body, mimetype="application/json")
+
+    response.set_etag(etag)
+    # Let clients keep the payload but revalidate it on every poll
+    response.cache_control.no_cache = True
+    return response
+
+
 # Route to retrieve comprehensive tournament status
 @tournament_bp.route("/tournament/<int:tournament_id>/status", methods=["GET"])
 @handle_api_errors
 def get_tournament_status(tournament_id):
-    tournament_data = tournament_service.get_tournament_status(tournament_id)
-    return jsonify(tournament_data)
+    fields = tournament_service.parse_status_fields(request.args.get("fields"))
+    rounds = tournament_service.parse_round_window(request.args.get("rounds"))
+    version = tournament_service.get_tournament_version(tournament_id)
+
+    cache_key = ("status", tournament_id, version)
+    if fields is not None or rounds is not None:
+        # Each subset is cached and validated separately from the full payload
+        rounds_key = (
+            "..".join(map(str, rounds)) if isinstance(rounds, tuple) else rounds
+        )
+        fields_key = "all" if fields is None else ".".join(fields) or "none"
+        cache_key += (fields_key, rounds_key or "all")
+
+    return _cached_json_response(
+        cache_key,
+        lambda: tournament_service.get_tournament_status(
+            tournament_id, fields=fields, rounds=rounds
+        ),
+    )
+
+
+# Route to stream live tournament updates as Server-Sent Events
+@tournament_bp.route("/tournament/<int:tournament_id>/events", methods=["GET"])
+@handle_api_errors
+def stream_tournament_events(tournament_id):
+    # Fail with 404 before opening the stream
+    tournament_service.get_tournament_version(tournament_id)
+    db.session.close()
+
+    def get_version():
+        try:
+            return tournament_service.get_tournament_version(tournament_id)
+        finally:
+            # Don't hold a pooled connection for the lifetime of the stream
+            db.session.close()
+
+    return current_app.response_class(
+        stream_with_context(event_service.stream(tournament_id, get_version)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Route to fetch only what changed in a tournament since a given version
+@tournament_bp.route("/tournament/<int:tournament_id>/changes", methods=["GET"])
+@handle_api_errors
+def get_tournament_changes(tournament_id):
+    since = request.args.get("since", type=int)
+    if since is None or since < 0:
+        raise ValueError("since must be a non-negative integer version")
+
+    result = change_log_service.get_changes_since(tournament_id, since)
+    return jsonify(result)
 
 
 # Route to store the result of a match and automatically advance tournament
 @tournament_bp.route("/match/<int:match_id>/result", methods=["POST"])
+@idempotent
 @handle_api_errors
 def store_match_result(match_id):
     data = request.json
     winner_id = data["winner_id"]
 
+    # With "Prefer: respond-async" the result is queued and applied by a
+    # background worker; the client polls the receipt for the outcome
+    if "respond-async" in request.headers.get("Prefer", ""):
+        receipt = match_service.enqueue_match_result(match_id, winner_id)
+        response = jsonify(receipt)
+        response.status_code = 202
+        response.headers["Location"] = url_for(
+            ".get_vote_receipt", receipt_id=receipt["receipt_id"]
+        )
+        response.headers["Preference-Applied"] = "respond-async"
+        return response
+
     result = match_service.store_match_result(match_id, winner_id)
     match = result["match"]
     winner_prompt = result["winner_prompt"]
@@ -42,11 +163,15 @@ def store_match_result(match_id):
         "message": "Match result stored successfully",
         "match_id": match.id,
         "winner": winner_prompt.prompt_text,
+        "next_match_id": match.next_match_id,
         "round_completed": next_round_info["round_completed"],
     }
 
-    if next_round_info["next_round_created"]:
+    if next_round_info["next_round_number"]:
         response_data["next_round"] = next_round_info["next_round_number"]
+
+    # Only brackets started before the full layout pair a new round here
+    if next_round_info["next_round_created"]:
         response_data["next_round_matches"] = next_round_info["matches_created"]
 
         # Include bye information as array
@@ -57,17 +182,47 @@ def store_match_result(match_id):
     if next_round_info["tournament_completed"]:
         response_data["tournament_completed"] = True
         response_data["tournament_winner"] = winner_prompt.prompt_text
-        # Update tournament status
-        from database import db
-        from models import Tournament
-
-        tournament = db.session.get(Tournament, match.tournament_id)
-        tournament.status = "completed"
-        db.session.commit()
 
     return jsonify(response_data)
 
 
+# Route to check the outcome of a queued match result
+@tournament_bp.route("/vote-receipts/<receipt_id>", methods=["GET"])
+@handle_api_errors
+def get_vote_receipt(receipt_id):
+    return jsonify(match_service.get_vote_receipt(receipt_id))
+
+
+# Route to cast one crowd vote on a match (crowd voting tournaments only)
+@tournament_bp.route("/match/<int:match_id>/vote", methods=["POST"])
+@handle_api_errors
+def cast_vote(match_id):
+    data = request.json
+    prompt_id = data.get("prompt_id") if isinstance(data, dict) else None
+    if not isinstance(prompt_id, int):
+        raise ValueError("prompt_id must be an integer")
+
+    result = match_service.cast_vote(match_id, prompt_id)
+    # The vote is buffered; it is counted once the buffer is flushed
+    return jsonify(result), 202
+
+
+# Route to read a match's crowd vote tally
+@tournament_bp.route("/match/<int:match_id>/votes", methods=["GET"])
+@handle_api_errors
+def get_vote_tally(match_id):
+    return jsonify(match_service.get_vote_tally(match_id))
+
+
+# Route to store many match results at once (e.g. from an offline judging run)
+@tournament_bp.route("/tournament/<int:tournament_id>/results", methods=["POST"])
+@idempotent
+@handle_api_errors
+def store_match_results(tournament_id):
+    result = match_service.store_match_results(tournament_id, request.json)
+    return jsonify(result)
+
+
 # Route to start tournament bracket (automatically create first round matches)
 @tournament_bp.route("/tournament/<int:tournament_id>/start-bracket", methods=["POST"])
 @handle_api_errors
@@ -82,19 +237,71 @@ def start_tournament_bracket(tournament_id):
 def get_tournament_matches(tournament_id):
     # Optional round filter
     round_number = request.args.get("round", type=int)
-    result = tournament_service.get_tournament_matches(tournament_id, round_number)
-    return jsonify(result)
+    version = tournament_service.get_tournament_version(tournament_id)
+    return _cached_json_response(
+        ("matches", tournament_id, version, round_number),
+        lambda: tournament_service.get_tournament_matches(tournament_id, round_number),
+    )
 
 
-# Route to get all prompts (for debugging or UI)
+# Route to page through prompts (for debugging or UI)
 @tournament_bp.route("/prompts", methods=["GET"])
 @handle_api_errors
 def get_all_prompts():
-    prompts = Prompt.query.all()
-    return jsonify(
-        [{"id": prompt.id, "text": prompt.prompt_text} for prompt in prompts]
+    limit = request.args.get("limit", DEFAULT_PROMPTS_PAGE_SIZE, type=int)
+    rows, next_cursor = prompt_service.get_prompts_page(
+        after_id=request.args.get("after_id", type=int),
+        limit=limit,
+        input_question_id=request.args.get("input_question_id", type=int),
+        tournament_id=request.args.get("tournament_id", type=int),
     )
 
+    def generate():
+        # Serialize row by row instead of building the whole body in memory
+        yield "["
+        for index, row in enumerate(rows):
+            prefix = "," if index else ""
+            yield prefix + json.dumps({"id": row.id, "text": row.prompt_text})
+        yield "]"
+
+    response = current_app.response_class(generate(), mimetype="application/json")
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+        next_args = request.args.to_dict()
+        next_args["after_id"] = next_cursor
+        response.headers["Link"] = (
+            f'<{url_for(request.endpoint, _external=True, **next_args)}>; rel="next"'
+        )
+    return response
+
+
+# Route to inspect the tournament snapshot cache (for debugging or monitoring)
+@tournament_bp.route("/cache-stats", methods=["GET"])
+@handle_api_errors
+def cache_stats():
+    return jsonify(snapshot_cache.stats())
+
+
+# Route to inspect the crowd vote buffer (for debugging or monitoring)
+@tournament_bp.route("/vote-buffer-stats", methods=["GET"])
+@handle_api_errors
+def vote_buffer_stats():
+    return jsonify(vote_buffer.stats())
+
+
+# Route to inspect the Idempotency-Key response store (for debugging or monitoring)
+@tournament_bp.route("/idempotency-stats", methods=["GET"])
+@handle_api_errors
+def idempotency_stats():
+    return jsonify(idempotency_store.stats())
+
+
+# Route to inspect the test-prompt response cache (for debugging or monitoring)
+@tournament_bp.route("/test-prompt-cache-stats", methods=["GET"])
+@handle_api_errors
+def test_prompt_cache_stats():
+    return jsonify(response_cache.stats())
+
 
 # Route to check if OpenAI is available
 @tournament_bp.route("/openai-status", methods=["GET"])
@@ -0,0 +1,120 @@
+"""
+Idempotency-Key support for POST routes that clients retry
+"""
+
+from functools import wraps
+
+from database import db
+from flask import jsonify, make_response, request
+from services.idempotency_store import (
+    IN_PROGRESS,
+    MAX_KEY_LENGTH,
+    MISMATCH,
+    REPLAY,
+    idempotency_store,
+)
+
+# Response headers worth replaying; the rest are recomputed per response
+REPLAYED_HEADERS = ("Content-Type", "Location", "Preference-Applied")
+
+
+def idempotent(f):
+    """
+    Decorator that answers retries of a request with its original response
+
+    Requests without an Idempotency-Key header run as usual. The first
+    request with a key runs the route and its response is stored; retries
+    with the same key and body get that response back, marked with
+    "Idempotent-Replayed: true", without running the route again. Server
+    errors (5xx) are not stored, so those can be retried.
+
+    Keys are scoped to the request method and path, and are shared by all
+    worker processes through the database. Reusing a key with a different
+    body is a 422, and a retry that arrives while the first request is
+    still running is a 409. A first request whose worker died stops
+    blocking retries once its claim's lease runs out. Failures of the store
+    itself are reported as a JSON 500, like handle_api_errors does.
+
+    Apply it outside handle_api_errors so error responses are stored too:
+        @tournament_bp.route(...)
+        @idempotent
+        @handle_api_errors
+        def my_route():
+            pass
+    """
+
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if idempotency_key is None:
+            return f(*args, **kwargs)
+
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            return (
+                jsonify(
+                    {
+                        "error": "Idempotency-Key must be 1 to "
+                        f"{MAX_KEY_LENGTH} characters"
+                    }
+                ),
+                400,
+            )
+
+        key = (request.method, request.path, idempotency_key)
+        fingerprint = idempotency_store.fingerprint(request.get_data())
+        try:
+            outcome, stored = idempotency_store.begin(key, fingerprint)
+        except Exception as e:
+            return _store_error(f, e)
+
+        if outcome == REPLAY:
+            status, headers, body = stored
+            response = make_response(body, status, headers)
+            response.headers["Idempotent-Replayed"] = "true"
+            return response
+        if outcome == MISMATCH:
+            return (
+                jsonify({"error": "Idempotency-Key was used for a different request"}),
+                422,
+            )
+        if outcome == IN_PROGRESS:
+            return (
+                jsonify(
+                    {"error": "A request with this Idempotency-Key is in progress"}
+                ),
+                409,
+            )
+
+        try:
+            response = make_response(f(*args, **kwargs))
+        except BaseException:
+            db.session.rollback()
+            idempotency_store.abandon(key)
+            raise
+
+        # Routes commit what they keep, so end the request's transaction
+        # before its locks block the write that records the outcome
+        db.session.rollback()
+        try:
+            if response.status_code >= 500:
+                idempotency_store.abandon(key)
+            else:
+                headers = {
+                    name: response.headers[name]
+                    for name in REPLAYED_HEADERS
+                    if name in response.headers
+                }
+                idempotency_store.finish(
+                    key, (response.status_code, headers, response.get_data())
+                )
+        except Exception as e:
+            return _store_error(f, e)
+        return response
+
+    return decorated_function
+
+
+def _store_error(f, error):
+    """Log a failure of the idempotency store and answer with a JSON 500"""
+    print(f"Unexpected error in {f.__name__}: {error}")
+    return jsonify({"error": "Internal server error"}), 500
@@ -22,6 +22,10 @@ export const MatchCard: React.FC<MatchCardProps> = ({
   onClick,
   isLast,
 }) => {
+  // A waiting match has no winner and empty slots, so null must not match
+  const prompt1Won = match.winner !== null && match.winner === match.prompt_1;
+  const prompt2Won = match.winner !== null && match.winner === match.prompt_2;
+
   const getStatusIcon = () => {
     switch (match.status) {
       case "completed":
@@ -80,30 +84,25 @@ export const MatchCard: React.FC<MatchCardProps> = ({
         <Box
           sx={{
             p: 1.5,
-            backgroundColor:
-              match.winner === match.prompt_1 ? "success.main" : "grey.100",
+            backgroundColor: prompt1Won ? "success.main" : "grey.100",
             borderRadius: 1,
             mb: 1,
-            border: match.winner === match.prompt_1 ? "2px solid" : "1px solid",
-            borderColor:
-              match.winner === match.prompt_1 ? "success.dark" : "grey.300",
+            border: prompt1Won ? "2px solid" : "1px solid",
+            borderColor: prompt1Won ? "success.dark" : "grey.300",
             position: "relative",
           }}
         >
           <Typography
             variant="body2"
             sx={{
-              fontWeight: match.winner === match.prompt_1 ? "bold" : "normal",
-              color:
-                match.winner === match.prompt_1
-                  ? "success.contrastText"
-                  : "text.primary",
+              fontWeight: prompt1Won ? "bold" : "normal",
+              color: prompt1Won ? "success.contrastText" : "text.primary",
               fontSize: "0.875rem",
             }}
           >
-            {match.prompt_1}
+            {match.prompt_1 ?? "To be decided"}
           </Typography>
-          {match.winner === match.prompt_1 && (
+          {prompt1Won && (
             <Box
               sx={{
                 position: "absolute",
@@ -132,29 +131,24 @@ export const MatchCard: React.FC<MatchCardProps> = ({
         <Box
           sx={{
             p: 1.5,
-            backgroundColor:
-              match.winner === match.prompt_2 ? "success.main" : "grey.100",
+            backgroundColor: prompt2Won ? "success.main" : "grey.100",
             borderRadius: 1,
-            border: match.winner === match.prompt_2 ? "2px solid" : "1px solid",
-            borderColor:
-              match.winner === match.prompt_2 ? "success.dark" : "grey.300",
+            border: prompt2Won ? "2px solid" : "1px solid",
+            borderColor: prompt2Won ? "success.dark" : "grey.300",
             position: "relative",
           }}
         >
           <Typography
             variant="body2"
             sx={{
-              fontWeight: match.winner === match.prompt_2 ? "bold" : "normal",
-              color:
-                match.winner === match.prompt_2
-                  ? "success.contrastText"
-                  : "text.primary",
+              fontWeight: prompt2Won ? "bold" : "normal",
+              color: prompt2Won ? "success.contrastText" : "text.primary",
               fontSize: "0.875rem",
             }}
           >
-            {match.prompt_2}
+            {match.prompt_2 ?? "To be decided"}
           </Typography>
-          {match.winner === match.prompt_2 && (
+          {prompt2Won && (
             <Box
               sx={{
                 position: "absolute",
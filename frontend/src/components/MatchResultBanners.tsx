@@ -71,7 +71,7 @@ export const MatchResultBanners: React.FC<MatchResultBannersProps> = ({
             <Typography variant="body1">
               🎉 Round completed!
               {matchResult.next_round &&
-                ` Round ${matchResult.next_round} has been created.`}
+                ` Round ${matchResult.next_round} is up next.`}
             </Typography>
             {matchResult.next_round_matches &&
               matchResult.next_round_matches.length > 0 && (
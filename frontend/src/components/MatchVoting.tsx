@@ -99,6 +99,27 @@ export const MatchVoting: React.FC<MatchVotingProps> = ({
     setTestingPrompt(null);
   };
 
+  const { prompt_1, prompt_2, prompt_1_id, prompt_2_id } = match;
+  if (
+    prompt_1 === null ||
+    prompt_2 === null ||
+    prompt_1_id === null ||
+    prompt_2_id === null
+  ) {
+    return (
+      <Box>
+        <Alert severity="info" sx={{ mb: 2 }}>
+          This match is still waiting for its participants.
+        </Alert>
+        {onBack && (
+          <Button variant="outlined" startIcon={<BackIcon />} onClick={onBack}>
+            Back
+          </Button>
+        )}
+      </Box>
+    );
+  }
+
   return (
     <Box>
       {/* Header */}
@@ -142,8 +163,8 @@ export const MatchVoting: React.FC<MatchVotingProps> = ({
         {/* Option 1 */}
         <VotingOption
           label="Option A"
-          prompt={match.prompt_1}
-          promptId={match.prompt_1_id}
+          prompt={prompt_1}
+          promptId={prompt_1_id}
           loading={loading}
           onVote={handleVote}
           onTest={handleTestPrompt}
@@ -168,8 +189,8 @@ export const MatchVoting: React.FC<MatchVotingProps> = ({
         {/* Option 2 */}
         <VotingOption
           label="Option B"
-          prompt={match.prompt_2}
-          promptId={match.prompt_2_id}
+          prompt={prompt_2}
+          promptId={prompt_2_id}
           loading={loading}
           onVote={handleVote}
           onTest={handleTestPrompt}
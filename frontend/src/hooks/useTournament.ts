@@ -1,6 +1,11 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 import { apiService } from "../services/api";
-import type { Tournament } from "../types";
+import type { Tournament, TournamentEvent } from "../types";
+import {
+  applyTournamentChanges,
+  applyTournamentEvent,
+  TOURNAMENT_EVENT_TYPES,
+} from "../utils/tournamentEvents";
 
 interface UseTournamentResult {
   tournament: Tournament | null;
@@ -19,6 +24,12 @@ export const useTournament = (initialTournamentId?: number): UseTournamentResult
   const [error, setError] = useState<string | null>(null);
   const [pollingEnabled, setPollingEnabled] = useState(false);
 
+  // Latest known version, read by the event stream without resubscribing
+  const versionRef = useRef<number | undefined>(undefined);
+  useEffect(() => {
+    versionRef.current = tournament?.version;
+  }, [tournament]);
+
   const loadTournament = useCallback(async (tournamentId: number) => {
     setLoading(true);
     setError(null);
@@ -27,7 +38,7 @@ export const useTournament = (initialTournamentId?: number): UseTournamentResult
       const tournamentData = await apiService.getTournamentStatus(tournamentId);
       setTournament(tournamentData);
 
-      // Enable polling for active tournaments
+      // Enable live updates for active tournaments
       if (tournamentData.status === "in_progress") {
         setPollingEnabled(true);
       }
@@ -45,6 +56,29 @@ export const useTournament = (initialTournamentId?: number): UseTournamentResult
     await loadTournament(tournament.tournament_id);
   }, [tournament, loadTournament]);
 
+  // Catch up in the background without toggling the loading state,
+  // downloading only the changes when we know which version we have
+  const syncTournament = useCallback(async (tournamentId: number) => {
+    try {
+      const since = versionRef.current;
+      if (since !== undefined) {
+        const changes = await apiService.getTournamentChanges(
+          tournamentId,
+          since
+        );
+        if (!changes.full_resync) {
+          setTournament((current) =>
+            current ? applyTournamentChanges(current, changes) : current
+          );
+          return;
+        }
+      }
+      setTournament(await apiService.getTournamentStatus(tournamentId));
+    } catch {
+      // Keep the current snapshot; the next event or refresh will retry
+    }
+  }, []);
+
   // Load tournament if initial ID is provided
   useEffect(() => {
     if (initialTournamentId) {
@@ -52,20 +86,64 @@ export const useTournament = (initialTournamentId?: number): UseTournamentResult
     }
   }, [initialTournamentId, loadTournament]);
 
-  // Polling effect for tournament updates
+  const activeTournamentId =
+    pollingEnabled && tournament?.status === "in_progress"
+      ? tournament.tournament_id
+      : undefined;
+
+  // Live updates for active tournaments
   useEffect(() => {
-    if (
-      pollingEnabled &&
-      tournament &&
-      tournament.status === "in_progress"
-    ) {
+    if (activeTournamentId === undefined) return;
+
+    // Fall back to polling where Server-Sent Events are unavailable
+    if (typeof EventSource === "undefined") {
       const interval = setInterval(() => {
-        refreshTournament();
+        syncTournament(activeTournamentId);
       }, 5000); // Poll every 5 seconds
 
       return () => clearInterval(interval);
     }
-  }, [pollingEnabled, tournament, refreshTournament]);
+
+    const source = new EventSource(
+      apiService.getTournamentEventsUrl(activeTournamentId)
+    );
+
+    TOURNAMENT_EVENT_TYPES.forEach((type) => {
+      source.addEventListener(type, (message) => {
+        const event = {
+          type,
+          data: JSON.parse((message as MessageEvent).data),
+        } as TournamentEvent;
+
+        // A skipped version (a dropped event, or a write on another
+        // worker) means this event can't be applied on top of our copy
+        const known = versionRef.current;
+        if (known !== undefined && event.data.version > known + 1) {
+          syncTournament(activeTournamentId);
+          return;
+        }
+        if (known !== undefined && event.data.version > known) {
+          // Track back-to-back events before the next render catches up
+          versionRef.current = event.data.version;
+        }
+        setTournament((current) =>
+          current ? applyTournamentEvent(current, event) : current
+        );
+      });
+    });
+
+    // Catch up on anything missed before (re)connecting or made elsewhere
+    const resyncIfStale = (message: Event) => {
+      const { version } = JSON.parse((message as MessageEvent).data);
+      if (version !== versionRef.current) {
+        syncTournament(activeTournamentId);
+      }
+    };
+    source.addEventListener("connected", resyncIfStale);
+    source.addEventListener("tournament_updated", resyncIfStale);
+
+    return () => source.close();
+  }, [activeTournamentId, syncTournament]);
 
   return {
     tournament,
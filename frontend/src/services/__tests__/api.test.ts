@@ -97,6 +97,26 @@ describe("ApiService", () => {
       expect(result).toEqual(mockApiResponses.tournamentStatus);
     });
 
+    it("should revalidate with the ETag and reuse data on 304", async () => {
+      mockFetch(mockApiResponses.tournamentStatus, 200, {
+        ETag: '"status-1-2"',
+      });
+      await apiService.getTournamentStatus(1);
+
+      mockFetch(null, 304);
+      const result = await apiService.getTournamentStatus(1);
+
+      expect(fetch).toHaveBeenLastCalledWith(
+        "http://localhost:5001/api/tournament/1/status",
+        expect.objectContaining({
+          headers: expect.objectContaining({
+            "If-None-Match": '"status-1-2"',
+          }),
+        })
+      );
+      expect(result).toEqual(mockApiResponses.tournamentStatus);
+    });
+
     it("should handle tournament not found", async () => {
       mockFetchError("Tournament not found", 404);
 
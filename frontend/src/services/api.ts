@@ -6,12 +6,19 @@ import type {
   CreateTournamentResponse,
   StartTournamentBracketResponse,
   SubmitMatchResultResponse,
+  CastVoteResponse,
+  GetVoteTallyResponse,
+  VoteReceipt,
+  CreationJob,
   GetTournamentMatchesResponse,
+  GetTournamentChangesResponse,
   Prompt,
 } from "../types";
 
 class ApiService {
   private baseUrl: string;
+  // Last GET response per URL, revalidated with If-None-Match
+  private etagCache = new Map<string, { etag: string; data: unknown }>();
 
   constructor(baseUrl?: string) {
     this.baseUrl =
@@ -24,17 +31,25 @@ class ApiService {
     options: RequestInit = {}
   ): Promise<T> {
     const url = `${this.baseUrl}${endpoint}`;
+    const isGet = !options.method || options.method.toUpperCase() === "GET";
+    const cached = isGet ? this.etagCache.get(url) : undefined;
     const config: RequestInit = {
+      ...options,
       headers: {
         "Content-Type": "application/json",
+        ...(cached ? { "If-None-Match": cached.etag } : {}),
         ...options.headers,
       },
-      ...options,
     };
 
     try {
       const response = await fetch(url, config);
 
+      // Nothing changed since our last copy
+      if (response.status === 304 && cached) {
+        return cached.data as T;
+      }
+
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
         throw new Error(
@@ -42,7 +57,14 @@ class ApiService {
         );
       }
 
-      return await response.json();
+      const data = await response.json();
+
+      const etag = response.headers?.get("ETag");
+      if (isGet && etag) {
+        this.etagCache.set(url, { etag, data });
+      }
+
+      return data;
     } catch (error) {
       if (error instanceof Error) {
         throw error;
@@ -61,11 +83,40 @@ class ApiService {
     });
   }
 
+  // Queue a tournament creation for a background job and get the job back
+  async createTournamentAsync(
+    data: CreateTournamentRequest
+  ): Promise<CreationJob> {
+    return this.request("/tournament", {
+      method: "POST",
+      headers: { Prefer: "respond-async" },
+      body: JSON.stringify(data),
+    });
+  }
+
+  // Check the state of a background tournament creation
+  async getCreationJob(jobId: string): Promise<CreationJob> {
+    return this.request(`/jobs/${jobId}`);
+  }
+
   // Get tournament status
   async getTournamentStatus(tournamentId: number): Promise<Tournament> {
     return this.request<Tournament>(`/tournament/${tournamentId}/status`);
   }
 
+  // Get only what changed in a tournament since a known version
+  async getTournamentChanges(
+    tournamentId: number,
+    since: number
+  ): Promise<GetTournamentChangesResponse> {
+    return this.request(`/tournament/${tournamentId}/changes?since=${since}`);
+  }
+
+  // URL of the Server-Sent Events stream for live tournament updates
+  getTournamentEventsUrl(tournamentId: number): string {
+    return `${this.baseUrl}/tournament/${tournamentId}/events`;
+  }
+
   // Start tournament bracket
   async startTournamentBracket(
     tournamentId: number
@@ -86,6 +137,39 @@ class ApiService {
     });
   }
 
+  // Queue a match result for a background worker and get a receipt back
+  async submitMatchResultAsync(
+    matchId: number,
+    winnerId: number
+  ): Promise<VoteReceipt> {
+    return this.request(`/match/${matchId}/result`, {
+      method: "POST",
+      headers: { Prefer: "respond-async" },
+      body: JSON.stringify({ winner_id: winnerId }),
+    });
+  }
+
+  // Check the outcome of a queued match result
+  async getVoteReceipt(receiptId: string): Promise<VoteReceipt> {
+    return this.request(`/vote-receipts/${receiptId}`);
+  }
+
+  // Cast one crowd vote (crowd voting tournaments)
+  async castVote(
+    matchId: number,
+    promptId: number
+  ): Promise<CastVoteResponse> {
+    return this.request(`/match/${matchId}/vote`, {
+      method: "POST",
+      body: JSON.stringify({ prompt_id: promptId }),
+    });
+  }
+
+  // Get the crowd vote tally for a match
+  async getVoteTally(matchId: number): Promise<GetVoteTallyResponse> {
+    return this.request(`/match/${matchId}/votes`);
+  }
+
   // Get tournament matches
   async getTournamentMatches(
     tournamentId: number,
@@ -98,9 +182,26 @@ class ApiService {
     return this.request(endpoint);
   }
 
-  // Get all prompts (utility)
-  async getAllPrompts(): Promise<Prompt[]> {
-    return this.request("/prompts");
+  // Get one page of prompts, optionally filtered (utility)
+  async getAllPrompts(
+    params: {
+      afterId?: number;
+      limit?: number;
+      tournamentId?: number;
+      inputQuestionId?: number;
+    } = {}
+  ): Promise<Prompt[]> {
+    const query = new URLSearchParams();
+    if (params.afterId !== undefined)
+      query.set("after_id", String(params.afterId));
+    if (params.limit !== undefined) query.set("limit", String(params.limit));
+    if (params.tournamentId !== undefined)
+      query.set("tournament_id", String(params.tournamentId));
+    if (params.inputQuestionId !== undefined)
+      query.set("input_question_id", String(params.inputQuestionId));
+
+    const queryString = query.toString();
+    return this.request(queryString ? `/prompts?${queryString}` : "/prompts");
   }
 
   // Check if OpenAI is available
@@ -114,6 +215,7 @@ class ApiService {
     model?: string;
     max_tokens?: number;
     temperature?: number;
+    bypass_cache?: boolean;
   }): Promise<{
     prompt: string;
     response: string;
@@ -125,6 +227,7 @@ class ApiService {
       completion_tokens: number;
       total_tokens: number;
     };
+    cached: boolean;
   }> {
     return this.request("/test-prompt", {
       method: "POST",
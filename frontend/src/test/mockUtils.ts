@@ -1,10 +1,15 @@
 // Mock utilities for API testing
 
 // Helper to mock fetch responses
-export const mockFetch = (response: unknown, status = 200) => {
+export const mockFetch = (
+  response: unknown,
+  status = 200,
+  headers: Record<string, string> = {}
+) => {
   global.fetch.mockResolvedValueOnce({
     ok: status >= 200 && status < 300,
     status,
+    headers: new Headers(headers),
     json: async () => response,
   });
 };
@@ -4,6 +4,9 @@ export interface CreateTournamentRequest {
   input_question: string;
   custom_prompts: string[];
   total_prompts?: number;
+  voting_mode?: "single" | "crowd";
+  vote_quorum?: number;
+  vote_margin?: number;
 }
 
 export interface CreateTournamentResponse {
@@ -23,6 +26,7 @@ export interface SubmitMatchResultResponse {
   message: string;
   match_id: number;
   winner: string;
+  next_match_id?: number | null;
   round_completed: boolean;
   next_round?: number;
   next_round_matches?: Array<{ prompt_1: string; prompt_2: string }>;
@@ -31,6 +35,45 @@ export interface SubmitMatchResultResponse {
   tournament_winner?: string;
 }
 
+export interface VoteReceipt {
+  receipt_id: string;
+  status: "queued" | "processing" | "applied" | "rejected";
+  tournament_id: number;
+  match_id: number;
+  winner_id: number;
+  error: string | null;
+  result: {
+    results_stored: number;
+    rounds_completed: number[];
+    next_round: number | null;
+    tournament_completed: boolean;
+  } | null;
+}
+
+export interface CreationJob {
+  job_id: string;
+  status: "queued" | "running" | "completed" | "failed";
+  tournament_id: number | null;
+  error: string | null;
+  result: CreateTournamentResponse | null;
+}
+
+export interface CastVoteResponse {
+  match_id: number;
+  prompt_id: number;
+  closed_matches: number[];
+}
+
+export interface GetVoteTallyResponse {
+  match_id: number;
+  status: string;
+  prompt_1_id: number;
+  prompt_2_id: number;
+  prompt_1_votes: number;
+  prompt_2_votes: number;
+  buffered_votes: number;
+}
+
 export interface GetTournamentMatchesResponse {
   tournament_id: number;
   matches: import("./tournament").Match[];
@@ -41,3 +84,23 @@ export interface Prompt {
   id: number;
   text: string;
 }
+
+export interface GetTournamentChangesResponse {
+  tournament_id: number;
+  since: number;
+  version: number;
+  status: string;
+  full_resync: boolean;
+  matches: Array<{
+    match_id: number;
+    round_number: number;
+    status: string;
+    winner_id: number;
+    winner: string;
+    next_match_id?: number | null;
+    next_slot?: number | null;
+  }>;
+  rounds: Record<string, import("./tournament").Match[]>;
+  byes: Record<string, string[]>;
+  winner: string | null;
+}
@@ -4,6 +4,7 @@ export interface Tournament {
   tournament_id: number;
   input_question: string;
   status: string;
+  version?: number;
   current_round: number;
   total_prompts: number;
   prompts: string[];
@@ -15,15 +16,59 @@ export interface Tournament {
   rounds: Record<string, Match[]>;
   byes: Record<string, string[]>;
   winner: string | null;
+  voting?: {
+    mode: "single" | "crowd";
+    quorum: number | null;
+    margin: number | null;
+  };
 }
 
 export interface Match {
   match_id: number;
-  prompt_1: string;
-  prompt_2: string;
-  prompt_1_id: number;
-  prompt_2_id: number;
+  // Null while the match is "waiting" for the winner of an earlier match
+  prompt_1: string | null;
+  prompt_2: string | null;
+  prompt_1_id: number | null;
+  prompt_2_id: number | null;
   status: string;
   winner: string | null;
   round_number?: number;
+  next_match_id?: number | null;
+}
+
+// Live update events streamed from /tournament/<id>/events
+
+export interface MatchCompletedEvent {
+  version: number;
+  match_id: number;
+  round_number: number;
+  winner_id: number;
+  winner: string;
+  next_match_id?: number | null;
+  next_slot?: number | null;
+}
+
+export interface BracketCreatedEvent {
+  version: number;
+  rounds: Record<string, Match[]>;
+  byes: Record<string, string[]>;
+}
+
+export interface RoundCreatedEvent {
+  version: number;
+  round_number: number;
+  matches: Match[];
+  byes: string[];
 }
+
+export interface TournamentCompletedEvent {
+  version: number;
+  winner_id: number;
+  winner: string;
+}
+
+export type TournamentEvent =
+  | { type: "bracket_created"; data: BracketCreatedEvent }
+  | { type: "match_completed"; data: MatchCompletedEvent }
+  | { type: "round_created"; data: RoundCreatedEvent }
+  | { type: "tournament_completed"; data: TournamentCompletedEvent };
@@ -0,0 +1,227 @@
+import { describe, it, expect } from "vitest";
+import {
+  applyTournamentChanges,
+  applyTournamentEvent,
+  hasVersionGap,
+} from "../tournamentEvents";
+import type { Tournament } from "../../types";
+
+const baseTournament: Tournament = {
+  tournament_id: 1,
+  input_question: "What is the best pet?",
+  status: "in_progress",
+  version: 2,
+  current_round: 1,
+  total_prompts: 3,
+  prompts: ["Cats?", "Dogs?", "Fish?"],
+  progress: {
+    total_matches: 1,
+    completed_matches: 0,
+    completion_percentage: 0,
+  },
+  rounds: {
+    "1": [
+      {
+        match_id: 10,
+        prompt_1: "Cats?",
+        prompt_2: "Dogs?",
+        prompt_1_id: 1,
+        prompt_2_id: 2,
+        status: "pending",
+        winner: null,
+      },
+    ],
+  },
+  byes: { "1": ["Fish?"] },
+  winner: null,
+};
+
+describe("applyTournamentEvent", () => {
+  it("should mark a match completed and update progress", () => {
+    const result = applyTournamentEvent(baseTournament, {
+      type: "match_completed",
+      data: {
+        version: 3,
+        match_id: 10,
+        round_number: 1,
+        winner_id: 1,
+        winner: "Cats?",
+      },
+    });
+
+    expect(result.version).toBe(3);
+    expect(result.rounds["1"][0].status).toBe("completed");
+    expect(result.rounds["1"][0].winner).toBe("Cats?");
+    expect(result.progress.completed_matches).toBe(1);
+    expect(result.progress.completion_percentage).toBe(100);
+  });
+
+  it("should move the winner into the match it feeds", () => {
+    const tournament: Tournament = {
+      ...baseTournament,
+      rounds: {
+        ...baseTournament.rounds,
+        "2": [
+          {
+            match_id: 11,
+            prompt_1: "Fish?",
+            prompt_2: null,
+            prompt_1_id: 3,
+            prompt_2_id: null,
+            status: "waiting",
+            winner: null,
+          },
+        ],
+      },
+    };
+
+    const result = applyTournamentEvent(tournament, {
+      type: "match_completed",
+      data: {
+        version: 3,
+        match_id: 10,
+        round_number: 1,
+        winner_id: 2,
+        winner: "Dogs?",
+        next_match_id: 11,
+        next_slot: 2,
+      },
+    });
+
+    expect(result.rounds["2"][0].prompt_2).toBe("Dogs?");
+    expect(result.rounds["2"][0].prompt_2_id).toBe(2);
+    expect(result.rounds["2"][0].status).toBe("pending");
+    expect(result.current_round).toBe(2);
+  });
+
+  it("should replace the rounds with a newly laid out bracket", () => {
+    const result = applyTournamentEvent(
+      { ...baseTournament, rounds: {}, byes: {} },
+      {
+        type: "bracket_created",
+        data: {
+          version: 3,
+          rounds: {
+            ...baseTournament.rounds,
+            "2": [
+              {
+                match_id: 11,
+                prompt_1: "Fish?",
+                prompt_2: null,
+                prompt_1_id: 3,
+                prompt_2_id: null,
+                status: "waiting",
+                winner: null,
+              },
+            ],
+          },
+          byes: { "1": ["Fish?"] },
+        },
+      }
+    );
+
+    expect(result.current_round).toBe(1);
+    expect(Object.keys(result.rounds)).toEqual(["1", "2"]);
+    expect(result.byes["1"]).toEqual(["Fish?"]);
+    expect(result.progress.total_matches).toBe(2);
+  });
+
+  it("should add a newly created round", () => {
+    const result = applyTournamentEvent(baseTournament, {
+      type: "round_created",
+      data: {
+        version: 3,
+        round_number: 2,
+        matches: [
+          {
+            match_id: 11,
+            prompt_1: "Fish?",
+            prompt_2: "Cats?",
+            prompt_1_id: 3,
+            prompt_2_id: 1,
+            status: "pending",
+            winner: null,
+          },
+        ],
+        byes: [],
+      },
+    });
+
+    expect(result.current_round).toBe(2);
+    expect(result.rounds["2"]).toHaveLength(1);
+    expect(result.byes["2"]).toEqual([]);
+    expect(result.progress.total_matches).toBe(2);
+  });
+
+  it("should record the tournament winner", () => {
+    const result = applyTournamentEvent(baseTournament, {
+      type: "tournament_completed",
+      data: { version: 3, winner_id: 3, winner: "Fish?" },
+    });
+
+    expect(result.status).toBe("completed");
+    expect(result.winner).toBe("Fish?");
+  });
+
+  it("should not apply an event past a version gap", () => {
+    const event = {
+      type: "tournament_completed" as const,
+      data: { version: 4, winner_id: 3, winner: "Fish?" },
+    };
+
+    expect(hasVersionGap(baseTournament, event)).toBe(true);
+    expect(applyTournamentEvent(baseTournament, event)).toBe(baseTournament);
+  });
+
+  it("should ignore events already reflected in the snapshot", () => {
+    const result = applyTournamentEvent(baseTournament, {
+      type: "tournament_completed",
+      data: { version: 2, winner_id: 3, winner: "Fish?" },
+    });
+
+    expect(result).toBe(baseTournament);
+  });
+});
+
+describe("applyTournamentChanges", () => {
+  it("should merge completed matches and new rounds", () => {
+    const result = applyTournamentChanges(baseTournament, {
+      tournament_id: 1,
+      since: 2,
+      version: 4,
+      status: "in_progress",
+      full_resync: false,
+      matches: [
+        {
+          match_id: 10,
+          round_number: 1,
+          status: "completed",
+          winner_id: 2,
+          winner: "Dogs?",
+        },
+      ],
+      rounds: {
+        "2": [
+          {
+            match_id: 11,
+            prompt_1: "Dogs?",
+            prompt_2: "Fish?",
+            prompt_1_id: 2,
+            prompt_2_id: 3,
+            status: "pending",
+            winner: null,
+          },
+        ],
+      },
+      byes: { "2": [] },
+      winner: null,
+    });
+
+    expect(result.version).toBe(4);
+    expect(result.rounds["1"][0].winner).toBe("Dogs?");
+    expect(result.rounds["2"]).toHaveLength(1);
+    expect(result.current_round).toBe(2);
+    expect(result.progress.total_matches).toBe(2);
+    expect(result.progress.completed_matches).toBe(1);
+  });
+});
@@ -0,0 +1,220 @@
+// Apply live tournament events to a locally held tournament snapshot
+
+import type {
+  GetTournamentChangesResponse,
+  Tournament,
+  TournamentEvent,
+} from "../types";
+
+/**
+ * Event types pushed by the tournament events stream
+ */
+export const TOURNAMENT_EVENT_TYPES: TournamentEvent["type"][] = [
+  "bracket_created",
+  "match_completed",
+  "round_created",
+  "tournament_completed",
+];
+
+const withProgress = (
+  tournament: Tournament,
+  totalMatches: number,
+  completedMatches: number
+): Tournament["progress"] => ({
+  ...tournament.progress,
+  total_matches: totalMatches,
+  completed_matches: completedMatches,
+  completion_percentage:
+    totalMatches > 0
+      ? Math.round((completedMatches / totalMatches) * 1000) / 10
+      : 0,
+});
+
+/**
+ * Return rounds with a winner moved into the bracket slot it feeds.
+ * The fed match stops "waiting" once both of its prompts are known.
+ */
+const fillNextSlot = (
+  rounds: Tournament["rounds"],
+  nextMatchId: number | null | undefined,
+  nextSlot: number | null | undefined,
+  winnerId: number,
+  winner: string
+): Tournament["rounds"] => {
+  if (!nextMatchId || !nextSlot) return rounds;
+
+  const filled: Tournament["rounds"] = {};
+  Object.entries(rounds).forEach(([roundKey, matches]) => {
+    filled[roundKey] = matches.map((m) => {
+      if (m.match_id !== nextMatchId) return m;
+      const next =
+        nextSlot === 1
+          ? { ...m, prompt_1: winner, prompt_1_id: winnerId }
+          : { ...m, prompt_2: winner, prompt_2_id: winnerId };
+      const ready = next.prompt_1_id !== null && next.prompt_2_id !== null;
+      return next.status === "waiting" && ready
+        ? { ...next, status: "pending" }
+        : next;
+    });
+  });
+  return filled;
+};
+
+/**
+ * Whether an event skips versions the snapshot has not seen, so applying
+ * it would lose the changes in between. Callers should resync instead.
+ */
+export const hasVersionGap = (
+  tournament: Tournament,
+  event: TournamentEvent
+): boolean =>
+  tournament.version !== undefined &&
+  event.data.version > tournament.version + 1;
+
+/**
+ * Return a new tournament snapshot with the event applied.
+ * Events at or below the snapshot's version are already reflected, and
+ * events past a version gap cannot be applied safely; both leave it
+ * unchanged.
+ */
+export const applyTournamentEvent = (
+  tournament: Tournament,
+  event: TournamentEvent
+): Tournament => {
+  if (
+    tournament.version !== undefined &&
+    (event.data.version <= tournament.version ||
+      hasVersionGap(tournament, event))
+  ) {
+    return tournament;
+  }
+
+  switch (event.type) {
+    case "bracket_created": {
+      const allMatches = Object.values(event.data.rounds).flat();
+      return {
+        ...tournament,
+        version: event.data.version,
+        status: "in_progress",
+        current_round: 1,
+        rounds: event.data.rounds,
+        byes: { ...tournament.byes, ...event.data.byes },
+        progress: withProgress(tournament, allMatches.length, 0),
+      };
+    }
+
+    case "match_completed": {
+      const roundKey = String(event.data.round_number);
+      const { match_id, winner_id, winner, next_match_id, next_slot } =
+        event.data;
+      const matches = tournament.rounds[roundKey] ?? [];
+      const target = matches.find((m) => m.match_id === match_id);
+      if (!target || target.status === "completed") {
+        return { ...tournament, version: event.data.version };
+      }
+
+      const roundMatches = matches.map((m) =>
+        m.match_id === match_id ? { ...m, status: "completed", winner } : m
+      );
+      const rounds = fillNextSlot(
+        { ...tournament.rounds, [roundKey]: roundMatches },
+        next_match_id,
+        next_slot,
+        winner_id,
+        winner
+      );
+      // Brackets laid out up front already hold the next round
+      const nextRound = event.data.round_number + 1;
+      const roundDone = roundMatches.every((m) => m.status === "completed");
+
+      return {
+        ...tournament,
+        version: event.data.version,
+        current_round:
+          roundDone && rounds[String(nextRound)]
+            ? Math.max(tournament.current_round, nextRound)
+            : tournament.current_round,
+        rounds,
+        progress: withProgress(
+          tournament,
+          tournament.progress.total_matches,
+          tournament.progress.completed_matches + 1
+        ),
+      };
+    }
+
+    case "round_created": {
+      const roundKey = String(event.data.round_number);
+      return {
+        ...tournament,
+        version: event.data.version,
+        current_round: event.data.round_number,
+        rounds: { ...tournament.rounds, [roundKey]: event.data.matches },
+        byes: { ...tournament.byes, [roundKey]: event.data.byes },
+        progress: withProgress(
+          tournament,
+          tournament.progress.total_matches + event.data.matches.length,
+          tournament.progress.completed_matches
+        ),
+      };
+    }
+
+    case "tournament_completed":
+      return {
+        ...tournament,
+        version: event.data.version,
+        status: "completed",
+        winner: event.data.winner,
+      };
+  }
+};
+
+/**
+ * Return a new tournament snapshot with a /changes response merged in.
+ * Callers should reload the full status when changes.full_resync is set.
+ */
+export const applyTournamentChanges = (
+  tournament: Tournament,
+  changes: GetTournamentChangesResponse
+): Tournament => {
+  if (
+    tournament.version !== undefined &&
+    changes.version <= tournament.version
+  ) {
+    return tournament;
+  }
+
+  let rounds = { ...tournament.rounds, ...changes.rounds };
+  changes.matches.forEach(({ match_id, round_number, status, winner }) => {
+    const roundKey = String(round_number);
+    rounds[roundKey] = (rounds[roundKey] ?? []).map((m) =>
+      m.match_id === match_id ? { ...m, status, winner } : m
+    );
+  });
+  changes.matches.forEach(({ winner_id, winner, next_match_id, next_slot }) => {
+    rounds = fillNextSlot(rounds, next_match_id, next_slot, winner_id, winner);
+  });
+
+  const allMatches = Object.values(rounds).flat();
+  const openRounds = Object.keys(rounds)
+    .map(Number)
+    .filter((round) => rounds[round].some((m) => m.status !== "completed"));
+  const roundNumbers = Object.keys(rounds).map(Number);
+
+  return {
+    ...tournament,
+    version: changes.version,
+    status: changes.status,
+    winner: changes.winner ?? tournament.winner,
+    current_round: openRounds.length
+      ? Math.min(...openRounds)
+      : Math.max(tournament.current_round, ...roundNumbers),
+    rounds,
+    byes: { ...tournament.byes, ...changes.byes },
+    progress: withProgress(
+      tournament,
+      allMatches.length,
+      allMatches.filter((m) => m.status === "completed").length
+    ),
+  };
+};